@@ -81,6 +81,8 @@ def run_migrations_online():
         )
 
         with context.begin_transaction():
+            # migrations may rewrite large tables, they are not bound by the statement timeout of the api
+            connection.execute('SET LOCAL statement_timeout = 0')
             context.run_migrations()
 
 
@@ -12,6 +12,7 @@ from flask_cors import CORS
 from analytics_api.auth import jwt
 from analytics_api.config import get_named_config
 from analytics_api.models import db, ma, migrate
+from analytics_api.utils.db_pool import get_engine_options, init_engines
 
 
 hsts = secure.StrictTransportSecurity().include_subdomains().preload().max_age(31536000)
@@ -47,7 +48,9 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
         setup_jwt_manager(app, jwt)
 
     # Database connection initialize
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(app.config))
     db.init_app(app)
+    init_engines(app, db)
 
     # Database migrate initialize
     migrate.init_app(app, db)
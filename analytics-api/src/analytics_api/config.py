@@ -61,9 +61,26 @@ class _Config():  # pylint: disable=too-few-public-methods
     DB_HOST = os.getenv('DATABASE_HOST', '')
     DB_PORT = os.getenv('DATABASE_PORT', '5432')
     SQLALCHEMY_DATABASE_URI = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{int(DB_PORT)}/{DB_NAME}'
+    # Replica of the database read by the read only endpoints, they read from the primary when it is not set
+    DB_REPLICA_HOST = os.getenv('DATABASE_REPLICA_HOST', '')
+    DB_REPLICA_PORT = os.getenv('DATABASE_REPLICA_PORT', DB_PORT)
+    SQLALCHEMY_BINDS = {
+        'replica': f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_REPLICA_HOST}:{int(DB_REPLICA_PORT)}/{DB_NAME}'
+    } if DB_REPLICA_HOST else {}
     SQLALCHEMY_ECHO = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool of each process, the connections beyond the size are opened on demand up to the overflow
+    DB_POOL_SIZE = os.getenv('DB_POOL_SIZE', '5')
+    DB_MAX_OVERFLOW = os.getenv('DB_MAX_OVERFLOW', '10')
+    # Seconds a request waits for a connection of the pool, and after which a connection is replaced
+    DB_POOL_TIMEOUT = os.getenv('DB_POOL_TIMEOUT', '30')
+    DB_POOL_RECYCLE = os.getenv('DB_POOL_RECYCLE', '1800')
+    # Milliseconds after which the database cancels a statement, 0 for no limit
+    DB_STATEMENT_TIMEOUT = os.getenv('DB_STATEMENT_TIMEOUT', '60000')
+    # Set when connecting through PgBouncer in transaction mode, which does not keep session settings
+    DB_PGBOUNCER = os.getenv('DB_PGBOUNCER', 'false')
+
     # JWT_OIDC Settings
     JWT_OIDC_WELL_KNOWN_CONFIG = os.getenv('JWT_OIDC_WELL_KNOWN_CONFIG')
     JWT_OIDC_ALGORITHMS = os.getenv('JWT_OIDC_ALGORITHMS', 'RS256')
@@ -4,11 +4,45 @@ from contextlib import contextmanager
 from flask import current_app
 from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
-from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy import SignallingSession, SQLAlchemy, get_state
+from sqlalchemy import orm
+
+from analytics_api.utils import read_replica
+
+
+class RoutingSession(SignallingSession):  # pylint: disable=too-few-public-methods
+    """Session which reads from the replica in the read only endpoints.
+
+    Flushes, bulk updates, deletes and locking reads go to the primary, and so does everything the session runs after
+    it has written.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create the session."""
+        super().__init__(*args, **kwargs)
+        self._has_written = False
+
+    def get_bind(self, mapper=None, clause=None):
+        """Return the replica engine for the reads of the read only endpoints, or the bind of the model."""
+        if self._flushing or getattr(clause, 'is_dml', False) \
+                or getattr(clause, '_for_update_arg', None) is not None:
+            self._has_written = True
+        elif not self._has_written and read_replica.use_replica():
+            return get_state(self.app).db.get_engine(self.app, bind=read_replica.REPLICA_BIND)
+        return super().get_bind(mapper, clause)
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    """SQLAlchemy which creates routing sessions."""
+
+    def create_session(self, options):
+        """Create the session factory."""
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
 
 # DB initialize in __init__ file
 # db variable use for create models from here
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()
 
 # Migrate initialize in __init__ file
 # Migrate database config
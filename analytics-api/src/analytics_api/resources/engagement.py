@@ -20,6 +20,7 @@ from flask_restx import Namespace, Resource
 
 from analytics_api.auth import auth
 from analytics_api.services.engagement_service import EngagementService
+from analytics_api.utils.read_replica import read_only
 from analytics_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -36,6 +37,7 @@ class Engagement(Resource):
     @staticmethod
     @cross_origin(origins=allowedorigins())
     @auth.optional
+    @read_only
     def get(engagement_id):
         """Fetch a single engagement matching the provided id."""
         try:
@@ -59,6 +61,7 @@ class EngagementMap(Resource):
     @staticmethod
     @cross_origin(origins=allowedorigins())
     @auth.optional
+    @read_only
     def get(engagement_id):
         """Fetch a map data matching the provided id."""
         try:
@@ -21,6 +21,7 @@ from flask_restx import Namespace, Resource
 
 from analytics_api.auth import auth
 from analytics_api.services.survey_result import SurveyResultService
+from analytics_api.utils.read_replica import read_only
 from analytics_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -37,6 +38,7 @@ class SurveyResult(Resource):
     @staticmethod
     @cross_origin(origins=allowedorigins())
     @auth.optional
+    @read_only
     def get(engagement_id):
         """Fetch survey result for a single engagement id."""
         try:
@@ -0,0 +1,39 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Routing of the read only endpoints to the replica of the database.
+
+The endpoints decorated with read_only read from the replica bind when one is configured. The api does not write to
+the database, the analytics are loaded by the etl, so there are no writes of the users to read back.
+"""
+from functools import wraps
+
+from flask import current_app, g, has_request_context
+
+
+REPLICA_BIND = 'replica'
+
+
+def read_only(f):
+    """Route the reads of the endpoint to the replica."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        g.read_replica = REPLICA_BIND in (current_app.config.get('SQLALCHEMY_BINDS') or {})
+        return f(*args, **kwargs)
+
+    return decorated
+
+
+def use_replica() -> bool:
+    """Return whether the reads of the current request go to the replica."""
+    return has_request_context() and g.get('read_replica', False)
@@ -0,0 +1,46 @@
+# Copyright © 2023 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run the background jobs, like the exports, submitted to the api.
+
+Start it as a separate process, from the api image, with `python job_worker.py`; several workers can run together.
+Pass --once to run the pending jobs and exit instead of polling for new ones.
+"""
+import sys
+import time
+
+from met_api import create_app
+from met_api.services.job_service import JobService
+
+
+def run(run_once=False):
+    """Run the pending jobs, then poll for new ones unless asked to run once."""
+    application = create_app()
+    application.app_context().push()
+    poll_interval = int(application.config.get('JOB_WORKER_POLL_INTERVAL'))
+    application.logger.info('<<<< Starting job worker >>>>')
+
+    while True:
+        try:
+            run_count = JobService.run_pending()
+            if run_count:
+                application.logger.info(f'<<<< Completed {run_count} jobs >>>>')
+        except Exception as exc:  # NOQA # pylint:disable=broad-except
+            application.logger.error('<Job worker failed: %s', exc)
+        if run_once:
+            break
+        time.sleep(poll_interval)
+
+
+if __name__ == '__main__':
+    run(run_once='--once' in sys.argv[1:])
@@ -0,0 +1,68 @@
+"""widget map compact geojson
+
+Revision ID: b1f4c3a9d2e6
+Revises: 3a88de1e3e7f
+Create Date: 2023-06-26 09:12:44.180342
+
+"""
+import hashlib
+import json
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'b1f4c3a9d2e6'
+down_revision = '3a88de1e3e7f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('widget_map', sa.Column('bbox', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('widget_map', sa.Column('geojson_hash', sa.String(length=64), nullable=True))
+
+    # the shapes uploaded before are kept as they are, only their bounding box and hash are filled in
+    conn = op.get_bind()
+    widget_maps = conn.execute(sa.text('SELECT id, geojson FROM widget_map WHERE geojson IS NOT NULL')).fetchall()
+    for widget_map_id, geojson in widget_maps:
+        bounds = [float('inf'), float('inf'), float('-inf'), float('-inf')]
+        _add_bounds(json.loads(geojson), bounds)
+        bbox = bounds if bounds[0] != float('inf') else None
+        conn.execute(
+            sa.text('UPDATE widget_map SET bbox = CAST(:bbox AS JSONB), geojson_hash = :geojson_hash WHERE id = :id'),
+            {'bbox': json.dumps(bbox), 'geojson_hash': hashlib.sha256(geojson.encode('utf-8')).hexdigest(),
+             'id': widget_map_id})
+
+
+def _add_bounds(document, bounds):
+    """Extend the bounds with the positions of the coordinates found in the document."""
+    if isinstance(document, list):
+        for item in document:
+            _add_bounds(item, bounds)
+    elif isinstance(document, dict):
+        if 'coordinates' in document:
+            _add_position_bounds(document['coordinates'], bounds)
+        for key in ('features', 'geometry', 'geometries'):
+            if document.get(key):
+                _add_bounds(document[key], bounds)
+
+
+def _add_position_bounds(coordinates, bounds):
+    if not isinstance(coordinates, list) or not coordinates:
+        return
+    if isinstance(coordinates[0], (int, float)):
+        if len(coordinates) >= 2:
+            bounds[0] = min(bounds[0], coordinates[0])
+            bounds[1] = min(bounds[1], coordinates[1])
+            bounds[2] = max(bounds[2], coordinates[0])
+            bounds[3] = max(bounds[3], coordinates[1])
+        return
+    for position in coordinates:
+        _add_position_bounds(position, bounds)
+
+
+def downgrade():
+    op.drop_column('widget_map', 'geojson_hash')
+    op.drop_column('widget_map', 'bbox')
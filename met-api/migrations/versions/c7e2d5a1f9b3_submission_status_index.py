@@ -0,0 +1,24 @@
+"""submission survey and comment status index
+
+Revision ID: c7e2d5a1f9b3
+Revises: b1f4c3a9d2e6
+Create Date: 2023-06-27 10:41:02.518214
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2d5a1f9b3'
+down_revision = 'b1f4c3a9d2e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_submission_survey_id_comment_status_id', 'submission', ['survey_id', 'comment_status_id'],
+                    unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_submission_survey_id_comment_status_id', table_name='submission')
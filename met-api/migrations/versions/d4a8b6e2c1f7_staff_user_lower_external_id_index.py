@@ -0,0 +1,24 @@
+"""staff user lower external id index
+
+Revision ID: d4a8b6e2c1f7
+Revises: c7e2d5a1f9b3
+Create Date: 2023-06-28 14:05:37.702941
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8b6e2c1f7'
+down_revision = 'c7e2d5a1f9b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_staff_users_lower_external_id', 'staff_users', [sa.text('lower(external_id)')], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_staff_users_lower_external_id', table_name='staff_users')
@@ -0,0 +1,27 @@
+"""job result key
+
+Revision ID: e3b9c7d1a5f2
+Revises: d4a8b6e2c1f7
+Create Date: 2023-06-29 10:18:26.415307
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b9c7d1a5f2'
+down_revision = 'd4a8b6e2c1f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the results are stored as files, the job only keeps the key of its file
+    op.add_column('job', sa.Column('result_key', sa.String(length=300), nullable=True))
+    op.drop_column('job', 'result')
+
+
+def downgrade():
+    op.add_column('job', sa.Column('result', sa.LargeBinary(), nullable=True))
+    op.drop_column('job', 'result_key')
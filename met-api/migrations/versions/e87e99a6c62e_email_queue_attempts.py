@@ -0,0 +1,33 @@
+"""email queue attempts
+
+Revision ID: e87e99a6c62e
+Revises: 6fdb45014b70
+Create Date: 2023-06-21 14:03:27.208364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e87e99a6c62e'
+down_revision = '6fdb45014b70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ALTER TYPE ... ADD VALUE cannot run inside the migration transaction on older postgres versions
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE notificationstatus ADD VALUE IF NOT EXISTS 'FAILED'")
+    op.add_column('email_queue', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('email_queue', sa.Column('last_error', sa.Text(), nullable=True))
+    op.add_column('email_queue', sa.Column('sent_date', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('email_queue', 'sent_date')
+    op.drop_column('email_queue', 'last_error')
+    op.drop_column('email_queue', 'attempts')
+    # postgres cannot drop a value from an enum type, so FAILED is left on notificationstatus
+    op.execute("UPDATE email_queue SET notification_status = NULL WHERE notification_status = 'FAILED'")
@@ -13,8 +13,12 @@ from met_api.auth import jwt
 from met_api.config import get_named_config
 from met_api.models import db, ma, migrate
 from met_api.models.tenant import Tenant as TenantModel
+from met_api.services.document_generation_service import DocumentGenerationService
 from met_api.utils import constants
 from met_api.utils.cache import cache
+from met_api.utils.db_pool import get_engine_options, init_engines
+from met_api.utils.read_replica import set_recent_write_cookie
+from met_api.utils.template import Template
 
 # Security Response headers
 csp = (
@@ -58,7 +62,9 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
         setup_jwt_manager(app, jwt)
 
     # Database connection initialize
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(app.config))
     db.init_app(app)
+    init_engines(app, db)
 
     # Database migrate initialize
     migrate.init_app(app, db)
@@ -72,6 +78,10 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
 
     build_cache(app)
 
+    # compile the email templates up front instead of on the first email sent
+    Template.precompile()
+    DocumentGenerationService.precompute_templates()
+
     @app.before_request
     def set_tenant_id():
         """Set Tenant ID Globally."""
@@ -93,18 +103,26 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'development')):
                 return
             key = tenant.short_name.upper()
             cache.set(f'tenant_{key}', tenant)
+            cache.set(f'tenant_id_{tenant.id}', tenant)
         g.tenant_id = tenant.id
         g.tenant_name = key
 
     @app.after_request
     def set_secure_headers(response):
         """Set CORS headers for security."""
+        # responses which are meant to be cached set their own cache control, keep it
+        cache_control = response.headers.get('Cache-Control')
         secure_headers.framework.flask(response)
+        if cache_control:
+            response.headers['Cache-Control'] = cache_control
         response.headers.add('Cross-Origin-Resource-Policy', '*')
         response.headers['Cross-Origin-Opener-Policy'] = '*'
         response.headers['Cross-Origin-Embedder-Policy'] = 'unsafe-none'
         return response
 
+    # keep the client which has written on the primary for the next requests, see read_replica
+    app.after_request(set_recent_write_cookie)
+
     # Return App for run in run.py file
     return app
 
@@ -63,9 +63,28 @@ class _Config():  # pylint: disable=too-few-public-methods
     DB_HOST = os.getenv('DATABASE_HOST', '')
     DB_PORT = os.getenv('DATABASE_PORT', '5432')
     SQLALCHEMY_DATABASE_URI = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{int(DB_PORT)}/{DB_NAME}'
+    # Replica of the database read by the read only endpoints, they read from the primary when it is not set
+    DB_REPLICA_HOST = os.getenv('DATABASE_REPLICA_HOST', '')
+    DB_REPLICA_PORT = os.getenv('DATABASE_REPLICA_PORT', DB_PORT)
+    SQLALCHEMY_BINDS = {
+        'replica': f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_REPLICA_HOST}:{int(DB_REPLICA_PORT)}/{DB_NAME}'
+    } if DB_REPLICA_HOST else {}
+    # Seconds after a write during which the reads of the client stay on the primary
+    DB_REPLICA_READ_YOUR_WRITES = os.getenv('DATABASE_REPLICA_READ_YOUR_WRITES', '10')
     SQLALCHEMY_ECHO = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool of each process, the connections beyond the size are opened on demand up to the overflow
+    DB_POOL_SIZE = os.getenv('DB_POOL_SIZE', '5')
+    DB_MAX_OVERFLOW = os.getenv('DB_MAX_OVERFLOW', '10')
+    # Seconds a request waits for a connection of the pool, and after which a connection is replaced
+    DB_POOL_TIMEOUT = os.getenv('DB_POOL_TIMEOUT', '30')
+    DB_POOL_RECYCLE = os.getenv('DB_POOL_RECYCLE', '1800')
+    # Milliseconds after which the database cancels a statement, 0 for no limit
+    DB_STATEMENT_TIMEOUT = os.getenv('DB_STATEMENT_TIMEOUT', '60000')
+    # Set when connecting through PgBouncer in transaction mode, which does not keep session settings
+    DB_PGBOUNCER = os.getenv('DB_PGBOUNCER', 'false')
+
     # JWT_OIDC Settings
     JWT_OIDC_WELL_KNOWN_CONFIG = os.getenv('JWT_OIDC_WELL_KNOWN_CONFIG')
     JWT_OIDC_ALGORITHMS = os.getenv('JWT_OIDC_ALGORITHMS', 'RS256')
@@ -81,6 +100,11 @@ class _Config():  # pylint: disable=too-few-public-methods
     S3_HOST = os.getenv('S3_HOST')
     S3_REGION = os.getenv('S3_REGION')
     S3_SERVICE = os.getenv('S3_SERVICE')
+    # Seconds during which the presigned document urls are valid
+    S3_PRESIGNED_URL_EXPIRY = os.getenv('S3_PRESIGNED_URL_EXPIRY', '900')
+
+    # Seconds during which the anonymous reads of a public engagement are served from the cache, 0 to disable
+    PUBLIC_ENGAGEMENT_CACHE_TIMEOUT = os.getenv('PUBLIC_ENGAGEMENT_CACHE_TIMEOUT', '30')
 
     # Service account details
     KEYCLOAK_BASE_URL = os.getenv('KEYCLOAK_BASE_URL')
@@ -117,18 +141,51 @@ class _Config():  # pylint: disable=too-few-public-methods
     ACCESS_REQUEST_EMAIL_TEMPLATE_ID = os.getenv('ACCESS_REQUEST_EMAIL_TEMPLATE_ID')
     ACCESS_REQUEST_EMAIL_SUBJECT = os.getenv('ACCESS_REQUEST_EMAIL_SUBJECT', 'MET - New User Access Request')
     ACCESS_REQUEST_EMAIL_ADDRESS = os.getenv('ACCESS_REQUEST_EMAIL_ADDRESS')
+    # Engagement closeout
+    ENGAGEMENT_CLOSEOUT_EMAIL_TEMPLATE_ID = os.getenv('ENGAGEMENT_CLOSEOUT_EMAIL_TEMPLATE_ID')
+    ENGAGEMENT_CLOSEOUT_EMAIL_SUBJECT = \
+        os.getenv('ENGAGEMENT_CLOSEOUT_EMAIL_SUBJECT', '{engagement_name} - What we heard')
 
     NOTIFICATIONS_EMAIL_ENDPOINT = os.getenv('NOTIFICATIONS_EMAIL_ENDPOINT')
+
+    # Email outbox delivery
+    EMAIL_OUTBOX_BATCH_SIZE = os.getenv('EMAIL_OUTBOX_BATCH_SIZE', '500')
+    EMAIL_OUTBOX_MAX_WORKERS = os.getenv('EMAIL_OUTBOX_MAX_WORKERS', '10')
+    # Emails sent per call to the notification api
+    EMAIL_OUTBOX_SEND_CHUNK_SIZE = os.getenv('EMAIL_OUTBOX_SEND_CHUNK_SIZE', '50')
+    # Maximum emails sent per second, 0 to send as fast as the workers allow
+    EMAIL_OUTBOX_RATE_LIMIT = os.getenv('EMAIL_OUTBOX_RATE_LIMIT', '20')
+    EMAIL_OUTBOX_MAX_ATTEMPTS = os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '5')
+    # Seconds before the first retry of a failed email, doubled on each further attempt
+    EMAIL_OUTBOX_RETRY_DELAY = os.getenv('EMAIL_OUTBOX_RETRY_DELAY', '60')
     # CDOGS
     CDOGS_ACCESS_TOKEN = os.getenv('CDOGS_ACCESS_TOKEN')
     CDOGS_BASE_URL = os.getenv('CDOGS_BASE_URL')
     CDOGS_SERVICE_CLIENT = os.getenv('CDOGS_SERVICE_CLIENT')
     CDOGS_SERVICE_CLIENT_SECRET = os.getenv('CDOGS_SERVICE_CLIENT_SECRET')
     CDOGS_TOKEN_URL = os.getenv('CDOGS_TOKEN_URL')
+    # Comment sheets are streamed by the api ('native'), or rendered by CDOGS ('cdogs')
+    COMMENT_EXPORT_ENGINE = os.getenv('COMMENT_EXPORT_ENGINE', 'native')
+    # Comments read from the database at a time by a native export
+    COMMENT_EXPORT_CHUNK_SIZE = os.getenv('COMMENT_EXPORT_CHUNK_SIZE', '1000')
+    # Seconds the job worker waits before looking for new jobs when there are none
+    JOB_WORKER_POLL_INTERVAL = os.getenv('JOB_WORKER_POLL_INTERVAL', '5')
+    # Folder of the job results when the object storage is not configured, shared by the api and the job workers
+    JOB_RESULT_FOLDER = os.getenv('JOB_RESULT_FOLDER', '/tmp/job_results')
+    # Seconds without progress after which a running job is deemed abandoned by its worker and run again
+    JOB_STALE_TIMEOUT = os.getenv('JOB_STALE_TIMEOUT', '1800')
+    # Seconds during which a template found cached by CDOGS is not checked again
+    CDOGS_TEMPLATE_CHECK_TTL = os.getenv('CDOGS_TEMPLATE_CHECK_TTL', '3600')
 
     # just a temporary writable location to unzip the files.
-    # This gets cleared after every shapefile conversion.
+    # Each conversion unzips into its own sub directory, removed once the conversion is done.
     SHAPEFILE_UPLOAD_FOLDER = os.getenv('SHAPEFILE_UPLOAD_FOLDER', '/tmp/uploads')
+    # Tolerance, in the units of the shapefile, used to simplify the geometries; unset to keep them as is
+    SHAPEFILE_SIMPLIFY_TOLERANCE = os.getenv('SHAPEFILE_SIMPLIFY_TOLERANCE')
+    # Number of decimals the coordinates are rounded to; unset to keep them as is
+    SHAPEFILE_COORDINATE_PRECISION = os.getenv('SHAPEFILE_COORDINATE_PRECISION')
+    # Number of decimals the coordinates of the map widget shapes are stored with (6 decimals is about 10 cm)
+    WIDGET_MAP_COORDINATE_PRECISION = os.getenv('WIDGET_MAP_COORDINATE_PRECISION', '6')
 
     # default tenant configs ; Set to EAO for now.Overwrite using openshift variables
     DEFAULT_TENANT_SHORT_NAME = os.getenv('DEFAULT_TENANT_SHORT_NAME', 'EAO')
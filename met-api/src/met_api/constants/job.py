@@ -0,0 +1,17 @@
+"""Constants of the background jobs."""
+from enum import Enum, IntEnum
+
+
+class JobStatus(IntEnum):
+    """Enum of the status of a background job."""
+
+    PENDING = 1
+    RUNNING = 2
+    COMPLETED = 3
+    FAILED = 4
+
+
+class JobType(Enum):
+    """Enum of the types of background job."""
+
+    COMMENT_SHEET = 'comment_sheet'
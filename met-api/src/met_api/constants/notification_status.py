@@ -20,3 +20,12 @@ class NotificationStatus(IntEnum):
 
     PROCESSING = 1
     SENT = 2
+    FAILED = 3
+
+
+class OutboxStatus(IntEnum):
+    """Enum of the delivery status of an email in the outbox."""
+
+    PENDING = 1
+    SENT = 2
+    FAILED = 3
@@ -23,3 +23,4 @@ class WidgetType(IntEnum):
     PHASES = 3
     SUBSCRIBE = 4
     EVENTS = 5
+    MAP = 6
@@ -42,3 +42,5 @@ from .widget_events import WidgetEvents
 from .widget_item import WidgetItem
 from .widget_type import WidgetType
 from .email_queue import EmailQueue
+from .email_outbox import EmailOutbox
+from .job import Job
@@ -6,6 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import TEXT, and_, asc, cast, desc
+from sqlalchemy.orm import contains_eager, joinedload
 from sqlalchemy.sql import text
 from sqlalchemy.sql.schema import ForeignKey
 
@@ -47,6 +48,7 @@ class Comment(BaseModel):
         query = db.session.query(Comment)\
             .join(Survey)\
             .filter(Comment.survey_id == survey_id)\
+            .options(*cls._listing_load_options())
 
         if search_text:
             # Remove all non-digit characters from search text
@@ -66,6 +68,15 @@ class Comment(BaseModel):
 
         return page.items, page.total
 
+    @staticmethod
+    def _listing_load_options():
+        """Return the loader options for the submission and survey a listed comment is serialized with.
+
+        The survey is taken from the join of the listing query and the submission is joined in, so a page of
+        comments is read with a single statement.
+        """
+        return contains_eager(Comment.survey), joinedload(Comment.submission)
+
     @classmethod
     def get_accepted_comments_by_survey_id_where_engagement_closed_paginated(
             cls, survey_id, pagination_options: PaginationOptions):
@@ -137,16 +148,26 @@ class Comment(BaseModel):
     @classmethod
     def get_comments_by_survey_id(cls, survey_id):
         """Get comments paginated."""
-        query = db.session.query(
+        return cls._get_comments_for_export_query(survey_id).all()
+
+    @classmethod
+    def stream_comments_by_survey_id(cls, survey_id, chunk_size: int):
+        """Stream the columns of the comments needed by the export, through a server side cursor."""
+        return cls._get_comments_for_export_query(survey_id).yield_per(chunk_size)
+
+    @classmethod
+    def count_comments_by_survey_id(cls, survey_id) -> int:
+        """Count the comments of the survey."""
+        return db.session.query(Comment.id).filter(Comment.survey_id == survey_id).count()
+
+    @staticmethod
+    def _get_comments_for_export_query(survey_id):
+        return db.session.query(
             Comment.id,
             Comment.submission_date,
             Comment.text,
             Submission.reviewed_by
         )\
             .join(Submission, Submission.id == Comment.submission_id) \
-            .add_entity(Submission)\
-            .filter(Comment.survey_id == survey_id)
-
-        query = query.order_by(Comment.id.asc())
-
-        return query.all()
+            .filter(Comment.survey_id == survey_id)\
+            .order_by(Comment.id.asc())
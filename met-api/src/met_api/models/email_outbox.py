@@ -0,0 +1,88 @@
+"""Email outbox model class.
+
+Manages the emails waiting to be delivered to each recipient
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy.dialects import postgresql
+
+from met_api.constants.notification_status import OutboxStatus
+from .base_model import BaseModel
+from .db import db
+
+
+class EmailOutbox(BaseModel):  # pylint: disable=too-few-public-methods
+    """Definition of the email outbox entity.
+
+    One row per recipient, so the delivery of a large mail out can be retried and resumed per recipient.
+    """
+
+    __tablename__ = 'email_outbox'
+    __table_args__ = (
+        UniqueConstraint('entity_type', 'entity_id', 'action', 'participant_id', name='uq_email_outbox_recipient'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    entity_id = db.Column(db.Integer, nullable=False)  # id of the entity which triggers the email
+    entity_type = db.Column(db.String(100), nullable=False)  # type of the entity which triggers email ,like engagement
+    action = db.Column(db.String(100), nullable=False)  # closed , published etc
+    participant_id = db.Column(db.Integer, ForeignKey('participant.id', ondelete='CASCADE'), nullable=False)
+    subject = db.Column(db.String(500), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    args = db.Column(postgresql.JSONB(astext_type=db.Text()), nullable=True)
+    template_id = db.Column(db.String(100), nullable=True)
+    status = db.Column(db.Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING, index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_date = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+
+    @classmethod
+    def add_recipients(cls, email: dict, participant_ids: List[int], chunk_size: int = 1000) -> None:
+        """Add the email to the outbox of each participant, skipping participants who already have it."""
+        now = datetime.utcnow()
+        for start in range(0, len(participant_ids), chunk_size):
+            rows = [
+                {
+                    **email,
+                    'participant_id': participant_id,
+                    'status': OutboxStatus.PENDING,
+                    'attempts': 0,
+                    'next_attempt_date': now,
+                    'created_date': now,
+                }
+                for participant_id in participant_ids[start:start + chunk_size]
+            ]
+            db.session.execute(postgresql.insert(cls.__table__).values(rows).on_conflict_do_nothing(
+                constraint='uq_email_outbox_recipient'))
+
+    @classmethod
+    def claim_due(cls, max_size: int) -> List[EmailOutbox]:
+        """Lock and return the pending emails due for delivery, skipping the ones claimed by other workers."""
+        return cls.query \
+            .filter(cls.status == OutboxStatus.PENDING) \
+            .filter(cls.next_attempt_date <= datetime.utcnow()) \
+            .order_by(cls.id) \
+            .limit(max_size) \
+            .with_for_update(skip_locked=True) \
+            .all()
+
+    def mark_sent(self):
+        """Record a successful delivery."""
+        self.attempts += 1
+        self.status = OutboxStatus.SENT
+        self.sent_date = datetime.utcnow()
+        self.last_error = None
+
+    def mark_failed(self, error: str, max_attempts: int, retry_delay: int):
+        """Record a failed delivery and schedule the next attempt with an exponential backoff."""
+        self.attempts += 1
+        self.last_error = error
+        if self.attempts >= max_attempts:
+            self.status = OutboxStatus.FAILED
+            return
+        self.next_attempt_date = datetime.utcnow() + timedelta(seconds=retry_delay * 2 ** (self.attempts - 1))
@@ -4,6 +4,7 @@ Manages the Email queue
 """
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List
 
 from met_api.constants.notification_status import NotificationStatus
@@ -22,11 +23,44 @@ class EmailQueue(BaseModel):  # pylint: disable=too-few-public-methods
                             nullable=False)  # type of the entity which triggers email ,like engagement , user
     action = db.Column(db.String(100))  # created , deleted etc
     notification_status = db.Column(db.Enum(NotificationStatus), nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    last_error = db.Column(db.Text, nullable=True)
+    sent_date = db.Column(db.DateTime, nullable=True)
 
     @staticmethod
-    def get_unprocessed_mails(max_size: int) -> List[EmailQueue]:
-        """Return a list of unprocessed emails."""
-        query = EmailQueue.query.filter(EmailQueue.notification_status.is_(None))
+    def claim_unprocessed_mails(max_size: int) -> List[EmailQueue]:
+        """Mark a batch of unprocessed emails as processing, commit and return them.
+
+        Rows locked by another worker are skipped, so concurrent workers never claim the same email.
+        """
+        query = EmailQueue.query \
+            .filter(EmailQueue.notification_status.is_(None)) \
+            .order_by(EmailQueue.id) \
+            .with_for_update(skip_locked=True)
         if max_size != 0:
             query = query.limit(max_size)
-        return query.all()
+        mails = query.all()
+        for mail in mails:
+            mail.notification_status = NotificationStatus.PROCESSING.value
+            mail.updated_date = datetime.utcnow()
+        db.session.commit()
+        return mails
+
+    def mark_sent(self):
+        """Record a successful processing of the email."""
+        self.attempts += 1
+        self.notification_status = NotificationStatus.SENT.value
+        self.sent_date = datetime.utcnow()
+        self.last_error = None
+
+    def mark_failed(self, error: str, max_attempts: int, retry: bool = True):
+        """Record a failed processing; the email goes back to the queue until it runs out of attempts.
+
+        An email which was partly sent is not retried, since the retry would send it again to the same recipients.
+        """
+        self.attempts += 1
+        self.last_error = error
+        if retry and self.attempts < max_attempts:
+            self.notification_status = None
+        else:
+            self.notification_status = NotificationStatus.FAILED.value
@@ -10,6 +10,7 @@ from typing import List, Optional
 
 from sqlalchemy import and_, asc, desc, or_
 from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import defer, selectinload
 from sqlalchemy.sql import text
 from sqlalchemy.sql.schema import ForeignKey
 
@@ -55,7 +56,7 @@ class Engagement(BaseModel):
             assigned_engagements: list[int] | None = None,
     ):
         """Get engagements paginated."""
-        query = db.session.query(Engagement).join(EngagementStatus)
+        query = db.session.query(Engagement).join(EngagementStatus).options(*cls._listing_load_options())
 
         query = cls._add_tenant_filter(query)
 
@@ -90,6 +91,19 @@ class Engagement(BaseModel):
         page = query.paginate(page=pagination_options.page, per_page=pagination_options.size)
         return page.items, page.total
 
+    @staticmethod
+    def _listing_load_options():
+        """Return the loader options for the columns and the surveys a listed engagement is serialized with.
+
+        The rich content of the engagement and the forms of its surveys are not read.
+        """
+        return (
+            defer(Engagement.content),
+            defer(Engagement.rich_content),
+            defer(Engagement.rich_description),
+            selectinload(Engagement.surveys).defer('form_json'),
+        )
+
     @classmethod
     def update_engagement(cls, engagement: EngagementSchema) -> Engagement:
         """Update engagement."""
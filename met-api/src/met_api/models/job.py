@@ -0,0 +1,84 @@
+"""Job model class.
+
+Manages the background jobs, like the exports, run by the job worker
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm.attributes import set_committed_value
+
+from met_api.constants.job import JobStatus
+from .base_model import BaseModel
+from .db import db
+
+
+class Job(BaseModel):  # pylint: disable=too-few-public-methods
+    """Definition of the job entity."""
+
+    __tablename__ = 'job'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    job_type = db.Column(db.String(50), nullable=False)
+    params = db.Column(postgresql.JSONB(astext_type=db.Text()), nullable=True)
+    status = db.Column(db.Enum(JobStatus), nullable=False, default=JobStatus.PENDING, index=True)
+    progress = db.Column(db.Integer, nullable=False, default=0)  # percentage of the work done
+    error = db.Column(db.Text, nullable=True)
+    started_date = db.Column(db.DateTime, nullable=True)
+    completed_date = db.Column(db.DateTime, nullable=True)
+    result_file_name = db.Column(db.String(200), nullable=True)
+    result_content_type = db.Column(db.String(200), nullable=True)
+    # key of the file of the result, in the object storage or the job result folder
+    result_key = db.Column(db.String(300), nullable=True)
+
+    @classmethod
+    def claim_next(cls, stale_timeout: int) -> Optional[Job]:
+        """Mark the oldest pending job as running and commit, skipping the jobs claimed by other workers.
+
+        A running job which has not progressed for stale_timeout seconds was left by a worker which died, it is
+        claimed again.
+        """
+        stale_date = datetime.utcnow() - timedelta(seconds=stale_timeout)
+        job = cls.query \
+            .filter(or_(cls.status == JobStatus.PENDING,
+                        (cls.status == JobStatus.RUNNING) & (cls.updated_date < stale_date))) \
+            .order_by(cls.id) \
+            .limit(1) \
+            .with_for_update(skip_locked=True) \
+            .first()
+        if job:
+            job.status = JobStatus.RUNNING
+            job.progress = 0
+            job.started_date = datetime.utcnow()
+            db.session.commit()
+        return job
+
+    def update_progress(self, progress: int):
+        """Record the progress of the job on a connection of its own.
+
+        The job reads its data through a server side cursor of the session, which a commit of the session would close.
+        """
+        with db.engine.begin() as connection:
+            connection.execute(
+                update(Job.__table__)
+                .where(Job.__table__.c.id == self.id)
+                .values(progress=progress, updated_date=datetime.utcnow()))
+        set_committed_value(self, 'progress', progress)
+
+    def complete(self, result_key: str, file_name: str, content_type: str):
+        """Record the stored result of the job."""
+        self.status = JobStatus.COMPLETED
+        self.progress = 100
+        self.completed_date = datetime.utcnow()
+        self.result_key = result_key
+        self.result_file_name = file_name
+        self.result_content_type = content_type
+
+    def fail(self, error: str):
+        """Record the failure of the job."""
+        self.status = JobStatus.FAILED
+        self.completed_date = datetime.utcnow()
+        self.error = error
@@ -52,6 +52,13 @@ class Membership(BaseModel):
             .all()
         return memberships
 
+    @classmethod
+    def find_by_user_and_status(cls, userid, status=MembershipStatus.ACTIVE.value) -> List[Membership]:
+        """Get the memberships of a user with the status."""
+        return db.session.query(Membership) \
+            .filter(and_(Membership.user_id == userid, Membership.status == status)) \
+            .all()
+
     @classmethod
     def find_by_engagement_and_user_id(cls, eng_id, userid, status=MembershipStatus.ACTIVE.value) \
             -> List[Membership]:
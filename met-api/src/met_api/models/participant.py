@@ -3,8 +3,10 @@
 Manages the participant
 """
 from __future__ import annotations
+from functools import lru_cache
+from typing import List
 from flask import current_app
-from itsdangerous import URLSafeSerializer
+from itsdangerous import Signer, URLSafeSerializer, want_bytes
 
 from sqlalchemy import Column
 
@@ -12,6 +14,28 @@ from .base_model import BaseModel
 from .db import db
 
 
+class _KeyCachingSigner(Signer):
+    """Signer which derives the key of a secret once per process rather than on every signature."""
+
+    _derived_keys = {}
+
+    def derive_key(self, secret_key=None) -> bytes:
+        """Return the derived key of the secret, deriving it on the first call."""
+        # itsdangerous calls this without a secret for the current one, which must not share its cache entry
+        secret_key = self.secret_keys[-1] if secret_key is None else want_bytes(secret_key)
+        cache_key = (secret_key, self.salt, self.key_derivation, self.digest_method)
+        derived_key = self._derived_keys.get(cache_key)
+        if derived_key is None:
+            derived_key = self._derived_keys[cache_key] = super().derive_key(secret_key)
+        return derived_key
+
+
+@lru_cache(maxsize=8)
+def _get_serializer(secret) -> URLSafeSerializer:
+    """Return the serializer of the secret, shared by the whole process."""
+    return URLSafeSerializer(secret, signer=_KeyCachingSigner)
+
+
 class Participant(BaseModel):  # pylint: disable=too-few-public-methods
     """Definition of the participant entity."""
 
@@ -28,17 +52,25 @@ class Participant(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def encode_email(cls, _email_address):
         """Get a participant with the provided email address."""
-        token_serializer = URLSafeSerializer(cls._get_secret())
+        token_serializer = _get_serializer(cls._get_secret())
         tokenized_email = token_serializer.dumps(_email_address.lower())
         return tokenized_email
 
     @classmethod
     def decode_email(cls, _encrypted_email_address):
         """Get a participant with the provided email address."""
-        token_serializer = URLSafeSerializer(cls._get_secret())
+        token_serializer = _get_serializer(cls._get_secret())
         tokenized_email = token_serializer.loads(_encrypted_email_address)
         return tokenized_email
 
+    @classmethod
+    def decode_emails(cls, _encrypted_email_addresses: List[str]) -> List[str]:
+        """Decode a batch of email addresses, verifying all of them with a single signer."""
+        token_serializer = _get_serializer(cls._get_secret())
+        signer = token_serializer.make_signer()
+        load_payload = token_serializer.load_payload
+        return [load_payload(signer.unsign(email_address)) for email_address in _encrypted_email_addresses]
+
     @classmethod
     def get_by_email(cls, _email_address) -> Participant:
         """Get a participant with the provided email address."""
@@ -31,6 +31,10 @@ class StaffUser(BaseModel):
     email_address = Column(db.String(100), nullable=True)
     contact_number = Column(db.String(50), nullable=True)
     external_id = Column(db.String(50), nullable=False, unique=True)
+    # the users are looked up by the lower cased external id
+    __table_args__ = (
+        db.Index('ix_staff_users_lower_external_id', func.lower(external_id)),
+    )
     status_id = db.Column(db.Integer, ForeignKey('user_status.id'))
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenant.id'), nullable=True)
 
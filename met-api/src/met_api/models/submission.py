@@ -4,9 +4,10 @@ Manages the Submission
 """
 from __future__ import annotations
 from datetime import datetime
-from typing import List
-from sqlalchemy import TEXT, ForeignKey, and_, asc, cast, desc, or_, text
+from typing import Dict, List
+from sqlalchemy import TEXT, ForeignKey, and_, asc, cast, desc, func, or_, text
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import defer, joinedload, selectinload
 
 from met_api.constants.comment_status import Status
 from met_api.models.pagination_options import PaginationOptions
@@ -22,6 +23,9 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
     """Definition of the Submission entity."""
 
     __tablename__ = 'submission'
+    __table_args__ = (
+        db.Index('ix_submission_survey_id_comment_status_id', 'survey_id', 'comment_status_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     submission_json = db.Column(postgresql.JSONB(astext_type=db.Text()), nullable=False, server_default='{}')
@@ -169,6 +173,7 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
         query = db.session.query(Submission)\
             .filter(and_(Submission.survey_id == survey_id,
                          or_(Submission.reviewed_by != 'System', Submission.reviewed_by == null_value)))\
+            .options(*cls._listing_load_options())
 
         if search_text:
             # Remove all non-digit characters from search text
@@ -191,6 +196,18 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
 
         return page.items, page.total
 
+    @staticmethod
+    def _listing_load_options():
+        """Return the loader options for the columns and the relations a listed submission is serialized with.
+
+        The submitted form is not read and the comments are read with one statement for the whole page.
+        """
+        return (
+            defer(Submission.submission_json),
+            joinedload(Submission.survey),
+            selectinload(Submission.comments),
+        )
+
     @classmethod
     def get_engaged_participants(cls, engagement_id) -> List[Participant]:
         """Get users that have submissions for the specified engagement id."""
@@ -201,6 +218,31 @@ class Submission(BaseModel):  # pylint: disable=too-few-public-methods
             .all()
         return users
 
+    @classmethod
+    def get_engaged_participant_ids(cls, engagement_id) -> List[int]:
+        """Get the distinct ids of the participants that have submissions for the specified engagement id."""
+        rows = db.session.query(Submission.participant_id)\
+            .join(Survey)\
+            .filter(Survey.engagement_id == engagement_id)\
+            .filter(Submission.participant_id.isnot(None))\
+            .distinct()\
+            .all()
+        return [row.participant_id for row in rows]
+
+    @classmethod
+    def get_status_counts_by_survey_ids(cls, survey_ids: List[int]) -> Dict[int, Dict[int, int]]:
+        """Get the number of submissions of each comment status, for each of the surveys, in a single query."""
+        if not survey_ids:
+            return {}
+        rows = db.session.query(Submission.survey_id, Submission.comment_status_id, func.count(Submission.id))\
+            .filter(Submission.survey_id.in_(survey_ids))\
+            .group_by(Submission.survey_id, Submission.comment_status_id)\
+            .all()
+        counts = {}
+        for survey_id, comment_status_id, count in rows:
+            counts.setdefault(survey_id, {})[comment_status_id] = count
+        return counts
+
     @staticmethod
     def _filter_by_advanced_filters(query, advanced_search_filters: dict):
         if status := advanced_search_filters.get('status'):
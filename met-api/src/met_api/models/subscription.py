@@ -4,12 +4,15 @@ Manages the Subscription
 """
 from __future__ import annotations
 from datetime import datetime
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, or_
+from sqlalchemy.orm import Query
 
 from met_api.schemas.subscription import SubscriptionSchema
 
 from .base_model import BaseModel
 from .db import db
+from .engagement import Engagement
+from .participant import Participant
 
 
 class Subscription(BaseModel):  # pylint: disable=too-few-public-methods
@@ -46,6 +49,21 @@ class Subscription(BaseModel):  # pylint: disable=too-few-public-methods
             .first()
         return db_subscription
 
+    @classmethod
+    def get_subscribed_email_addresses(cls, tenant_id=None) -> Query:
+        """Get the distinct encoded email addresses of the subscribed participants.
+
+        Only subscriptions to the engagements of the tenant are included when a tenant is given.
+        """
+        query = db.session.query(Participant.email_address)\
+            .join(Subscription, Subscription.participant_id == Participant.id)\
+            .filter(Subscription.is_subscribed.is_(True))\
+            .filter(Participant.email_address.isnot(None))
+        if tenant_id:
+            query = query.outerjoin(Engagement, Engagement.id == Subscription.engagement_id)\
+                .filter(or_(Subscription.engagement_id.is_(None), Engagement.tenant_id == tenant_id))
+        return query.distinct()
+
     @classmethod
     def create(cls, subscription: SubscriptionSchema, session=None) -> Subscription:
         """Create a subscription."""
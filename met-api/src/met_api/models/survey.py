@@ -8,10 +8,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey, and_, asc, desc, or_
+from sqlalchemy import ForeignKey, and_, asc, desc, func, or_, true
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import contains_eager, defer
 from sqlalchemy.sql import text
 
+from met_api.constants.comment_status import Status as CommentStatus
 from met_api.constants.engagement_status import Status
 from met_api.models.engagement import Engagement
 from met_api.models.engagement_status import EngagementStatus
@@ -38,6 +40,8 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenant.id'), nullable=True)
     is_hidden = db.Column(db.Boolean, nullable=False)
     is_template = db.Column(db.Boolean, nullable=False)
+    # number of submissions of each comment status, set on the surveys of a listing
+    comment_counts = None
 
     @classmethod
     def get_open(cls, survey_id) -> Survey:
@@ -54,8 +58,9 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
     @classmethod
     def get_surveys_paginated(cls, pagination_options: PaginationOptions,
                               survey_search_options: SurveySearchOptions):
-        """Get surveys paginated."""
-        query = db.session.query(Survey).join(Engagement, isouter=True).join(EngagementStatus, isouter=True)
+        """Get surveys paginated, with the number of submissions of each comment status of the surveys."""
+        query = db.session.query(Survey).join(Engagement, isouter=True).join(EngagementStatus, isouter=True)\
+            .options(*cls._listing_load_options())
         query = cls._add_tenant_filter(query)
 
         if survey_search_options.exclude_hidden:
@@ -80,12 +85,53 @@ class Survey(BaseModel):  # pylint: disable=too-few-public-methods
 
         no_pagination_options = not pagination_options.page or not pagination_options.size
         if no_pagination_options:
-            items = query.all()
+            items = [cls._with_comment_counts(row) for row in cls._add_comment_counts(query).all()]
             return items, len(items)
 
-        page = query.paginate(page=pagination_options.page, per_page=pagination_options.size)
+        # the total is counted without the submissions, which are only counted for the surveys of the page
+        total = query.order_by(None).count()
+        rows = cls._add_comment_counts(query)\
+            .limit(pagination_options.size)\
+            .offset((pagination_options.page - 1) * pagination_options.size)\
+            .all()
+        return [cls._with_comment_counts(row) for row in rows], total
 
-        return page.items, page.total
+    @staticmethod
+    def _add_comment_counts(query):
+        """Join a lateral subquery counting the submissions of each comment status of the survey.
+
+        The columns are total and status_<comment status id>. The submission table is used rather than its model,
+        which imports this one.
+        """
+        submission = db.metadata.tables['submission']
+        status_counts = db.session.query(
+            func.count(submission.c.id).label('total'),
+            *[func.count(submission.c.id).filter(submission.c.comment_status_id == status.value)
+              .label(f'status_{status.value}') for status in CommentStatus]
+        ).filter(submission.c.survey_id == Survey.id).subquery().lateral()
+        return query.join(status_counts, true()).add_columns(status_counts)
+
+    @staticmethod
+    def _with_comment_counts(row) -> Survey:
+        survey = row.Survey
+        survey.comment_counts = {status.value: getattr(row, f'status_{status.value}') for status in CommentStatus}
+        # the submissions without a comment status, as counted by Submission.get_status_counts_by_survey_ids
+        survey.comment_counts[None] = row.total - sum(survey.comment_counts.values())
+        return survey
+
+    @staticmethod
+    def _listing_load_options():
+        """Return the loader options for the columns and the engagement a listed survey is serialized with.
+
+        The form is not read and the engagement is taken from the join of the listing query.
+        """
+        return (
+            defer(Survey.form_json),
+            contains_eager(Survey.engagement)
+            .defer(Engagement.content)
+            .defer(Engagement.rich_content)
+            .defer(Engagement.rich_description),
+        )
 
     @classmethod
     def create_survey(cls, survey: SurveySchema) -> Survey:
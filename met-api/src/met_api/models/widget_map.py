@@ -4,6 +4,7 @@ Manages the map widget
 """
 from __future__ import annotations
 
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.sql.schema import ForeignKey
 
 from .base_model import BaseModel
@@ -22,6 +23,8 @@ class WidgetMap(BaseModel):  # pylint: disable=too-few-public-methods, too-many-
     longitude = db.Column(db.Float, nullable=False)
     geojson = db.Column(db.Text())
     file_name = db.Column(db.Text())
+    bbox = db.Column(postgresql.JSONB(astext_type=db.Text()), nullable=True)
+    geojson_hash = db.Column(db.String(64), nullable=True)
 
     @classmethod
     def get_map(cls, widget_id) -> list[WidgetMap]:
@@ -31,6 +34,13 @@ class WidgetMap(BaseModel):  # pylint: disable=too-few-public-methods, too-many-
             .all()
         return widget_map
 
+    @classmethod
+    def get_map_geojson(cls, widget_id) -> WidgetMap:
+        """Get the map of the widget which has a shape."""
+        return db.session.query(WidgetMap) \
+            .filter(WidgetMap.widget_id == widget_id, WidgetMap.geojson.isnot(None)) \
+            .first()
+
     @classmethod
     def update_map(cls, widget_id, map_data: dict) -> WidgetMap:
         """Update map."""
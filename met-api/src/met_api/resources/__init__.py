@@ -32,6 +32,7 @@ from .engagement import API as ENGAGEMENT_API
 from .engagement_metadata import API as ENGAGEMENT_METADATA_API
 from .engagement_members import API as ENGAGEMENT_MEMBERS_API
 from .feedback import API as FEEDBACK_API
+from .job import API as JOB_API
 from .submission import API as SUBMISSION_API
 from .subscription import API as SUBSCRIPTION_API
 from .survey import API as SURVEY_API
@@ -73,6 +74,7 @@ API.add_namespace(VALUE_COMPONENTS_API)
 API.add_namespace(ENGAGEMENT_METADATA_API)
 API.add_namespace(SHAPEFILE_API)
 API.add_namespace(TENANT_API)
+API.add_namespace(JOB_API)
 API.add_namespace(WIDGET_DOCUMENTS_API, path='/widgets/<string:widget_id>/documents')
 API.add_namespace(ENGAGEMENT_MEMBERS_API, path='/engagements/<string:engagement_id>/members')
 API.add_namespace(WIDGET_EVENTS_API, path='/widgets/<int:widget_id>/events')
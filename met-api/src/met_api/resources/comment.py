@@ -15,13 +15,13 @@
 
 from http import HTTPStatus
 
-from flask import Response, request
+from flask import Response, current_app, request, stream_with_context
 from flask_cors import cross_origin
 from flask_restx import Namespace, Resource
 
 from met_api.auth import jwt as _jwt
 from met_api.models.pagination_options import PaginationOptions
-from met_api.services.comment_service import CommentService
+from met_api.services.comment_service import COMMENT_SHEET_CONTENT_TYPES, CommentService
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -92,19 +92,35 @@ class GeneratedCommentsSheet(Resource):
     @cross_origin(origins=allowedorigins())
     @_jwt.requires_auth
     def get(survey_id):
-        """Export comments."""
-        try:
+        """Export comments.
 
-            response = CommentService().export_comments_to_spread_sheet(survey_id)
-            response_headers = dict(response.headers)
-            headers = {
-                'content-type': response_headers.get('content-type'),
-                'content-disposition': response_headers.get('content-disposition'),
-            }
+        The sheet is streamed as csv, or as xlsx with ?format=xlsx, unless the export is configured to go
+        through CDOGS.
+        """
+        try:
+            if current_app.config.get('COMMENT_EXPORT_ENGINE') == 'cdogs':
+                response = CommentService().export_comments_to_spread_sheet(survey_id)
+                response_headers = dict(response.headers)
+                headers = {
+                    'content-type': response_headers.get('content-type'),
+                    'content-disposition': response_headers.get('content-disposition'),
+                }
+                return Response(
+                    response=response.content,
+                    status=response.status_code,
+                    headers=headers
+                )
+
+            file_format = request.args.get('format', CommentService.csv_format)
+            if file_format not in (CommentService.csv_format, CommentService.xlsx_format):
+                return f'Unsupported format {file_format}', HTTPStatus.BAD_REQUEST
             return Response(
-                response=response.content,
-                status=response.status_code,
-                headers=headers
+                response=stream_with_context(CommentService.stream_comments_sheet(survey_id, file_format)),
+                status=HTTPStatus.OK,
+                headers={
+                    'content-type': COMMENT_SHEET_CONTENT_TYPES[file_format],
+                    'content-disposition': f'attachment; filename="comments_sheet.{file_format}"',
+                }
             )
         except ValueError as err:
             return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
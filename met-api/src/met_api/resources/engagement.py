@@ -25,6 +25,8 @@ from met_api.auth import jwt as _jwt
 from met_api.models.pagination_options import PaginationOptions
 from met_api.schemas.engagement import EngagementSchema
 from met_api.services.engagement_service import EngagementService
+from met_api.utils.http_cache import conditional_response
+from met_api.utils.read_replica import read_only
 from met_api.utils.roles import Role
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
@@ -43,6 +45,7 @@ class Engagement(Resource):
     @staticmethod
     @cross_origin(origins=allowedorigins())
     @auth.optional
+    @read_only
     def get(engagement_id):
         """Fetch a single engagement matching the provided id."""
         try:
@@ -50,6 +53,8 @@ class Engagement(Resource):
             engagement_record = EngagementService().get_engagement(engagement_id, user_id)
 
             if engagement_record:
+                if user_id is None:
+                    return conditional_response(engagement_record)
                 return engagement_record, HTTPStatus.OK
 
             return 'Engagement was not found', HTTPStatus.INTERNAL_SERVER_ERROR
@@ -59,6 +64,33 @@ class Engagement(Resource):
             return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@cors_preflight('GET,OPTIONS')
+@API.route('/<engagement_id>/bundle')
+class EngagementBundle(Resource):
+    """Resource for the engagement page, the engagement along with its widgets."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @auth.optional
+    @read_only
+    def get(engagement_id):
+        """Fetch a single engagement matching the provided id, with its widgets and their content."""
+        try:
+            user_id = TokenInfo.get_id()
+            engagement_bundle = EngagementService().get_engagement_bundle(engagement_id, user_id)
+
+            if engagement_bundle:
+                if user_id is None:
+                    return conditional_response(engagement_bundle)
+                return engagement_bundle, HTTPStatus.OK
+
+            return 'Engagement was not found', HTTPStatus.INTERNAL_SERVER_ERROR
+        except KeyError:
+            return 'Engagement was not found', HTTPStatus.INTERNAL_SERVER_ERROR
+        except ValueError as err:
+            return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 @cors_preflight('GET, POST, PUT, PATCH, OPTIONS')
 @API.route('/')
 class Engagements(Resource):
@@ -67,6 +99,7 @@ class Engagements(Resource):
     @staticmethod
     @cross_origin(origins=allowedorigins())
     @auth.optional
+    @read_only
     def get():
         """Fetch engagements."""
         try:
@@ -0,0 +1,88 @@
+# Copyright © 2023 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""API endpoints for managing the background jobs, like the exports."""
+
+from http import HTTPStatus
+
+from flask import Response, request
+from flask_cors import cross_origin
+from flask_restx import Namespace, Resource
+
+from met_api.auth import jwt as _jwt
+from met_api.exceptions.business_exception import BusinessException
+from met_api.services.job_service import JobService
+from met_api.utils.util import allowedorigins, cors_preflight
+
+
+API = Namespace('jobs', description='Endpoints for Background Jobs Management')
+"""Custom exception messages
+"""
+
+
+@cors_preflight('POST, OPTIONS')
+@API.route('')
+class Jobs(Resource):
+    """Resource for submitting background jobs."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @_jwt.requires_auth
+    def post():
+        """Submit a job, which the job worker runs in the background."""
+        try:
+            request_json = request.get_json()
+            job = JobService.submit(request_json.get('job_type'), request_json.get('params', {}))
+            return job, HTTPStatus.ACCEPTED
+        except BusinessException as err:
+            return str(err.error), err.status_code
+
+
+@cors_preflight('GET, OPTIONS')
+@API.route('/<int:job_id>')
+class Job(Resource):
+    """Resource for polling a background job."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @_jwt.requires_auth
+    def get(job_id):
+        """Return the status and progress of the job."""
+        try:
+            return JobService.get_job(job_id), HTTPStatus.OK
+        except BusinessException as err:
+            return str(err.error), err.status_code
+
+
+@cors_preflight('GET, OPTIONS')
+@API.route('/<int:job_id>/download')
+class JobResult(Resource):
+    """Resource for downloading the result of a background job."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @_jwt.requires_auth
+    def get(job_id):
+        """Download the file produced by the job."""
+        try:
+            job = JobService.get_job_result(job_id)
+            return Response(
+                response=JobService.stream_result(job),
+                status=HTTPStatus.OK,
+                headers={
+                    'content-type': job.result_content_type,
+                    'content-disposition': f'attachment; filename="{job.result_file_name}"',
+                }
+            )
+        except BusinessException as err:
+            return str(err.error), err.status_code
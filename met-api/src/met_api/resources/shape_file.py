@@ -44,7 +44,10 @@ class ShapeFile(Resource):
             file = request.files.get('file')
             if not file:
                 return jsonify({'error': 'No file uploaded.'}), HTTPStatus.BAD_REQUEST
-            geojson = ShapefileService().convert_to_geojson(file)
+            geojson = ShapefileService().convert_to_geojson(
+                file,
+                simplify_tolerance=request.form.get('simplify_tolerance'),
+                coordinate_precision=request.form.get('coordinate_precision'))
             response = make_response(geojson)
             response.headers['Content-Type'] = 'application/json'
             return response, HTTPStatus.OK
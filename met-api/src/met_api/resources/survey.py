@@ -26,6 +26,8 @@ from met_api.models.pagination_options import PaginationOptions
 from met_api.models.survey_search_options import SurveySearchOptions
 from met_api.schemas.survey import SurveySchema
 from met_api.services.survey_service import SurveyService
+from met_api.utils.http_cache import conditional_response
+from met_api.utils.read_replica import read_only
 from met_api.utils.roles import Role
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
@@ -44,6 +46,7 @@ class Survey(Resource):
     @staticmethod
     @cross_origin(origins=allowedorigins())
     @auth.optional
+    @read_only
     def get(survey_id):
         """Fetch a single survey matching the provided id."""
         try:
@@ -54,6 +57,8 @@ class Survey(Resource):
             else:
                 survey_record = SurveyService().get_open(survey_id)
             if survey_record:
+                if not user_id:
+                    return conditional_response(survey_record)
                 return survey_record, HTTPStatus.OK
 
             return 'Survey was not found', HTTPStatus.INTERNAL_SERVER_ERROR
@@ -71,6 +76,7 @@ class Surveys(Resource):
     @staticmethod
     @_jwt.requires_auth
     @cross_origin(origins=allowedorigins())
+    @read_only
     def get():
         """Fetch surveys."""
         try:
@@ -26,6 +26,8 @@ from met_api.schemas import utils as schema_utils
 from met_api.schemas.widget import WidgetSchema
 from met_api.schemas.widget_item import WidgetItemSchema
 from met_api.services.widget_service import WidgetService
+from met_api.utils.http_cache import conditional_response
+from met_api.utils.read_replica import read_only
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
 
@@ -42,11 +44,12 @@ class Widget(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @read_only
     def get(engagement_id):
         """Fetch a list of widgets by engagement_id."""
         try:
             widgets = WidgetService().get_widgets_by_engagement_id(engagement_id)
-            return jsonify(widgets), HTTPStatus.OK
+            return conditional_response(widgets)
         except (KeyError, ValueError) as err:
             return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
 
@@ -15,7 +15,7 @@
 
 from http import HTTPStatus
 
-from flask import jsonify, request
+from flask import request
 from flask_cors import cross_origin
 from flask_restx import Namespace, Resource
 
@@ -23,6 +23,8 @@ from met_api.auth import jwt as _jwt
 from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.widget_documents import WidgetDocumentsSchema
 from met_api.services.widget_documents_service import WidgetDocumentService
+from met_api.utils.http_cache import conditional_response
+from met_api.utils.read_replica import read_only
 from met_api.utils.util import allowedorigins, cors_preflight
 
 
@@ -38,11 +40,12 @@ class WidgetDocuments(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @read_only
     def get(widget_id):
         """Fetch a list of document widgets by engagement_id."""
         try:
             documents = WidgetDocumentService().get_documents_by_widget_id(widget_id)
-            return jsonify(documents), HTTPStatus.OK
+            return conditional_response(documents)
         except (KeyError, ValueError) as err:
             return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
 
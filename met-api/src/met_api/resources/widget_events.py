@@ -15,7 +15,7 @@
 
 from http import HTTPStatus
 
-from flask import jsonify, request
+from flask import request
 from flask_cors import cross_origin
 from flask_restx import Namespace, Resource
 
@@ -23,6 +23,8 @@ from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.event_item import EventItemSchema
 from met_api.schemas.widget_events import WidgetEventsSchema
 from met_api.services.widget_events_service import WidgetEventsService
+from met_api.utils.http_cache import conditional_response
+from met_api.utils.read_replica import read_only
 from met_api.utils.token_info import TokenInfo
 from met_api.utils.util import allowedorigins, cors_preflight
 
@@ -39,11 +41,12 @@ class WidgetEvents(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @read_only
     def get(widget_id):
         """Fetch a list of widgets by engagement_id."""
         try:
             events = WidgetEventsService().get_event_by_widget_id(widget_id)
-            return jsonify(WidgetEventsSchema().dump(events, many=True)), HTTPStatus.OK
+            return conditional_response(WidgetEventsSchema().dump(events, many=True))
         except (KeyError, ValueError) as err:
             return str(err), HTTPStatus.INTERNAL_SERVER_ERROR
 
@@ -15,7 +15,7 @@
 import json
 from http import HTTPStatus
 
-from flask import jsonify, request
+from flask import make_response, request
 from flask_cors import cross_origin
 from flask_restx import Namespace, Resource
 
@@ -23,6 +23,8 @@ from met_api.auth import jwt as _jwt
 from met_api.exceptions.business_exception import BusinessException
 from met_api.schemas.widget_map import WidgetMapSchema
 from met_api.services.widget_map_service import WidgetMapService
+from met_api.utils.http_cache import conditional_response
+from met_api.utils.read_replica import read_only
 from met_api.utils.roles import Role
 from met_api.utils.util import allowedorigins, cors_preflight
 
@@ -38,11 +40,12 @@ class Map(Resource):
 
     @staticmethod
     @cross_origin(origins=allowedorigins())
+    @read_only
     def get(widget_id):
         """Get map widget."""
         try:
             widget_map = WidgetMapService().get_map(widget_id)
-            return jsonify(WidgetMapSchema().dump(widget_map, many=True)), HTTPStatus.OK
+            return conditional_response(WidgetMapSchema().dump(widget_map, many=True))
         except BusinessException as err:
             return str(err), err.status_code
 
@@ -72,3 +75,30 @@ class Map(Resource):
             return WidgetMapSchema().dump(widget_map), HTTPStatus.OK
         except BusinessException as err:
             return str(err), err.status_code
+
+
+@cors_preflight('GET, OPTIONS')
+@API.route('/geojson')
+class MapGeojson(Resource):
+    """Resource for the shape of a map widget."""
+
+    @staticmethod
+    @cross_origin(origins=allowedorigins())
+    @read_only
+    def get(widget_id):
+        """Get the compact geojson of the map widget.
+
+        The response is cacheable for a year when requested with ?v=<geojson_hash>, as a new upload changes the hash;
+        otherwise it has to be revalidated with its ETag.
+        """
+        widget_map = WidgetMapService().get_map_geojson(widget_id)
+        if widget_map is None:
+            return 'Map not found', HTTPStatus.NOT_FOUND
+        response = make_response(widget_map.geojson)
+        response.headers['Content-Type'] = 'application/geo+json'
+        response.set_etag(widget_map.geojson_hash)
+        if request.args.get('v') == widget_map.geojson_hash:
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response.headers['Cache-Control'] = 'public, no-cache'
+        return response.make_conditional(request)
@@ -5,7 +5,7 @@ Manages the engagement
 
 from datetime import datetime
 
-from marshmallow import EXCLUDE, Schema, ValidationError, fields, validate, validates_schema
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, pre_dump, validate, validates_schema
 
 from met_api.constants.engagement_status import Status, SubmissionStatus
 from met_api.constants.comment_status import Status as CommentStatus
@@ -48,31 +48,31 @@ class EngagementSchema(Schema):
     tenant_id = fields.Str(data_key='tenant_id')
     is_internal = fields.Bool(data_key='is_internal')
 
+    @pre_dump(pass_many=True)
+    def load_submission_counts(self, data, many, **kwargs):
+        """Count the submissions of the engagements being dumped by status, with one query for all of them."""
+        if 'submissions_meta_data' not in self.dump_fields:
+            return data
+        # imported here since the models import this schema
+        from met_api.models.submission import Submission  # pylint: disable=import-outside-toplevel
+        engagements = data if many else [data]
+        survey_ids = [engagement.surveys[0].id for engagement in engagements if engagement and engagement.surveys]
+        self.context['engagement_submission_counts'] = Submission.get_status_counts_by_survey_ids(survey_ids)
+        return data
+
     def get_submissions_meta_data(self, obj):
         """Get the meta data of the submissions made in the survey."""
-        if not obj or len(obj.surveys) == 0:
-            return {
-                'total': 0,
-                'pending': 0,
-                'approved': 0,
-                'rejected': 0,
-                'needs_further_review': 0
-            }
-        submissions = obj.surveys[0].submissions
+        counts = {}
+        if obj and len(obj.surveys) > 0:
+            counts = self.context.get('engagement_submission_counts', {}).get(obj.surveys[0].id, {})
         return {
-            'total': len(submissions),
-            'pending': self._count_comments_by_status(submissions, CommentStatus.Pending.value),
-            'approved': self._count_comments_by_status(submissions, CommentStatus.Approved.value),
-            'rejected': self._count_comments_by_status(submissions, CommentStatus.Rejected.value),
-            'needs_further_review': self._count_comments_by_status(
-                submissions,
-                CommentStatus.Needs_further_review.value)
+            'total': sum(counts.values()),
+            'pending': counts.get(CommentStatus.Pending.value, 0),
+            'approved': counts.get(CommentStatus.Approved.value, 0),
+            'rejected': counts.get(CommentStatus.Rejected.value, 0),
+            'needs_further_review': counts.get(CommentStatus.Needs_further_review.value, 0)
         }
 
-    def _count_comments_by_status(self, submissios, status):
-        return len([submission for submission in submissios
-                    if submission.comment_status_id == status])
-
     def get_submission_status(self, obj):
         """Get the submission status of the engagement."""
         if obj.status_id == Status.Draft.value or obj.status_id == Status.Scheduled.value:
@@ -101,3 +101,12 @@ class EngagementSchema(Schema):
 
         if data.get('start_date') > data.get('end_date'):
             raise ValidationError('From date must be before to date')
+
+
+class EngagementListSchema(EngagementSchema):
+    """Schema for an engagement in a listing, without its rich content, status blocks and survey forms."""
+
+    class Meta(EngagementSchema.Meta):  # pylint: disable=too-few-public-methods
+        """Exclude the rich content, the status blocks and the forms of the surveys."""
+
+        exclude = ('content', 'rich_content', 'rich_description', 'status_block', 'surveys.form_json')
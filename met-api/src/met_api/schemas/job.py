@@ -0,0 +1,30 @@
+"""Job schema class.
+
+Manages the background jobs
+"""
+
+from marshmallow import EXCLUDE, Schema, fields
+from marshmallow_enum import EnumField
+
+from met_api.constants.job import JobStatus
+
+
+class JobSchema(Schema):
+    """Schema for a background job, without its result."""
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Exclude unknown fields in the deserialized output."""
+
+        unknown = EXCLUDE
+
+    id = fields.Int(data_key='id')
+    job_type = fields.Str(data_key='job_type')
+    params = fields.Dict(data_key='params')
+    status = EnumField(JobStatus)
+    progress = fields.Int(data_key='progress')
+    error = fields.Str(data_key='error')
+    result_file_name = fields.Str(data_key='result_file_name')
+    created_by = fields.Str(data_key='created_by')
+    created_date = fields.Str(data_key='created_date')
+    started_date = fields.Str(data_key='started_date')
+    completed_date = fields.Str(data_key='completed_date')
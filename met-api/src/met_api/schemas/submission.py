@@ -41,6 +41,15 @@ class SubmissionSchema(Schema):
     staff_note = fields.List(fields.Nested(StaffNoteSchema))
 
 
+class SubmissionListSchema(SubmissionSchema):
+    """Schema for a submission in a listing, without the submitted form and the staff notes."""
+
+    class Meta(SubmissionSchema.Meta):  # pylint: disable=too-few-public-methods
+        """Exclude the submitted form and the staff notes."""
+
+        exclude = ('submission_json', 'staff_note')
+
+
 class PublicSubmissionSchema(Schema):
     """Schema for a public submission."""
 
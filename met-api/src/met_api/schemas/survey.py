@@ -3,7 +3,7 @@
 Manages the survey
 """
 
-from marshmallow import EXCLUDE, Schema, fields
+from marshmallow import EXCLUDE, Schema, fields, pre_dump
 from .engagement import EngagementSchema
 from met_api.constants.comment_status import Status
 
@@ -30,18 +30,38 @@ class SurveySchema(Schema):
     comments_meta_data = fields.Method('get_comments_meta_data')
     tenant_id = fields.Str(data_key='tenant_id')
 
+    @pre_dump(pass_many=True)
+    def load_submission_counts(self, data, many, **kwargs):
+        """Count the submissions of the surveys being dumped by status, with one query for all of them."""
+        if 'comments_meta_data' not in self.dump_fields:
+            return data
+        # imported here since the models import this schema
+        from met_api.models.submission import Submission  # pylint: disable=import-outside-toplevel
+        surveys = data if many else [data]
+        # the surveys of a listing come with their counts
+        survey_ids = [survey.id for survey in surveys if survey and survey.comment_counts is None]
+        self.context['survey_submission_counts'] = Submission.get_status_counts_by_survey_ids(survey_ids)
+        return data
+
     def get_comments_meta_data(self, obj):
         """Get the meta data of the comments made in the survey."""
+        counts = obj.comment_counts
+        if counts is None:
+            counts = self.context.get('survey_submission_counts', {}).get(obj.id, {})
         return {
-            'total': len(obj.submissions),
-            'pending': self._count_comments_by_status(obj.submissions, Status.Pending.value),
-            'approved': self._count_comments_by_status(obj.submissions, Status.Approved.value),
-            'rejected': self._count_comments_by_status(obj.submissions, Status.Rejected.value),
-            'needs_further_review': self._count_comments_by_status(
-                obj.submissions,
-                Status.Needs_further_review.value)
+            'total': sum(counts.values()),
+            'pending': counts.get(Status.Pending.value, 0),
+            'approved': counts.get(Status.Approved.value, 0),
+            'rejected': counts.get(Status.Rejected.value, 0),
+            'needs_further_review': counts.get(Status.Needs_further_review.value, 0)
         }
 
-    def _count_comments_by_status(self, submissios, status):
-        return len([submission for submission in submissios
-                    if submission.comment_status_id == status])
+
+class SurveyListSchema(SurveySchema):
+    """Schema for a survey in a listing, without the form and with the summary of its engagement only."""
+
+    class Meta(SurveySchema.Meta):  # pylint: disable=too-few-public-methods
+        """Exclude the form of the survey and the content, surveys and submissions of the engagement."""
+
+        exclude = ('form_json', 'engagement.surveys', 'engagement.content', 'engagement.rich_content',
+                   'engagement.rich_description', 'engagement.status_block', 'engagement.submissions_meta_data')
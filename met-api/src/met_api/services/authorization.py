@@ -5,8 +5,7 @@ This module is to handle authorization related queries.
 from flask_restx import abort
 
 from met_api.constants.membership_type import MembershipType
-from met_api.models.membership import Membership as MembershipModel
-from met_api.models.staff_user import StaffUser as StaffUserModel
+from met_api.services.identity_service import IdentityService
 from met_api.utils.user_context import UserContext, user_context
 
 
@@ -32,10 +31,9 @@ def check_auth(**kwargs):
 def _has_team_membership(kwargs, user_from_context) -> bool:
     eng_id = kwargs.get('engagement_id', None)
     external_id = user_from_context.sub
-    user = StaffUserModel.get_user_by_external_id(external_id)
-    if not eng_id or not user:
+    if not eng_id:
         return False
-    memberships = MembershipModel.find_by_engagement_and_user_id(eng_id, user.id)
+    memberships = IdentityService.get_active_memberships(external_id, eng_id)
     # TODO when multiple memberships are supported , iterate list and check role.
     if memberships and memberships[0].type == MembershipType.TEAM_MEMBER:
         return True
@@ -16,8 +16,9 @@
 """Service for receipt generation."""
 import base64
 import json
-import os
 import re
+import threading
+import time
 from http import HTTPStatus
 
 import requests
@@ -26,14 +27,28 @@ from flask import current_app
 from met_api.config import _Config
 
 
+# Renew the token a little before it expires, so it does not expire in flight
+TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
+
 class CdogsApiService:
-    """cdogs api Service class."""
+    """cdogs api Service class.
 
-    def __init__(self):
-        """Initiate class."""
-        self.access_token = self._get_access_token()
+    The access token, the HTTP connections and the templates known to be cached by CDOGS are shared by all the
+    instances of the process, so creating the service for each export is cheap.
+    """
 
-    file_dir = os.path.dirname(os.path.realpath('__file__'))
+    _session = requests.Session()
+    _lock = threading.Lock()
+    _access_token = None
+    _access_token_expiry = 0
+    # template hash code -> monotonic time until which the template is known to be cached by CDOGS
+    _verified_templates = {}
+
+    @property
+    def access_token(self):
+        """Return the shared access token, requesting a new one when it is missing or about to expire."""
+        return self._get_access_token()
 
     def generate_document(self, template_hash_code: str, data, options):
         """Generate document based on template and data."""
@@ -51,12 +66,12 @@ class CdogsApiService:
         url = f'{_Config.CDOGS_BASE_URL}/api/v2/template/{template_hash_code}/render'
         return self._post_generate_document(json_request_body, headers, url)
 
-    @staticmethod
-    def _post_generate_document(json_request_body, headers, url):
-        response = requests.post(url, data=json_request_body, headers=headers)
+    @classmethod
+    def _post_generate_document(cls, json_request_body, headers, url):
+        response = cls._session.post(url, data=json_request_body, headers=headers)
         return response
 
-    def upload_template(self, template_file_path):
+    def upload_template(self, template_name: str, template_bytes: bytes):
         """Upload template and get hashcode."""
         headers = {
             'Authorization': f'Bearer {self.access_token}'
@@ -64,51 +79,81 @@ class CdogsApiService:
 
         url = f'{_Config.CDOGS_BASE_URL}/api/v2/template'
 
-        with open(template_file_path, 'rb') as file_handle:
-            template = {'template': ('template', file_handle, 'multipart/form-data')}
+        template = {'template': ('template', template_bytes, 'multipart/form-data')}
 
-            current_app.logger.info('Uploading template %s', template_file_path)
-            print('Uploading template %s', template_file_path)
-            response = self._post_upload_template(headers, url, template)
+        current_app.logger.info('Uploading template %s', template_name)
+        response = self._post_upload_template(headers, url, template)
 
-            if response.status_code == HTTPStatus.OK:
-                if response.headers.get('X-Template-Hash') is None:
-                    raise ValueError('Data not found')
+        if response.status_code == HTTPStatus.OK:
+            if response.headers.get('X-Template-Hash') is None:
+                raise ValueError('Data not found')
 
-                current_app.logger.info('Returning new hash %s', response.headers['X-Template-Hash'])
-                print('Returning new hash %s', response.headers['X-Template-Hash'])
-                return response.headers['X-Template-Hash']
+            current_app.logger.info('Returning new hash %s', response.headers['X-Template-Hash'])
+            self.mark_template_verified(response.headers['X-Template-Hash'])
+            return response.headers['X-Template-Hash']
 
-            response_json = json.loads(response.content)
+        response_json = json.loads(response.content)
 
-            if response.status_code == HTTPStatus.METHOD_NOT_ALLOWED and response_json['detail'] is not None:
-                match = re.findall(r"Hash '(.*?)'", response_json['detail'])
-                if match:
-                    current_app.logger.info('Template already hashed with code %s', match[0])
-                    print('Template already hashed with code %s', match[0])
-                    return match[0]
+        if response.status_code == HTTPStatus.METHOD_NOT_ALLOWED and response_json['detail'] is not None:
+            match = re.findall(r"Hash '(.*?)'", response_json['detail'])
+            if match:
+                current_app.logger.info('Template already hashed with code %s', match[0])
+                self.mark_template_verified(match[0])
+                return match[0]
 
-                raise ValueError('Data not found')
-            return ''
+            raise ValueError('Data not found')
+        return ''
 
-    @staticmethod
-    def _post_upload_template(headers, url, template):
-        response = requests.post(url, headers=headers, files=template)
+    @classmethod
+    def _post_upload_template(cls, headers, url, template):
+        response = cls._session.post(url, headers=headers, files=template)
         return response
 
     def check_template_cached(self, template_hash_code: str):
-        """Check if template of given hashcode is cached."""
+        """Check if template of given hashcode is cached.
+
+        A positive answer is remembered for CDOGS_TEMPLATE_CHECK_TTL seconds, so that consecutive exports do not
+        ask again.
+        """
+        if self._verified_templates.get(template_hash_code, 0) > time.monotonic():
+            return True
+
         headers = {
             'Authorization': f'Bearer {self.access_token}'
         }
 
         url = f'{_Config.CDOGS_BASE_URL}/api/v2/template/{template_hash_code}'
 
-        response = requests.get(url, headers=headers)
-        return response.status_code == HTTPStatus.OK
-
-    @staticmethod
-    def _get_access_token():
+        response = self._session.get(url, headers=headers)
+        if response.status_code != HTTPStatus.OK:
+            return False
+        self.mark_template_verified(template_hash_code)
+        return True
+
+    @classmethod
+    def mark_template_verified(cls, template_hash_code: str):
+        """Remember that the template is cached by CDOGS."""
+        ttl = int(current_app.config.get('CDOGS_TEMPLATE_CHECK_TTL'))
+        cls._verified_templates[template_hash_code] = time.monotonic() + ttl
+
+    @classmethod
+    def forget_template(cls, template_hash_code: str):
+        """Forget a template which CDOGS no longer has cached."""
+        cls._verified_templates.pop(template_hash_code, None)
+
+    @classmethod
+    def _get_access_token(cls):
+        with cls._lock:
+            if cls._access_token and time.monotonic() < cls._access_token_expiry:
+                return cls._access_token
+            response_json = cls._request_access_token()
+            cls._access_token = response_json['access_token']
+            cls._access_token_expiry = \
+                time.monotonic() + int(response_json.get('expires_in', 300)) - TOKEN_EXPIRY_MARGIN_SECONDS
+            return cls._access_token
+
+    @classmethod
+    def _request_access_token(cls):
         token_url = _Config.CDOGS_TOKEN_URL
         service_client = _Config.CDOGS_SERVICE_CLIENT
         service_client_secret = _Config.CDOGS_SERVICE_CLIENT_SECRET
@@ -116,7 +161,7 @@ class CdogsApiService:
         basic_auth_encoded = base64.b64encode(
             bytes(f'{service_client}:{service_client_secret}', 'utf-8')).decode('utf-8')
         data = 'grant_type=client_credentials'
-        response = requests.post(
+        response = cls._session.post(
             token_url,
             data=data,
             headers={
@@ -126,4 +171,4 @@ class CdogsApiService:
         )
 
         response_json = response.json()
-        return response_json['access_token']
+        return response_json
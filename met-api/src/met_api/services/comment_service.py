@@ -1,29 +1,39 @@
 """Service for comment management."""
-import itertools
 from datetime import datetime
+from typing import Callable, Iterator
+
+from flask import current_app
 
 from met_api.constants.comment_status import Status
 from met_api.models import Survey as SurveyModel
 from met_api.models.comment import Comment
-from met_api.models.membership import Membership as MembershipModel
 from met_api.models.pagination_options import PaginationOptions
 from met_api.models.submission import Submission as SubmissionModel
-from met_api.models.staff_user import StaffUser as StaffUserModel
 from met_api.schemas.comment import CommentSchema
 from met_api.schemas.submission import SubmissionSchema
 from met_api.schemas.survey import SurveySchema
 from met_api.services.document_generation_service import DocumentGenerationService
+from met_api.services.identity_service import IdentityService
 from met_api.utils.roles import Role
+from met_api.utils.spreadsheet import stream_csv, stream_xlsx
+from met_api.utils.survey_form import get_component_index
 from met_api.utils.token_info import TokenInfo
 
+COMMENT_SHEET_HEADER = ['Comment No.', 'Submitted', 'Author', 'Location', 'Comment', 'Attachments', 'Published',
+                        'Deferral Note', 'Rejection Note', 'Reviewer', 'Project', 'PCP Title', 'Export Date']
+COMMENT_SHEET_CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
 
 class CommentService:
     """Comment management service."""
 
     otherdateformat = '%Y-%m-%d'
 
-    wizard_display = 'wizard'
-    form_display = 'form'
+    csv_format = 'csv'
+    xlsx_format = 'xlsx'
 
     @staticmethod
     def get_comment(comment_id) -> CommentSchema:
@@ -61,11 +71,7 @@ class CommentService:
         if not (user_id := TokenInfo.get_id()):
             return False
 
-        user = StaffUserModel.get_user_by_external_id(user_id)
-        if not user:
-            return False
-
-        memberships = MembershipModel.find_by_engagement_and_user_id(engagement.engagement_id, user.id)
+        memberships = IdentityService.get_active_memberships(user_id, engagement.engagement_id)
         return bool(memberships)
 
     @classmethod
@@ -117,31 +123,13 @@ class CommentService:
             'submission_id': survey_submission.get('id', None)
         }
 
-    @classmethod
-    def extract_components(cls, survey_form: dict):
-        """Extract components from survey form."""
-        components = list(survey_form.get('components', []))
-
-        is_comments_from_form_survey = survey_form.get('display') == cls.form_display
-        if is_comments_from_form_survey:
-            return components
-
-        is_comments_from_wizard_survey = survey_form.get('display') == cls.wizard_display
-        if is_comments_from_wizard_survey:
-            return list(itertools.chain.from_iterable([page.get('components', []) for page in components]))
-        return []
-
     @classmethod
     def extract_comments_from_survey(cls, survey_submission: SubmissionSchema, survey: SurveySchema):
         """Extract comments from survey submission."""
-        survey_form = survey.get('form_json', {})
-        components = cls.extract_components(survey_form)
-        if len(components) == 0:
-            return []
-        # get the 'id' for each component that has 'inputType' text and filter out the rest.
-        text_component_keys = [
-            component.get('key', None) for component in components
-            if component.get('inputType', None) == 'text']
+        component_index = get_component_index(survey.get('id'), survey.get('updated_date'),
+                                              survey.get('form_json', {}))
+        # the 'key' of each component that has 'inputType' text
+        text_component_keys = component_index.text_component_keys
         submission = survey_submission.get('submission_json', {})
         comments = [cls.__form_comment(key, submission.get(key, ''), survey_submission, survey)
                     for key in text_component_keys if submission.get(key, '') != '']
@@ -166,3 +154,36 @@ class CommentService:
             'comments': formatted_comments
         }
         return DocumentGenerationService().generate_comment_sheet(data=data)
+
+    @classmethod
+    def stream_comments_sheet(cls, survey_id, file_format: str,
+                              report_progress: Callable[[int], None] = None) -> Iterator:
+        """Stream the comment sheet of the survey as a csv or xlsx file, with the columns of the CDOGS template.
+
+        When given, report_progress is called with the number of comments written so far, a chunk at a time.
+        """
+        chunk_size = int(current_app.config.get('COMMENT_EXPORT_CHUNK_SIZE'))
+        export_date = str(datetime.utcnow())
+
+        def rows():
+            comments = Comment.stream_comments_by_survey_id(survey_id, chunk_size)
+            for index, comment in enumerate(comments, start=1):
+                yield [comment.id, str(comment.submission_date), '', '', comment.text, '', '', '', '',
+                       comment.reviewed_by, '', '', export_date]
+                if report_progress and index % chunk_size == 0:
+                    report_progress(index)
+
+        if file_format == cls.xlsx_format:
+            return stream_xlsx(COMMENT_SHEET_HEADER, rows(), sheet_name='Comments')
+        return stream_csv(COMMENT_SHEET_HEADER, rows())
+
+    @classmethod
+    def export_comments_sheet(cls, survey_id, file_format: str, report_progress: Callable[[int], None]):
+        """Stream the comment sheet of the survey as bytes, reporting the percentage done; used by the export jobs."""
+        comment_count = Comment.count_comments_by_survey_id(survey_id)
+        content = cls.stream_comments_sheet(
+            survey_id, file_format,
+            report_progress=lambda written: report_progress(written * 100 // max(comment_count, 1)))
+        if file_format != cls.xlsx_format:
+            content = (chunk.encode('utf-8') for chunk in content)
+        return content, f'comments_sheet.{file_format}', COMMENT_SHEET_CONTENT_TYPES[file_format]
@@ -14,7 +14,11 @@
 
 
 """Service for document generation."""
+import hashlib
 import os
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Tuple
 
 from flask import current_app
 
@@ -23,6 +27,10 @@ from met_api.services.cdogs_api_service import CdogsApiService
 from met_api.utils.enums import GeneratedDocumentTypes
 
 
+templates_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'generated_documents_carbone_templates'))
+COMMENT_SHEET_TEMPLATE = 'staff_comments_sheet.xlsx'
+
+
 class DocumentGenerationService:  # pylint:disable=too-few-public-methods
     """document generation Service class."""
 
@@ -30,6 +38,20 @@ class DocumentGenerationService:  # pylint:disable=too-few-public-methods
         """Initiate the class."""
         self.cdgos_api_service = CdogsApiService()
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_template_file(template_filename) -> Tuple[bytes, str]:
+        """Return the content of a local template and its hash code, which is how CDOGS identifies it."""
+        with open(os.path.join(templates_dir, template_filename), 'rb') as file_handle:
+            template_bytes = file_handle.read()
+        return template_bytes, hashlib.sha256(template_bytes).hexdigest()
+
+    @staticmethod
+    def precompute_templates():
+        """Read and hash the local templates once, so that the exports do not have to."""
+        for template_filename in os.listdir(templates_dir):
+            DocumentGenerationService.get_template_file(template_filename)
+
     def generate_comment_sheet(self, data):
         """Generate comment sheet."""
         comment_sheet_template: GeneratedDocumentTemplate = GeneratedDocumentTemplate() \
@@ -37,24 +59,7 @@ class DocumentGenerationService:  # pylint:disable=too-few-public-methods
         if comment_sheet_template is None:
             raise ValueError('Template not saved in DB')
 
-        template_cached = False
-        if comment_sheet_template.hash_code:
-            current_app.logger.info('Checking if template %s is cached', comment_sheet_template.hash_code)
-            template_cached = self.cdgos_api_service.check_template_cached(comment_sheet_template.hash_code)
-
-        if comment_sheet_template.hash_code is None or not template_cached:
-            current_app.logger.info('Uploading new template')
-
-            file_dir = os.path.dirname(os.path.realpath('__file__'))
-            comment_sheet_template_path = os.path.join(
-                file_dir,
-                'src/met_api/generated_documents_carbone_templates/staff_comments_sheet.xlsx'
-            )
-            new_hash_code = self.cdgos_api_service.upload_template(template_file_path=comment_sheet_template_path)
-            if not new_hash_code:
-                raise ValueError('Unable to obtain valid hashcode')
-            comment_sheet_template.hash_code = new_hash_code
-            comment_sheet_template.save()
+        self._ensure_template_uploaded(comment_sheet_template, COMMENT_SHEET_TEMPLATE)
 
         options = {
                 'cachereport': False,
@@ -64,8 +69,37 @@ class DocumentGenerationService:  # pylint:disable=too-few-public-methods
         }
 
         current_app.logger.info('Generating comment_sheet')
-        return self.cdgos_api_service.generate_document(
+        response = self.cdgos_api_service.generate_document(
             template_hash_code=comment_sheet_template.hash_code,
             data=data,
             options=options
         )
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            # CDOGS dropped the template from its cache since it was last verified
+            current_app.logger.info('Template %s no longer cached, uploading it again',
+                                    comment_sheet_template.hash_code)
+            self.cdgos_api_service.forget_template(comment_sheet_template.hash_code)
+            self._ensure_template_uploaded(comment_sheet_template, COMMENT_SHEET_TEMPLATE)
+            response = self.cdgos_api_service.generate_document(
+                template_hash_code=comment_sheet_template.hash_code,
+                data=data,
+                options=options
+            )
+        return response
+
+    def _ensure_template_uploaded(self, document_template: GeneratedDocumentTemplate, template_filename):
+        """Upload the local template unless CDOGS is known to have it cached, and save its hash code."""
+        template_bytes, local_hash_code = self.get_template_file(template_filename)
+        if document_template.hash_code == local_hash_code:
+            current_app.logger.info('Checking if template %s is cached', document_template.hash_code)
+            if self.cdgos_api_service.check_template_cached(document_template.hash_code):
+                return
+
+        current_app.logger.info('Uploading new template')
+        new_hash_code = self.cdgos_api_service.upload_template(template_name=template_filename,
+                                                               template_bytes=template_bytes)
+        if not new_hash_code:
+            raise ValueError('Unable to obtain valid hashcode')
+        if new_hash_code != document_template.hash_code:
+            document_template.hash_code = new_hash_code
+            document_template.save()
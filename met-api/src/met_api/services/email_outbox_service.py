@@ -0,0 +1,124 @@
+"""Service to queue and deliver emails through the email outbox."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from flask import current_app
+
+from met_api.models.db import db
+from met_api.models.email_outbox import EmailOutbox as EmailOutboxModel
+from met_api.models.participant import Participant as ParticipantModel
+from met_api.services.rest_service import RestService
+from met_api.utils import notification
+
+
+class RateLimiter:  # pylint: disable=too-few-public-methods
+    """Spread the calls made by all the threads evenly, to stay under a number of calls per second."""
+
+    def __init__(self, calls_per_second: float):
+        """Create a limiter; a rate of zero or less disables it."""
+        self._interval = 1 / calls_per_second if calls_per_second > 0 else 0
+        self._next_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self, count: int = 1):
+        """Block until the caller is allowed to make the next count calls."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call)
+            self._next_call = call_at + self._interval * count
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+class EmailOutboxService:
+    """Email outbox management service."""
+
+    @staticmethod
+    def enqueue(email: dict, participant_ids: List[int]) -> None:
+        """Queue the email for each of the participants and commit.
+
+        The email dict holds the entity_type, entity_id, action, subject, body, args and template_id.
+        Queuing the same email again for a participant is ignored, so a failed run can be repeated safely.
+        """
+        EmailOutboxModel.add_recipients(email, participant_ids)
+        db.session.commit()
+
+    @classmethod
+    def deliver_due(cls) -> int:
+        """Deliver the pending emails which are due, batch by batch, until none are left.
+
+        Each batch is locked for the length of its delivery so that several workers can drain the outbox
+        together; a worker which dies leaves its batch pending for the next run.
+        """
+        batch_size = int(current_app.config.get('EMAIL_OUTBOX_BATCH_SIZE'))
+        delivered = 0
+        while mails := EmailOutboxModel.claim_due(batch_size):
+            delivered += cls._deliver(mails)
+            db.session.commit()
+        return delivered
+
+    @staticmethod
+    def _deliver(mails: List[EmailOutboxModel]) -> int:
+        """Send the claimed emails in chunks, concurrently, and record the outcome against each of them."""
+        config = current_app.config
+        rate_limiter = RateLimiter(float(config.get('EMAIL_OUTBOX_RATE_LIMIT')))
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        chunks = EmailOutboxService._get_chunks(mails, int(config.get('EMAIL_OUTBOX_SEND_CHUNK_SIZE')))
+        service_account_token = RestService.get_service_account_token()
+
+        def send(chunk: List[dict]):
+            with app.app_context():
+                rate_limiter.wait(len(chunk))
+                return notification.send_email_batch(chunk, service_account_token=service_account_token)
+
+        with ThreadPoolExecutor(max_workers=int(config.get('EMAIL_OUTBOX_MAX_WORKERS'))) as executor:
+            futures = [(chunk_mails, executor.submit(send, chunk_payloads)) for chunk_mails, chunk_payloads in chunks]
+
+        delivered = 0
+        for chunk_mails, future in futures:
+            if error := future.exception():
+                results = [{'status': 'FAILED', 'error': str(error)}] * len(chunk_mails)
+            else:
+                results = future.result()
+            delivered += EmailOutboxService._record_results(chunk_mails, results)
+        return delivered
+
+    @staticmethod
+    def _get_chunks(mails: List[EmailOutboxModel], chunk_size: int) -> List[Tuple[List[EmailOutboxModel], List[dict]]]:
+        """Return the emails in chunks, each with the payloads to send.
+
+        The payloads are built here so that the sending threads do not touch the database session.
+        """
+        participants = ParticipantModel.query \
+            .filter(ParticipantModel.id.in_({mail.participant_id for mail in mails})) \
+            .all()
+        email_addresses = ParticipantModel.decode_emails([participant.email_address for participant in participants])
+        email_addresses = dict(zip((participant.id for participant in participants), email_addresses))
+        payloads = [{
+            'subject': mail.subject,
+            'email': email_addresses.get(mail.participant_id),
+            'html_body': mail.body,
+            'args': mail.args,
+            'template_id': mail.template_id,
+        } for mail in mails]
+        return [(mails[start:start + chunk_size], payloads[start:start + chunk_size])
+                for start in range(0, len(mails), chunk_size)]
+
+    @staticmethod
+    def _record_results(mails: List[EmailOutboxModel], results: List[dict]) -> int:
+        """Mark the emails sent or failed from their send results, and return how many were sent."""
+        max_attempts = int(current_app.config.get('EMAIL_OUTBOX_MAX_ATTEMPTS'))
+        retry_delay = int(current_app.config.get('EMAIL_OUTBOX_RETRY_DELAY'))
+        delivered = 0
+        for mail, result in zip(mails, results):
+            if result.get('status') == 'SENT':
+                mail.mark_sent()
+                delivered += 1
+            else:
+                current_app.logger.error(f'<Delivery of outbox email {mail.id} failed: {result.get("error")}')
+                mail.mark_failed(result.get('error'), max_attempts, retry_delay)
+        return delivered
@@ -0,0 +1,63 @@
+"""Service for the cache of the public engagement pages.
+
+The anonymous reads of a published or closed engagement are served from the cache for a few seconds. The entries are
+kept per tenant and engagement along with the version of the engagement they were built for, a change to the
+engagement or one of its widgets moves the engagement to a new version, which drops the entries of every tenant.
+The cache is local to the process, the other processes catch up once their entries expire.
+"""
+import uuid
+from typing import Callable, Optional
+
+from flask import current_app, g
+
+from met_api.models.widget import Widget as WidgetModel
+from met_api.utils import read_replica
+from met_api.utils.cache import cache
+
+
+class EngagementCacheService:
+    """Public engagement cache service."""
+
+    @staticmethod
+    def get_or_build(kind: str, engagement_id, build: Callable[[], Optional[dict]]) -> Optional[dict]:
+        """Get the cached payload of the engagement, building and caching it on a miss.
+
+        Empty payloads, like the ones of engagements which are not public, are not cached.
+        """
+        timeout = int(current_app.config.get('PUBLIC_ENGAGEMENT_CACHE_TIMEOUT'))
+        if timeout <= 0:
+            return build()
+
+        key = f'public_engagement_{kind}_{getattr(g, "tenant_id", None)}_{engagement_id}'
+        version = cache.get(EngagementCacheService._version_key(engagement_id))
+        cached = cache.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        # build from the primary, a replica which has not caught up with an invalidation would cache stale payloads
+        with read_replica.primary():
+            payload = build()
+        if payload:
+            if version is None:
+                version = uuid.uuid4().hex
+                cache.set(EngagementCacheService._version_key(engagement_id), version, timeout=0)
+            cache.set(key, (version, payload), timeout=timeout)
+        return payload
+
+    @staticmethod
+    def invalidate(engagement_id):
+        """Drop the cached payloads of the engagement."""
+        if engagement_id is None:
+            return
+        cache.delete(EngagementCacheService._version_key(engagement_id))
+
+    @staticmethod
+    def invalidate_widget(widget_id):
+        """Drop the cached payloads of the engagement of the widget."""
+        widget = WidgetModel.get_widget_by_id(widget_id)
+        if widget:
+            EngagementCacheService.invalidate(widget.engagement_id)
+
+    @staticmethod
+    def _version_key(engagement_id) -> str:
+        return f'public_engagement_version_{int(engagement_id)}'
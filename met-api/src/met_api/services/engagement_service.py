@@ -11,10 +11,13 @@ from met_api.models.engagement import Engagement as EngagementModel
 from met_api.models.engagement_status_block import EngagementStatusBlock as EngagementStatusBlockModel
 from met_api.models.pagination_options import PaginationOptions
 from met_api.models.submission import Submission as SubmissionModel
-from met_api.schemas.engagement import EngagementSchema
+from met_api.schemas.engagement import EngagementListSchema, EngagementSchema
 from met_api.services import authorization
+from met_api.services.email_outbox_service import EmailOutboxService
+from met_api.services.engagement_cache_service import EngagementCacheService
 from met_api.services.membership_service import MembershipService
 from met_api.services.object_storage_service import ObjectStorageService
+from met_api.services.widget_service import WidgetService
 from met_api.utils import email_util, notification
 from met_api.utils.enums import SourceAction, SourceType
 from met_api.utils.roles import Role
@@ -30,6 +33,32 @@ class EngagementService:
     @staticmethod
     def get_engagement(engagement_id, user_id) -> EngagementSchema:
         """Get Engagement by the id."""
+        if user_id is None:
+            # the page of a public engagement is the same for every anonymous user
+            return EngagementCacheService.get_or_build(
+                'detail', engagement_id, lambda: EngagementService._get_engagement(engagement_id, None))
+        return EngagementService._get_engagement(engagement_id, user_id)
+
+    @staticmethod
+    def get_engagement_bundle(engagement_id, user_id):
+        """Get the engagement along with its widgets and the content of the widgets, for the engagement page."""
+        if user_id is None:
+            return EngagementCacheService.get_or_build(
+                'bundle', engagement_id, lambda: EngagementService._get_engagement_bundle(engagement_id, None))
+        return EngagementService._get_engagement_bundle(engagement_id, user_id)
+
+    @staticmethod
+    def _get_engagement_bundle(engagement_id, user_id):
+        engagement = EngagementService._get_engagement(engagement_id, user_id)
+        if not engagement:
+            return None
+        return {
+            'engagement': engagement,
+            'widgets': WidgetService.get_widgets_with_content_by_engagement_id(engagement_id),
+        }
+
+    @staticmethod
+    def _get_engagement(engagement_id, user_id) -> EngagementSchema:
         engagement_model: EngagementModel = EngagementModel.find_by_id(engagement_id)
 
         if engagement_model:
@@ -59,7 +88,7 @@ class EngagementService:
             statuses=statuses,
             assigned_engagements=assigned_engagements,
         )
-        engagements_schema = EngagementSchema(many=True)
+        engagements_schema = EngagementListSchema(many=True)
         engagements = engagements_schema.dump(items)
 
         if include_banner_url:
@@ -96,6 +125,8 @@ class EngagementService:
     def close_engagements_due():
         """Close published engagements that are due for a closeout."""
         engagements = EngagementModel.close_engagements_due()
+        for engagement in engagements:
+            EngagementCacheService.invalidate(engagement.id)
         results = [EngagementService._send_closeout_emails(engagement) for engagement in engagements]
         return results
 
@@ -169,6 +200,7 @@ class EngagementService:
         engagement = EngagementModel.update_engagement(request_json)
         if (status_block := request_json.get('status_block')) is not None:
             EngagementService._save_or_update_eng_block(engagement_id, status_block)
+        EngagementCacheService.invalidate(engagement_id)
 
         return engagement
 
@@ -205,6 +237,7 @@ class EngagementService:
                 raise ValueError('Engagement to update was not found')
         if survey_block:
             EngagementService._save_or_update_eng_block(engagement_id, survey_block)
+        EngagementCacheService.invalidate(engagement_id)
         return EngagementModel.find_by_id(engagement_id)
 
     @staticmethod
@@ -220,16 +253,21 @@ class EngagementService:
 
     @staticmethod
     def _send_closeout_emails(engagement: EngagementModel) -> None:
-        """Send the engagement closeout emails.Throws error if fails."""
+        """Queue the engagement closeout emails in the email outbox.Throws error if fails."""
         subject, body, args = EngagementService._render_email_template(engagement)
-        participants = SubmissionModel.get_engaged_participants(engagement.id)
+        participant_ids = SubmissionModel.get_engaged_participant_ids(engagement.id)
         template_id = current_app.config.get('ENGAGEMENT_CLOSEOUT_EMAIL_TEMPLATE_ID', None)
-        emails = [participant.decode_email(participant.email_address) for participant in participants]
-        # Removes duplicated records
-        emails = list(set(emails))
+        email = {
+            'entity_type': SourceType.ENGAGEMENT.value,
+            'entity_id': engagement.id,
+            'action': SourceAction.CLOSED.value,
+            'subject': subject,
+            'body': body,
+            'args': args,
+            'template_id': template_id,
+        }
         try:
-            [notification.send_email(subject=subject, email=email_address, html_body=body,
-                                     args=args, template_id=template_id) for email_address in emails]
+            EmailOutboxService.enqueue(email, participant_ids)
         except Exception as exc:  # noqa: B902
             current_app.logger.error('<Notification for engagement closeout failed', exc)
             raise BusinessException(
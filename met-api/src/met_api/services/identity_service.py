@@ -0,0 +1,38 @@
+"""Service for the identity of the user of a request.
+
+The staff user and the memberships of the user are read once per request, the later checks of the request are
+served from flask.g.
+"""
+from typing import List, Optional
+
+from met_api.models.membership import Membership as MembershipModel
+from met_api.models.staff_user import StaffUser as StaffUserModel
+from met_api.utils.user_context import cached_for_token
+
+
+class IdentityService:
+    """Identity resolution service."""
+
+    @staticmethod
+    def get_staff_user(external_id) -> Optional[StaffUserModel]:
+        """Get the staff user with the external id."""
+        if not external_id:
+            return None
+        return cached_for_token(f'staff_user:{external_id}',
+                                lambda: StaffUserModel.get_user_by_external_id(external_id))
+
+    @staticmethod
+    def get_active_memberships(external_id, engagement_id) -> List[MembershipModel]:
+        """Get the active memberships of the staff user with the external id in the engagement."""
+        user = IdentityService.get_staff_user(external_id)
+        if not user or not engagement_id:
+            return []
+        memberships = cached_for_token(f'active_memberships:{external_id}',
+                                       lambda: MembershipModel.find_by_user_and_status(user.id))
+        return [membership for membership in memberships if membership.engagement_id == int(engagement_id)]
+
+    @staticmethod
+    def get_team_memberships(external_id) -> List[MembershipModel]:
+        """Get the team member memberships of the staff user with the external id."""
+        return cached_for_token(f'team_memberships:{external_id}',
+                                lambda: MembershipModel.find_by_user_id(external_id))
@@ -0,0 +1,132 @@
+"""Service for the background jobs, like the exports which take too long to run within a request.
+
+The results are written to a temporary file as they are produced, then stored in the object storage, or in the job
+result folder when the object storage is not configured, and streamed back when downloaded.
+"""
+import os
+import shutil
+import tempfile
+import uuid
+from http import HTTPStatus
+from typing import Iterable, Iterator
+
+from flask import current_app
+
+from met_api.constants.job import JobType
+from met_api.exceptions.business_exception import BusinessException
+from met_api.models.db import db
+from met_api.models.job import Job as JobModel
+from met_api.schemas.job import JobSchema
+from met_api.services.comment_service import CommentService
+from met_api.services.object_storage_service import ObjectStorageService
+from met_api.utils.token_info import TokenInfo
+
+
+# Bytes read at a time from a stored result
+RESULT_CHUNK_SIZE = 64 * 1024
+
+
+class JobService:
+    """Background job management service."""
+
+    @classmethod
+    def submit(cls, job_type: str, params: dict) -> dict:
+        """Queue a job for the job worker and return it."""
+        try:
+            job_type = JobType(job_type)
+        except ValueError as exc:
+            raise BusinessException(error=f'Unknown job type {job_type}.', status_code=HTTPStatus.BAD_REQUEST) from exc
+        cls._validate_params(job_type, params)
+        job = JobModel(job_type=job_type.value, params=params)
+        job.save()
+        return JobSchema().dump(job)
+
+    @staticmethod
+    def _validate_params(job_type: JobType, params: dict):
+        if job_type == JobType.COMMENT_SHEET:
+            if not params.get('survey_id'):
+                raise BusinessException(error='A survey id is required.', status_code=HTTPStatus.BAD_REQUEST)
+            file_format = params.setdefault('format', CommentService.csv_format)
+            if file_format not in (CommentService.csv_format, CommentService.xlsx_format):
+                raise BusinessException(error=f'Unsupported format {file_format}.',
+                                        status_code=HTTPStatus.BAD_REQUEST)
+
+    @classmethod
+    def get_job(cls, job_id: int) -> dict:
+        """Return the status and progress of a job submitted by the current user."""
+        return JobSchema().dump(cls._get_own_job(job_id))
+
+    @classmethod
+    def get_job_result(cls, job_id: int) -> JobModel:
+        """Return a completed job submitted by the current user, with its result."""
+        job = cls._get_own_job(job_id)
+        if job.result_key is None:
+            raise BusinessException(error='The job has no result yet.', status_code=HTTPStatus.CONFLICT)
+        return job
+
+    @staticmethod
+    def stream_result(job: JobModel) -> Iterator[bytes]:
+        """Stream the stored result of the job, a chunk at a time."""
+        if ObjectStorageService.is_configured():
+            return ObjectStorageService().stream_file(job.result_key, RESULT_CHUNK_SIZE)
+        return JobService._stream_file(os.path.join(current_app.config.get('JOB_RESULT_FOLDER'), job.result_key))
+
+    @staticmethod
+    def _stream_file(path: str) -> Iterator[bytes]:
+        with open(path, 'rb') as result_file:
+            while chunk := result_file.read(RESULT_CHUNK_SIZE):
+                yield chunk
+
+    @staticmethod
+    def _store_result(job: JobModel, content: Iterable[bytes], file_name: str) -> str:
+        """Write the content to a temporary file as it is produced, store the file and return its key."""
+        result_key = f'job_{job.id}_{uuid.uuid4().hex}_{file_name}'
+        with tempfile.TemporaryFile() as result_file:
+            for chunk in content:
+                result_file.write(chunk)
+            result_file.seek(0)
+            if ObjectStorageService.is_configured():
+                ObjectStorageService().upload_file(result_key, result_file)
+            else:
+                result_folder = current_app.config.get('JOB_RESULT_FOLDER')
+                os.makedirs(result_folder, exist_ok=True)
+                with open(os.path.join(result_folder, result_key), 'wb') as stored_file:
+                    shutil.copyfileobj(result_file, stored_file)
+        return result_key
+
+    @staticmethod
+    def _get_own_job(job_id: int) -> JobModel:
+        job = JobModel.find_by_id(job_id)
+        if job is None or job.created_by != TokenInfo.get_id():
+            raise BusinessException(error='Job not found.', status_code=HTTPStatus.NOT_FOUND)
+        return job
+
+    @classmethod
+    def run_pending(cls) -> int:
+        """Run the pending jobs one after the other until none are left, and return how many were run.
+
+        Several workers can run this together; each job is claimed by a single worker. The jobs left running by a
+        worker which died are run again once they are stale.
+        """
+        stale_timeout = int(current_app.config.get('JOB_STALE_TIMEOUT'))
+        run_count = 0
+        while job := JobModel.claim_next(stale_timeout):
+            cls._run(job)
+            run_count += 1
+        return run_count
+
+    @staticmethod
+    def _run(job: JobModel):
+        current_app.logger.info(f'<Running {job.job_type} job {job.id}')
+        try:
+            if job.job_type == JobType.COMMENT_SHEET.value:
+                content, file_name, content_type = CommentService.export_comments_sheet(
+                    job.params.get('survey_id'), job.params.get('format'), report_progress=job.update_progress)
+            else:
+                raise ValueError(f'Unknown job type {job.job_type}')
+            job.complete(JobService._store_result(job, content, file_name), file_name, content_type)
+        except Exception as exc:  # NOQA # pylint:disable=broad-except
+            current_app.logger.error('<Job %s failed: %s', job.id, exc)
+            db.session.rollback()
+            job.fail(str(exc))
+        db.session.commit()
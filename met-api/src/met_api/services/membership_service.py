@@ -5,6 +5,7 @@ from met_api.constants.membership_type import MembershipType
 from met_api.models import StaffUser as StaffUserModel
 from met_api.models.engagement import Engagement as EngagementModel
 from met_api.models.membership import Membership as MembershipModel
+from met_api.services.identity_service import IdentityService
 from met_api.services.staff_user_service import KEYCLOAK_SERVICE
 from met_api.utils.enums import KeycloakGroupName, KeycloakGroups, MembershipStatus
 from ..exceptions.business_exception import BusinessException
@@ -73,7 +74,7 @@ class MembershipService:
     @staticmethod
     def get_assigned_engagements(user_id):
         """Get memberships by user id."""
-        return MembershipModel.find_by_user_id(user_id)
+        return IdentityService.get_team_memberships(user_id)
 
     @staticmethod
     def get_engagements_by_user(user_id):
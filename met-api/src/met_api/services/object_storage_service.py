@@ -2,14 +2,15 @@
 """Service for object storage management."""
 import os
 import uuid
-from typing import List
+from typing import IO, Iterator, List
 
 import requests
-from aws_requests_auth.aws_auth import AWSRequestsAuth
+from flask import current_app
 from markupsafe import string
 
 from met_api.config import _Config
 from met_api.schemas.document import Document
+from met_api.utils.sigv4 import SigV4Signer
 
 
 class ObjectStorageService:
@@ -20,6 +21,31 @@ class ObjectStorageService:
         """Get the object url."""
         return f'https://{_Config.S3_HOST}/{_Config.S3_BUCKET}/{filename}' if filename else ''
 
+    @staticmethod
+    def is_configured() -> bool:
+        """Return whether the credentials, host and bucket of the object storage are set."""
+        return None not in (_Config.S3_ACCESS_KEY_ID, _Config.S3_SECRET_ACCESS_KEY, _Config.S3_HOST, _Config.S3_BUCKET)
+
+    def upload_file(self, filename: str, file: IO[bytes]):
+        """Upload the file to the bucket, streaming it from its current position."""
+        response = requests.put(self._presign_url('PUT', filename), data=file)
+        response.raise_for_status()
+
+    def stream_file(self, filename: str, chunk_size: int) -> Iterator[bytes]:
+        """Stream the content of a file of the bucket, a chunk at a time."""
+        response = requests.get(self._presign_url('GET', filename), stream=True)
+        response.raise_for_status()
+        return response.iter_content(chunk_size)
+
+    def _presign_url(self, method: str, filename: str) -> str:
+        signer = SigV4Signer(
+            access_key=_Config.S3_ACCESS_KEY_ID,
+            secret_key=_Config.S3_SECRET_ACCESS_KEY,
+            region=_Config.S3_REGION,
+            service=_Config.S3_SERVICE)
+        expires_in = int(current_app.config.get('S3_PRESIGNED_URL_EXPIRY'))
+        return signer.presign_url(method, self.get_url(filename), expires_in)
+
     def get_auth_headers(self, documents: List[Document]):
         """Get the s3 auth headers or the provided documents."""
         if(_Config.S3_ACCESS_KEY_ID is None or
@@ -30,23 +56,24 @@ class ObjectStorageService:
             return {'status': 'Configuration Issue',
                     'message': 'accesskey is None or secretkey is None or S3 host is None or formsbucket is None'}, 500
 
+        # one signer for the whole batch; the documents are signed locally, without calling the object storage
+        signer = SigV4Signer(
+            access_key=_Config.S3_ACCESS_KEY_ID,
+            secret_key=_Config.S3_SECRET_ACCESS_KEY,
+            region=_Config.S3_REGION,
+            service=_Config.S3_SERVICE)
+        expires_in = int(current_app.config.get('S3_PRESIGNED_URL_EXPIRY'))
         for file in documents:
             s3sourceuri = file.get('s3sourceuri', None)
             filenamesplittext = os.path.splitext(file.get('filename'))
             uniquefilename = f'{uuid.uuid4()}{filenamesplittext[1]}'
-            auth = AWSRequestsAuth(
-                    aws_access_key=_Config.S3_ACCESS_KEY_ID,
-                    aws_secret_access_key=_Config.S3_SECRET_ACCESS_KEY,
-                    aws_host=_Config.S3_HOST,
-                    aws_region=_Config.S3_REGION,
-                    aws_service=_Config.S3_SERVICE)
-
             s3uri = s3sourceuri if s3sourceuri is not None else self.get_url(uniquefilename)
-            response = requests.put(
-                s3uri, data=None, auth=auth) if s3sourceuri is None else requests.get(s3uri, auth=auth)
+            method = 'PUT' if s3sourceuri is None else 'GET'
+            headers = signer.sign_headers(method, s3uri)
 
             file['filepath'] = s3uri
-            file['authheader'] = response.request.headers['Authorization']
-            file['amzdate'] = response.request.headers['x-amz-date']
+            file['authheader'] = headers['Authorization']
+            file['amzdate'] = headers['x-amz-date']
+            file['presignedurl'] = signer.presign_url(method, s3uri, expires_in)
             file['uniquefilename'] = uniquefilename if s3sourceuri is None else ''
         return documents
@@ -14,14 +14,14 @@
 
 
 """Service for shapefile service."""
-import json
 import os
-import shutil
+import tempfile
 import zipfile
 from http import HTTPStatus
 
 import geopandas as gpd
 from flask import current_app
+from shapely.ops import transform
 from werkzeug.utils import secure_filename
 
 from met_api.exceptions.business_exception import BusinessException
@@ -31,26 +31,61 @@ class ShapefileService:   # pylint: disable=too-few-public-methods
     """This is the shapefile related service class."""
 
     @staticmethod
-    def convert_to_geojson(file):
-        """Convert to Geojson."""
+    def convert_to_geojson(file, simplify_tolerance=None, coordinate_precision=None):
+        """Convert to Geojson.
+
+        The geometries are simplified with the tolerance, in the units of the shapefile, and their coordinates
+        rounded to the number of decimals of the precision; both default to the configuration and are skipped
+        when not set.
+        """
+        if simplify_tolerance in (None, ''):
+            simplify_tolerance = current_app.config.get('SHAPEFILE_SIMPLIFY_TOLERANCE')
+        if coordinate_precision in (None, ''):
+            coordinate_precision = current_app.config.get('SHAPEFILE_COORDINATE_PRECISION')
+        try:
+            simplify_tolerance = float(simplify_tolerance) if simplify_tolerance not in (None, '') else None
+            coordinate_precision = int(coordinate_precision) if coordinate_precision not in (None, '') else None
+        except ValueError as exc:
+            raise BusinessException(
+                error='Invalid simplification tolerance or coordinate precision.',
+                status_code=HTTPStatus.BAD_REQUEST) from exc
+
         upload_folder = current_app.config.get('SHAPEFILE_UPLOAD_FOLDER')
-        shapefile_path = ShapefileService._unzip_file(file, upload_folder)
-        geojson_string = ShapefileService._get_geojson(shapefile_path)
-        # Clean up uploaded files
-        shutil.rmtree(os.path.join(upload_folder))
-        return geojson_string
+        ShapefileService._create_upload_dir(upload_folder)
+        # Each conversion gets its own directory, removed once done, so concurrent uploads do not collide
+        with tempfile.TemporaryDirectory(dir=upload_folder) as upload_dir:
+            shapefile_path = ShapefileService._unzip_file(file, upload_dir)
+            return ShapefileService._get_geojson(shapefile_path, simplify_tolerance, coordinate_precision)
 
     @staticmethod
-    def _get_geojson(shapefile_path):
+    def _get_geojson(shapefile_path, simplify_tolerance=None, coordinate_precision=None):
         gdf = gpd.read_file(shapefile_path)
-        geojson_dict = json.loads(gdf.to_json())
-        geojson_string = json.dumps(geojson_dict)
-        return geojson_string
+        if simplify_tolerance:
+            gdf.geometry = gdf.geometry.simplify(simplify_tolerance, preserve_topology=True)
+        if coordinate_precision is not None:
+            gdf.geometry = gdf.geometry.apply(
+                lambda geometry: ShapefileService._round_geometry(geometry, coordinate_precision))
+        return gdf.to_json()
+
+    @staticmethod
+    def _round_geometry(geometry, precision: int):
+        """Round the coordinates of the geometry to the number of decimals.
+
+        GeoSeries.set_precision needs geopandas 0.14 and shapely 2, which the python of the image cannot install.
+        """
+        if geometry is None or geometry.is_empty:
+            return geometry
+
+        def round_coordinates(*axes):
+            # shapely passes either the sequences of all the x, y (and z) values or the values of a single point
+            return tuple(round(axis, precision) if isinstance(axis, (int, float))
+                         else tuple(round(value, precision) for value in axis) for axis in axes)
+
+        return transform(round_coordinates, geometry)
 
     @staticmethod
     def _unzip_file(file, upload_folder):
         filename = secure_filename(file.filename)
-        ShapefileService._create_upload_dir(upload_folder)
         file_path = os.path.join(upload_folder, filename)
         file.save(file_path)
         with zipfile.ZipFile(file_path, 'r') as zip_ref:
@@ -77,4 +112,4 @@ class ShapefileService:   # pylint: disable=too-few-public-methods
         is_exist = os.path.exists(upload_folder)
         if not is_exist:
             # Create a new directory because it does not exist
-            os.makedirs(upload_folder)
+            os.makedirs(upload_folder, exist_ok=True)
@@ -18,7 +18,7 @@ from met_api.models.pagination_options import PaginationOptions
 from met_api.models.participant import Participant as ParticipantModel
 from met_api.models.staff_note import StaffNote
 from met_api.models.submission import Submission
-from met_api.schemas.submission import PublicSubmissionSchema, SubmissionSchema
+from met_api.schemas.submission import PublicSubmissionSchema, SubmissionListSchema, SubmissionSchema
 from met_api.services.comment_service import CommentService
 from met_api.services.email_verification_service import EmailVerificationService
 from met_api.services.survey_service import SurveyService
@@ -248,7 +248,7 @@ class SubmissionService:
             advanced_search_filters if any(advanced_search_filters.values()) else None
         )
         return {
-            'items': SubmissionSchema(many=True, exclude=['submission_json']).dump(items),
+            'items': SubmissionListSchema(many=True).dump(items),
             'total': total
         }
 
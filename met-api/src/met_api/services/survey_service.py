@@ -8,8 +8,9 @@ from met_api.models import Survey as SurveyModel
 from met_api.models.pagination_options import PaginationOptions
 from met_api.models.survey_search_options import SurveySearchOptions
 from met_api.schemas.engagement import EngagementSchema
-from met_api.schemas.survey import SurveySchema
+from met_api.schemas.survey import SurveyListSchema, SurveySchema
 from met_api.services import authorization
+from met_api.services.engagement_cache_service import EngagementCacheService
 from met_api.services.membership_service import MembershipService
 from met_api.services.object_storage_service import ObjectStorageService
 from met_api.utils.roles import Role
@@ -57,7 +58,7 @@ class SurveyService:
             pagination_options,
             search_options,
         )
-        surveys_schema = SurveySchema(many=True)
+        surveys_schema = SurveyListSchema(many=True)
 
         return {
             'items': surveys_schema.dump(items),
@@ -83,7 +84,7 @@ class SurveyService:
         """Create survey."""
         cls.validate_create_fields(survey_data)
 
-        return SurveyModel.create_survey({
+        survey = SurveyModel.create_survey({
             'name': survey_data.get('name'),
             'form_json': {
                 'display': survey_data.get('display', cls.formio_survey_default_display),
@@ -91,6 +92,8 @@ class SurveyService:
             },
             'engagement_id': survey_data.get('engagement_id', None),
         })
+        EngagementCacheService.invalidate(survey.engagement_id)
+        return survey
 
     @classmethod
     def clone(cls, data, survey_id):
@@ -100,11 +103,13 @@ class SurveyService:
         if not survey_to_clone:
             raise KeyError('Survey to clone was not found')
 
-        return SurveyModel.create_survey({
+        survey = SurveyModel.create_survey({
             'name': data.get('name'),
             'form_json': survey_to_clone.get('form_json'),
             'engagement_id': data.get('engagement_id', None),
         })
+        EngagementCacheService.invalidate(survey.engagement_id)
+        return survey
 
     @classmethod
     def update(cls, data: SurveySchema):
@@ -154,7 +159,9 @@ class SurveyService:
     def link(cls, survey_id, engagement_id):
         """Update survey."""
         cls.validate_link_fields(survey_id, engagement_id)
-        return SurveyModel.link_survey(survey_id, engagement_id)
+        survey = SurveyModel.link_survey(survey_id, engagement_id)
+        EngagementCacheService.invalidate(engagement_id)
+        return survey
 
     @classmethod
     def validate_link_fields(cls, survey_id, engagement_id):
@@ -175,7 +182,9 @@ class SurveyService:
     def unlink(cls, survey_id, engagement_id):
         """Unlink survey."""
         cls.validate_unlink_fields(survey_id, engagement_id)
-        return SurveyModel.unlink_survey(survey_id)
+        survey = SurveyModel.unlink_survey(survey_id)
+        EngagementCacheService.invalidate(engagement_id)
+        return survey
 
     @classmethod
     def validate_unlink_fields(cls, survey_id, engagement_id):
@@ -19,6 +19,7 @@ class TenantService:
             for tenant in tenants:
                 key = tenant.short_name.upper()
                 cache.set(f'tenant_{key}', tenant)
+                cache.set(f'tenant_id_{tenant.id}', tenant)
         except SQLAlchemyError as e:
             current_app.logger.info('Error on building cache {}', e)
 
@@ -7,6 +7,7 @@ from anytree.search import find_by_attr
 
 from met_api.exceptions.business_exception import BusinessException
 from met_api.models.widget_documents import WidgetDocuments as WidgetDocumentsModel
+from met_api.services.engagement_cache_service import EngagementCacheService
 from met_api.utils.enums import WidgetDocumentType
 
 
@@ -65,6 +66,7 @@ class WidgetDocumentService:
 
         doc = WidgetDocumentService._create_document_from_dict(doc_details, parent_id, widget_id)
         doc.save()
+        EngagementCacheService.invalidate_widget(widget_id)
         return doc
 
     @staticmethod
@@ -109,6 +111,7 @@ class WidgetDocumentService:
             raise BusinessException(
                 error='Document to update was not found.',
                 status_code=HTTPStatus.BAD_REQUEST)
+        EngagementCacheService.invalidate_widget(widget_id)
         return updated_document
 
     @staticmethod
@@ -119,6 +122,7 @@ class WidgetDocumentService:
             raise BusinessException(
                 error='Document to remove was not found.',
                 status_code=HTTPStatus.BAD_REQUEST)
+        EngagementCacheService.invalidate_widget(widget_id)
         return delete_document
 
     @staticmethod
@@ -133,6 +137,7 @@ class WidgetDocumentService:
         } for index, document in enumerate(documents)]
 
         WidgetDocumentsModel.update_documents(document_sort_mappings)
+        EngagementCacheService.invalidate_widget(widget_id)
 
     @staticmethod
     def _validate_document_ids(widget_id, documents):
@@ -5,6 +5,7 @@ from typing import List
 from met_api.exceptions.business_exception import BusinessException
 from met_api.models.event_item import EventItem as EventItemsModel
 from met_api.models.widget_events import WidgetEvents as WidgetEventsModel
+from met_api.services.engagement_cache_service import EngagementCacheService
 
 
 class WidgetEventsService:
@@ -24,6 +25,7 @@ class WidgetEventsService:
         if event_items:
             WidgetEventsService._create_event_item_models(event_items, event.id)
         event.commit()
+        EngagementCacheService.invalidate_widget(widget_id)
         return event
 
     @staticmethod
@@ -37,6 +39,7 @@ class WidgetEventsService:
         if event_item_details:
             WidgetEventsService._create_event_item_models(event_item_details, event.id)
         event.commit()
+        EngagementCacheService.invalidate_widget(widget_id)
         return event
 
     @staticmethod
@@ -97,6 +100,7 @@ class WidgetEventsService:
 
         WidgetEventsService._update_from_dict(event_item, request_json)
         event_item.commit()
+        EngagementCacheService.invalidate_widget(widget_id)
 
         return EventItemsModel.find_by_id(item_id)
 
@@ -110,6 +114,7 @@ class WidgetEventsService:
                 status_code=HTTPStatus.BAD_REQUEST)
 
         event.delete()
+        EngagementCacheService.invalidate_widget(widget_id)
 
     @staticmethod
     # TODO Move this to common.
@@ -132,6 +137,7 @@ class WidgetEventsService:
         } for widget_event_db in widget_events_db]
 
         updated_widget_events = WidgetEventsModel.update_widget_events_bulk(widget_events_update_mapping)
+        EngagementCacheService.invalidate_widget(widget_id)
         return updated_widget_events
 
     def save_widget_events_bulk(self, widget_id, widget_events: list, user_id):
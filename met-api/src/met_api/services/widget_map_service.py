@@ -1,9 +1,13 @@
 """Service for Widget Map management."""
 from http import HTTPStatus
 
+from flask import current_app
+
 from met_api.exceptions.business_exception import BusinessException
 from met_api.models.widget_map import WidgetMap as WidgetMapModel
+from met_api.services.engagement_cache_service import EngagementCacheService
 from met_api.services.shapefile_service import ShapefileService
+from met_api.utils.geojson import compact_geojson
 
 
 class WidgetMapService:
@@ -15,17 +19,27 @@ class WidgetMapService:
         widget_map = WidgetMapModel.get_map(widget_id)
         return widget_map
 
+    @staticmethod
+    def get_map_geojson(widget_id) -> WidgetMapModel:
+        """Get the map of the widget which has a shape, or None."""
+        return WidgetMapModel.get_map_geojson(widget_id)
+
     @staticmethod
     def create_map(widget_id, map_details: dict, shape_file):
         """Create map for the widget."""
         geojson = None
         map_data = dict(map_details)
         if shape_file:
-            geojson = ShapefileService().convert_to_geojson(shape_file)
-            map_data['geojson'] = geojson
+            geojson = ShapefileService().convert_to_geojson(
+                shape_file,
+                simplify_tolerance=map_data.pop('simplify_tolerance', None),
+                coordinate_precision=map_data.pop('coordinate_precision', None))
+            precision = int(current_app.config.get('WIDGET_MAP_COORDINATE_PRECISION'))
+            map_data['geojson'], map_data['bbox'], map_data['geojson_hash'] = compact_geojson(geojson, precision)
             map_data['file_name'] = shape_file.filename
         widget_map = WidgetMapService._create_map_model(widget_id, map_data)
         widget_map.commit()
+        EngagementCacheService.invalidate_widget(widget_id)
         return widget_map
 
     @staticmethod
@@ -36,7 +50,9 @@ class WidgetMapService:
             raise BusinessException(
                 error='Invalid widgets and map',
                 status_code=HTTPStatus.BAD_REQUEST)
-        return WidgetMapModel.update_map(widget_id, request_json)
+        widget_map = WidgetMapModel.update_map(widget_id, request_json)
+        EngagementCacheService.invalidate_widget(widget_id)
+        return widget_map
 
     @staticmethod
     def _create_map_model(widget_id, map_data: dict):
@@ -48,5 +64,7 @@ class WidgetMapService:
         map_model.engagement_id = map_data.get('engagement_id')
         map_model.file_name = map_data.get('file_name')
         map_model.geojson = map_data.get('geojson')
+        map_model.bbox = map_data.get('bbox')
+        map_model.geojson_hash = map_data.get('geojson_hash')
         map_model.flush()
         return map_model
@@ -1,11 +1,18 @@
 """Service for widget management."""
 from http import HTTPStatus
 
+from met_api.constants.widget import WidgetType
 from met_api.exceptions.business_exception import BusinessException
 from met_api.models.widget import Widget as WidgetModel
 from met_api.models.widget_item import WidgetItem
 from met_api.schemas.widget import WidgetSchema
+from met_api.schemas.widget_events import WidgetEventsSchema
 from met_api.schemas.widget_item import WidgetItemSchema
+from met_api.schemas.widget_map import WidgetMapSchema
+from met_api.services.engagement_cache_service import EngagementCacheService
+from met_api.services.widget_documents_service import WidgetDocumentService
+from met_api.services.widget_events_service import WidgetEventsService
+from met_api.services.widget_map_service import WidgetMapService
 
 
 class WidgetService:
@@ -19,6 +26,22 @@ class WidgetService:
         widgets = widget_schema.dump(widgets_records)
         return widgets
 
+    @staticmethod
+    def get_widgets_with_content_by_engagement_id(engagement_id):
+        """Get widgets by engagement id, along with the documents, events and maps of the widgets."""
+        widgets = WidgetService.get_widgets_by_engagement_id(engagement_id)
+        for widget in widgets:
+            widget_type = widget.get('widget_type_id')
+            if widget_type == WidgetType.DOCUMENTS.value:
+                widget['documents'] = WidgetDocumentService.get_documents_by_widget_id(widget['id'])
+            elif widget_type == WidgetType.EVENTS.value:
+                events = WidgetEventsService.get_event_by_widget_id(widget['id'])
+                widget['events'] = WidgetEventsSchema().dump(events, many=True)
+            elif widget_type == WidgetType.MAP.value:
+                widget_map = WidgetMapService.get_map(widget['id'])
+                widget['map'] = WidgetMapSchema().dump(widget_map, many=True)
+        return widgets
+
     @staticmethod
     def get_widget_items_by_widget_id(widget_id):
         """Get widget items by widget id."""
@@ -39,6 +62,7 @@ class WidgetService:
 
         widget_data['sort_index'] = sort_index + 1
         created_widget = WidgetModel.create_widget(widget_data)
+        EngagementCacheService.invalidate(engagement_id)
         return WidgetSchema().dump(created_widget)
 
     @staticmethod
@@ -64,6 +88,7 @@ class WidgetService:
         ]
 
         WidgetModel.update_widgets(widget_sort_mappings)
+        EngagementCacheService.invalidate(engagement_id)
 
     @staticmethod
     def _validate_widget_ids(engagement_id, widgets):
@@ -140,6 +165,7 @@ class WidgetService:
         self.delete_removed_widget_items(widget_items, widget_items_db)
         self.create_added_widget_items(widget_items, widget_items_db, user_id)
         self.update_widget_items_sorting(widget_items, widget_id, user_id)
+        EngagementCacheService.invalidate_widget(widget_id)
         return widget_items
 
     @staticmethod
@@ -148,4 +174,5 @@ class WidgetService:
         widgets = WidgetModel.remove_widget(engagement_id, widget_id)
         if not widgets:
             raise ValueError('Widget to remove was not found')
+        EngagementCacheService.invalidate(engagement_id)
         return widgets
@@ -0,0 +1,128 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Connection pool and statement timeout of the database engines.
+
+The pool records how long the checkouts wait for a connection once it is exhausted, and a slow checkout is logged
+along with the state of the pool. The statement timeout is set when the connection is opened, or at the start of
+every transaction when connecting through PgBouncer in transaction mode, which does not keep the session settings.
+"""
+import logging
+import time
+from threading import Lock
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+logger = logging.getLogger(__name__)
+
+# Checkouts which waited longer than this many seconds for a connection are logged
+SLOW_CHECKOUT_SECONDS = 1
+
+
+class MeteredQueuePool(QueuePool):
+    """Queue pool which records the checkouts that had to wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        """Create the pool."""
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = Lock()
+        self.wait_count = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeout_count = 0
+
+    def _do_get(self):
+        # Only a checkout which finds no idle connection once the overflow is exhausted blocks
+        if not self._pool.empty() or self._max_overflow < 0 or self._overflow < self._max_overflow:
+            return super()._do_get()
+
+        started = time.monotonic()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.timeout_count += 1
+            logger.error('Timed out waiting for a database connection: %s', get_pool_metrics(self))
+            raise
+        finally:
+            self._record_wait(time.monotonic() - started)
+
+    def _record_wait(self, seconds: float):
+        with self._metrics_lock:
+            self.wait_count += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        if seconds > SLOW_CHECKOUT_SECONDS:
+            logger.warning('Waited %.2fs for a database connection: %s', seconds, get_pool_metrics(self))
+
+
+def get_pool_metrics(pool) -> dict:
+    """Return the usage of the pool, along with its waits when it is metered."""
+    metrics = {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': pool.overflow(),
+    }
+    if isinstance(pool, MeteredQueuePool):
+        metrics.update({
+            'waits': pool.wait_count,
+            'wait_seconds': round(pool.wait_seconds, 3),
+            'max_wait_seconds': round(pool.max_wait_seconds, 3),
+            'timeouts': pool.timeout_count,
+        })
+    return metrics
+
+
+def get_engine_options(config) -> dict:
+    """Return the SQLAlchemy engine options of the pool and timeout settings of the config."""
+    options = {
+        'poolclass': MeteredQueuePool,
+        'pool_size': int(config.get('DB_POOL_SIZE')),
+        'max_overflow': int(config.get('DB_MAX_OVERFLOW')),
+        'pool_timeout': int(config.get('DB_POOL_TIMEOUT')),
+        'pool_recycle': int(config.get('DB_POOL_RECYCLE')),
+        'pool_pre_ping': True,
+    }
+    statement_timeout = int(config.get('DB_STATEMENT_TIMEOUT'))
+    if statement_timeout > 0 and not _is_pgbouncer(config):
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    return options
+
+
+def init_engines(app, db):
+    """Set the statement timeout at the start of the transactions of the engines when connecting through PgBouncer.
+
+    PgBouncer in transaction mode hands each transaction to any server connection, so neither the startup options
+    nor a SET on the session can be relied on.
+    """
+    statement_timeout = int(app.config.get('DB_STATEMENT_TIMEOUT'))
+    if statement_timeout <= 0 or not _is_pgbouncer(app.config):
+        return
+
+    def set_local_statement_timeout(conn):
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute('SET LOCAL statement_timeout = %s', (statement_timeout,))
+        finally:
+            cursor.close()
+
+    with app.app_context():
+        for bind in [None, *(app.config.get('SQLALCHEMY_BINDS') or {})]:
+            event.listen(db.get_engine(app, bind=bind), 'begin', set_local_statement_timeout)
+
+
+def _is_pgbouncer(config) -> bool:
+    return str(config.get('DB_PGBOUNCER')).lower() == 'true'
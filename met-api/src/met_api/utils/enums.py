@@ -76,3 +76,4 @@ class SourceAction(Enum):
 
     CREATED = 'created'
     PUBLISHED = 'published'
+    CLOSED = 'closed'
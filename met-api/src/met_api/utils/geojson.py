@@ -0,0 +1,63 @@
+"""GeoJSON helpers."""
+import hashlib
+import json
+from typing import List, Optional, Tuple
+
+
+def compact_geojson(geojson: str, precision: int) -> Tuple[str, Optional[List[float]], str]:
+    """Return the geojson quantized to the number of decimals, its bounding box and its hash.
+
+    Coordinates are rounded, the points a rounding makes equal to the previous one are dropped and the
+    output has no whitespace. The bounding box is [min longitude, min latitude, max longitude, max latitude].
+    """
+    document = json.loads(geojson)
+    bounds = [float('inf'), float('inf'), float('-inf'), float('-inf')]
+    _compact_object(document, precision, bounds)
+    compact = json.dumps(document, separators=(',', ':'))
+    bbox = bounds if bounds[0] != float('inf') else None
+    return compact, bbox, hashlib.sha256(compact.encode('utf-8')).hexdigest()
+
+
+def _compact_object(document, precision: int, bounds: List[float]):
+    if isinstance(document, list):
+        for item in document:
+            _compact_object(item, precision, bounds)
+        return
+    if not isinstance(document, dict):
+        return
+    if 'coordinates' in document:
+        document['coordinates'] = _compact_coordinates(document['coordinates'], document.get('type'), precision,
+                                                       bounds)
+    for key in ('features', 'geometry', 'geometries'):
+        if document.get(key):
+            _compact_object(document[key], precision, bounds)
+
+
+def _compact_coordinates(coordinates, geometry_type, precision: int, bounds: List[float]):
+    if geometry_type == 'Point':
+        return _round_position(coordinates, precision, bounds)
+    if geometry_type in ('MultiPoint', 'LineString'):
+        return _compact_line(coordinates, precision, bounds, min_length=1 if geometry_type == 'MultiPoint' else 2)
+    if geometry_type in ('MultiLineString', 'Polygon'):
+        min_length = 2 if geometry_type == 'MultiLineString' else 4
+        return [_compact_line(line, precision, bounds, min_length) for line in coordinates]
+    if geometry_type == 'MultiPolygon':
+        return [[_compact_line(ring, precision, bounds, min_length=4) for ring in polygon]
+                for polygon in coordinates]
+    return coordinates
+
+
+def _compact_line(positions, precision: int, bounds: List[float], min_length: int):
+    rounded = [_round_position(position, precision, bounds) for position in positions]
+    compact = [position for index, position in enumerate(rounded) if index == 0 or position != rounded[index - 1]]
+    # keep the original points when dropping duplicates would leave too few of them for the geometry
+    return compact if len(compact) >= min_length else rounded
+
+
+def _round_position(position, precision: int, bounds: List[float]):
+    rounded = [round(value, precision) for value in position]
+    bounds[0] = min(bounds[0], rounded[0])
+    bounds[1] = min(bounds[1], rounded[1])
+    bounds[2] = max(bounds[2], rounded[0])
+    bounds[3] = max(bounds[3], rounded[1])
+    return rounded
@@ -0,0 +1,38 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Conditional responses for the public reads.
+
+Every other response is sent with Cache-Control: no-store. The public reads are sent with an ETag, the hash of the
+payload, and may be stored by browsers and proxies as long as they revalidate them, so an unchanged payload costs a
+304 without a body.
+"""
+from http import HTTPStatus
+
+from flask import Response, jsonify, request
+
+from met_api.utils.constants import TENANT_ID_HEADER
+
+
+PUBLIC_CACHE_CONTROL = 'public, no-cache'
+
+
+def conditional_response(payload) -> Response:
+    """Return the payload as json with an ETag, or a 304 when the request already has the current version."""
+    response = jsonify(payload)
+    response.status_code = HTTPStatus.OK
+    response.add_etag()
+    response.headers['Cache-Control'] = PUBLIC_CACHE_CONTROL
+    # the payload depends on the tenant and on whether the user is logged in
+    response.vary.update(('Authorization', TENANT_ID_HEADER))
+    return response.make_conditional(request)
@@ -2,28 +2,44 @@
 
 import json
 import re
+from typing import List
 
 import requests
 from flask import current_app
 from met_api.models.tenant import Tenant
 from met_api.services.rest_service import RestService
+from met_api.utils.cache import cache
 
 
 def get_tenant_site_url(tenant_id, path=''):
     """Get the tenant specific site url (domain / tenant / path)."""
     if tenant_id is None:
         raise ValueError('Missing tenant id.')
-    tenant: Tenant = Tenant.find_by_id(tenant_id)
+    tenant: Tenant = get_tenant(tenant_id)
     return current_app.config.get('SITE_URL', '') + f'/{tenant.short_name}' + path
 
 
-def send_email(subject, email, html_body, args, template_id):
-    """Send the email asynchronously, using the given details."""
+def get_tenant(tenant_id) -> Tenant:
+    """Get the tenant by id, served from the tenant cache when available."""
+    tenant: Tenant = cache.get(f'tenant_id_{tenant_id}')
+    if not tenant:
+        tenant = Tenant.find_by_id(tenant_id)
+        if tenant:
+            cache.set(f'tenant_id_{tenant.id}', tenant)
+    return tenant
+
+
+def send_email(subject, email, html_body, args, template_id, service_account_token=None):
+    """Send the email asynchronously, using the given details.
+
+    A service account token can be passed in to reuse it across several emails.
+    """
     if not email or not is_valid_email(email):
         return
 
     sender = current_app.config.get('MAIL_FROM_ID')
-    service_account_token = RestService.get_service_account_token()
+    if not service_account_token:
+        service_account_token = RestService.get_service_account_token()
     send_email_endpoint = current_app.config.get('NOTIFICATIONS_EMAIL_ENDPOINT')
     payload = {
         'bodyType': 'html',
@@ -42,6 +58,48 @@ def send_email(subject, email, html_body, args, template_id):
     response.raise_for_status()
 
 
+def send_email_batch(emails: List[dict], service_account_token=None) -> List[dict]:
+    """Send several emails with a single call to the notification api.
+
+    Each email holds the subject, email, html_body, args and template_id, as for send_email.
+    Returns a result per email, in order, with a status of SENT or FAILED and the error when it failed.
+    Invalid email addresses are failed here without being sent.
+    """
+    sender = current_app.config.get('MAIL_FROM_ID')
+    results = [None] * len(emails)
+    payloads = []
+    payload_indexes = []
+    for index, email in enumerate(emails):
+        if not is_valid_email(email.get('email')):
+            results[index] = {'status': 'FAILED', 'error': 'Invalid email address.'}
+            continue
+        payloads.append({
+            'bodyType': 'html',
+            'body': email.get('html_body'),
+            'from': sender,
+            'subject': email.get('subject'),
+            'to': email.get('email').split(),
+            'args': email.get('args'),
+            'template_id': email.get('template_id'),
+        })
+        payload_indexes.append(index)
+
+    if payloads:
+        if not service_account_token:
+            service_account_token = RestService.get_service_account_token()
+        send_email_endpoint = current_app.config.get('NOTIFICATIONS_EMAIL_ENDPOINT')
+        response = requests.post(f'{send_email_endpoint}/batch',
+                                 headers={
+                                     'Content-Type': 'application/json',
+                                     'Authorization': f'Bearer {service_account_token}'},
+                                 data=json.dumps({'emails': payloads}))
+        response.raise_for_status()
+        for index, result in zip(payload_indexes, response.json().get('results', [])):
+            results[index] = result
+    # an email without a result in the response was not confirmed as sent
+    return [result or {'status': 'FAILED', 'error': 'No result returned for the email.'} for result in results]
+
+
 def is_valid_email(email: str):
     """Return if the email is valid or not."""
     if email:
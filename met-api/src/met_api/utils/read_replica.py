@@ -0,0 +1,79 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Routing of the read only endpoints to the replica of the database.
+
+The endpoints decorated with read_only read from the replica bind when one is configured. The writes, and the reads
+of a request once it has written, go to the primary. A client which has written stays on the primary for a few
+seconds, so it reads its own writes rather than a replica which has not caught up yet. The window is kept in a short
+lived cookie set on the response of the write, so it holds whichever instance of the api serves the next request.
+"""
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import current_app, g, has_request_context, request
+
+
+REPLICA_BIND = 'replica'
+RECENT_WRITE_COOKIE = 'met-recent-write'
+
+
+def read_only(f):
+    """Route the reads of the endpoint to the replica."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        g.read_replica = _has_replica() and not _has_recent_write()
+        return f(*args, **kwargs)
+
+    return decorated
+
+
+def use_replica() -> bool:
+    """Return whether the reads of the current request go to the replica."""
+    return has_request_context() and g.get('read_replica', False)
+
+
+@contextmanager
+def primary():
+    """Read from the primary within the block, even in a read only endpoint."""
+    if not use_replica():
+        yield
+        return
+    g.read_replica = False
+    try:
+        yield
+    finally:
+        g.read_replica = True
+
+
+def record_write():
+    """Keep the reads of the current client on the primary for the read-your-writes window."""
+    if has_request_context() and _has_replica():
+        g.recent_write = True
+
+
+def set_recent_write_cookie(response):
+    """Set the read-your-writes cookie on the response of a request which has written."""
+    window = int(current_app.config.get('DB_REPLICA_READ_YOUR_WRITES'))
+    if g.get('recent_write') and window > 0:
+        response.set_cookie(RECENT_WRITE_COOKIE, '1', max_age=window, secure=request.is_secure, httponly=True,
+                            samesite='Lax')
+    return response
+
+
+def _has_replica() -> bool:
+    return REPLICA_BIND in (current_app.config.get('SQLALCHEMY_BINDS') or {})
+
+
+def _has_recent_write() -> bool:
+    return RECENT_WRITE_COOKIE in request.cookies
@@ -0,0 +1,104 @@
+"""Streaming spreadsheet writers.
+
+The rows are written as they are read, so an export holds a bounded number of rows in memory however large it is.
+"""
+import csv
+import io
+import re
+import tempfile
+import zipfile
+from typing import Iterable, Iterator, Sequence
+from xml.sax.saxutils import escape
+
+
+# Number of rows written to the output at a time
+ROWS_PER_CHUNK = 500
+# Size of the pieces the xlsx file is streamed in, and size above which it is spooled to disk
+XLSX_READ_SIZE = 64 * 1024
+XLSX_SPOOL_SIZE = 8 * 1024 * 1024
+
+# Characters which are not allowed in xml documents
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_XLSX_STATIC_PARTS = {
+    '[Content_Types].xml':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>',
+    '_rels/.rels':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>',
+    'xl/_rels/workbook.xml.rels':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>',
+}
+
+
+def stream_csv(header: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """Yield the csv file of the rows, a chunk of rows at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for index, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if index % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_xlsx(header: Sequence[str], rows: Iterable[Sequence], sheet_name: str = 'Sheet1') -> Iterator[bytes]:
+    """Yield the xlsx workbook of the rows, with every value written as text.
+
+    The sheet is compressed into a temporary file as the rows are read, then the file is streamed.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=XLSX_SPOOL_SIZE) as workbook_file:
+        with zipfile.ZipFile(workbook_file, 'w', compression=zipfile.ZIP_DEFLATED) as workbook:
+            for name, content in _XLSX_STATIC_PARTS.items():
+                workbook.writestr(name, content)
+            workbook.writestr(
+                'xl/workbook.xml',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                f'<sheets><sheet name="{escape(sheet_name[:31], {chr(34): "&quot;"})}" sheetId="1" r:id="rId1"/>'
+                '</sheets></workbook>')
+            with workbook.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+                sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                            b'<sheetData>')
+                chunk = [_xlsx_row(header)]
+                for row in rows:
+                    chunk.append(_xlsx_row(row))
+                    if len(chunk) == ROWS_PER_CHUNK:
+                        sheet.write(''.join(chunk).encode('utf-8'))
+                        chunk = []
+                sheet.write(''.join(chunk).encode('utf-8'))
+                sheet.write(b'</sheetData></worksheet>')
+
+        workbook_file.seek(0)
+        while data := workbook_file.read(XLSX_READ_SIZE):
+            yield data
+
+
+def _xlsx_row(values: Sequence) -> str:
+    cells = ''.join(
+        f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_INVALID_XML_CHARS.sub("", str(value)))}</t></is></c>'
+        if value is not None else '<c/>'
+        for value in values)
+    return f'<row>{cells}</row>'
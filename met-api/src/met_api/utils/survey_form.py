@@ -0,0 +1,69 @@
+"""Index of the components of survey forms.
+
+The index of a survey is built once for each version of its form and shared by the requests, so looking up the
+label of a comment is a dictionary access rather than a scan of the form.
+"""
+import itertools
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional
+
+
+FORM_DISPLAY = 'form'
+WIZARD_DISPLAY = 'wizard'
+
+# Number of survey forms kept indexed by the process
+COMPONENT_INDEX_CACHE_SIZE = 256
+
+_component_indexes: 'OrderedDict[tuple, ComponentIndex]' = OrderedDict()
+_component_indexes_lock = Lock()
+
+
+class ComponentIndex(NamedTuple):
+    """The labels of the components of a survey form by key, and the keys of its text components in form order."""
+
+    labels: Dict[str, Optional[str]]
+    text_component_keys: List[str]
+
+    def get_label(self, component_id: str) -> Optional[str]:
+        """Return the label of the component, or None when the form has no such component."""
+        return self.labels.get(component_id)
+
+
+def extract_components(survey_form: dict) -> List[dict]:
+    """Return the input components of a single page form, or of every page of a wizard."""
+    components = list(survey_form.get('components', []))
+    if survey_form.get('display') == FORM_DISPLAY:
+        return components
+    if survey_form.get('display') == WIZARD_DISPLAY:
+        return list(itertools.chain.from_iterable([page.get('components', []) for page in components]))
+    return []
+
+
+def get_component_index(survey_id: int, updated_date, form_json: dict) -> ComponentIndex:
+    """Return the component index of the survey form, built on the first call for a survey id and updated date."""
+    key = (survey_id, str(updated_date))
+    with _component_indexes_lock:
+        index = _component_indexes.get(key)
+        if index is not None:
+            _component_indexes.move_to_end(key)
+            return index
+
+    index = _build_component_index(form_json or {})
+    with _component_indexes_lock:
+        _component_indexes[key] = index
+        if len(_component_indexes) > COMPONENT_INDEX_CACHE_SIZE:
+            _component_indexes.popitem(last=False)
+    return index
+
+
+def _build_component_index(form_json: dict) -> ComponentIndex:
+    labels = {}
+    text_component_keys = []
+    for component in extract_components(form_json):
+        component_key = component.get('key', None)
+        # the first component with a key wins, as the scan of the form used to return
+        labels.setdefault(component_key, component.get('label', None))
+        if component.get('inputType', None) == 'text':
+            text_component_keys.append(component_key)
+    return ComponentIndex(labels, text_component_keys)
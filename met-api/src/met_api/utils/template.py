@@ -1,10 +1,14 @@
 """Template Services."""
 
 import os
-from jinja2 import Environment, FileSystemLoader
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 templates_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..', 'templates'))
-ENV = Environment(loader=FileSystemLoader(templates_dir), autoescape=True)
+# Templates are only changed on deploy, so skip the per-render up-to-date check and
+# share the compiled bytecode between worker processes through the file system cache.
+ENV = Environment(loader=FileSystemLoader(templates_dir), autoescape=True, auto_reload=False,
+                  bytecode_cache=FileSystemBytecodeCache())
 
 
 class Template:
@@ -14,3 +18,9 @@ class Template:
     def get_template(template_filename):
         """Get a template from the common template folder."""
         return ENV.get_template(template_filename)
+
+    @staticmethod
+    def precompile():
+        """Compile all the email templates so that the first email sent does not pay for it."""
+        for template_filename in ENV.list_templates(extensions=['html']):
+            ENV.get_template(template_filename)
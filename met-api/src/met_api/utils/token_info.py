@@ -2,7 +2,7 @@
 from flask import current_app, g
 
 from met_api.utils.roles import Role
-from met_api.utils.user_context import UserContext, user_context
+from met_api.utils.user_context import UserContext, cached_for_token, user_context
 
 
 class TokenInfo:
@@ -38,6 +38,10 @@ class TokenInfo:
         """Get the user roles from token."""
         if not hasattr(g, 'jwt_oidc_token_info') or not g.jwt_oidc_token_info:
             return []
+        return set(cached_for_token('user_roles', TokenInfo._read_user_roles))
+
+    @staticmethod
+    def _read_user_roles():
         valid_roles = set(item.value for item in Role)
         token_roles = current_app.config['JWT_ROLE_CALLBACK'](g.jwt_oidc_token_info)
-        return valid_roles.intersection(token_roles)
+        return frozenset(valid_roles.intersection(token_roles))
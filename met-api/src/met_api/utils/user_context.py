@@ -14,16 +14,31 @@
 """User Context to hold request scoped variables."""
 
 import functools
-from typing import Dict
+from typing import Callable, Dict
 
-from flask import g, request
+from flask import g, has_request_context, request
 
 from met_api.utils.roles import Role
 
 
 def _get_context():
     """Return User context."""
-    return UserContext()
+    return cached_for_token('user_context', UserContext)
+
+
+def cached_for_token(name: str, build: Callable):
+    """Return the value built for the token of the request, building it on the first call of the request.
+
+    The value is built again when the token of the request changes, and on every call outside of a request.
+    """
+    if not has_request_context():
+        return build()
+    token_info = _get_token_info()
+    cache = g.setdefault('token_cache', {})
+    cached = cache.get(name)
+    if cached is None or cached[0] is not token_info:
+        cached = cache[name] = (token_info, build())
+    return cached[1]
 
 
 class UserContext:  # pylint: disable=too-many-instance-attributes
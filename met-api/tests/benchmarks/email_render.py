@@ -0,0 +1,51 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure how many emails per second the template pipeline renders.
+
+Run from the met-api folder with: python -m tests.benchmarks.email_render [messages]
+"""
+import sys
+import time
+
+from jinja2 import Environment, FileSystemLoader
+
+from met_api.utils.template import Template, templates_dir
+
+
+TEMPLATE = 'email_engagement_closeout.html'
+CONTEXT = {'engagement_name': 'Benchmark Engagement', 'engagement_url': 'http://localhost/engagements/1/comments'}
+
+
+def _report(name, count, elapsed):
+    print(f'{name:<24} {count} messages in {elapsed:.3f}s = {count / elapsed:,.0f} messages/s')
+
+
+def run(count: int = 10000):
+    """Render the closeout email count times, with a default environment and with the precompiled one."""
+    # the environment as it was before, which checks the template on disk before every render
+    default_env = Environment(loader=FileSystemLoader(templates_dir), autoescape=True)
+    start = time.perf_counter()
+    for _ in range(count):
+        default_env.get_template(TEMPLATE).render(**CONTEXT)
+    _report('default environment', count, time.perf_counter() - start)
+
+    Template.precompile()
+    start = time.perf_counter()
+    for _ in range(count):
+        Template.get_template(TEMPLATE).render(**CONTEXT)
+    _report('precompiled environment', count, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
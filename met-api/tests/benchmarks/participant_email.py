@@ -0,0 +1,57 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the cost per address of decoding the email addresses of the participants.
+
+Run from the met-api folder with: python -m tests.benchmarks.participant_email [recipients]
+"""
+import sys
+import time
+
+from flask import Flask
+from itsdangerous import URLSafeSerializer
+
+from met_api.models.participant import Participant
+
+
+SECRET = 'benchmark secret'
+
+
+def _report(name, count, elapsed):
+    print(f'{name:<28} {count} addresses in {elapsed:.3f}s = {elapsed / count * 1e6:.2f}us/address')
+
+
+def run(count: int = 100000):
+    """Decode the addresses of count recipients with a serializer per address, one by one and as a batch."""
+    app = Flask(__name__)
+    app.config['EMAIL_SECRET_KEY'] = SECRET
+    with app.app_context():
+        encoded_emails = [Participant.encode_email(f'recipient{index}@example.com') for index in range(count)]
+
+        start = time.perf_counter()
+        for encoded_email in encoded_emails:
+            URLSafeSerializer(SECRET).loads(encoded_email)
+        _report('serializer per address', count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for encoded_email in encoded_emails:
+            Participant.decode_email(encoded_email)
+        _report('decode_email', count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        Participant.decode_emails(encoded_emails)
+        _report('decode_emails', count, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -16,18 +16,26 @@
 
 Test-Suite to ensure that the /Comment endpoint is working as expected.
 """
+import csv
+import io
 import json
+import re
+import zipfile
 from unittest.mock import MagicMock, patch
 
+import pytest
 from faker import Faker
 
 from met_api.constants.staff_note_type import StaffNoteType
+from met_api.models import db
+from met_api.services.cdogs_api_service import CdogsApiService
 from met_api.utils import notification
 from met_api.utils.enums import ContentType
 from tests.utilities.factory_scenarios import TestJwtClaims
 from tests.utilities.factory_utils import (
     factory_auth_header, factory_comment_model, factory_participant_model, factory_staff_user_model,
     factory_submission_model, factory_survey_and_eng_model, set_global_tenant)
+from tests.utilities.query_counter import count_statements
 
 fake = Faker()
 
@@ -45,6 +53,32 @@ def test_get_comments(client, jwt, session):  # pylint:disable=unused-argument
     assert rv.status_code == 200
 
 
+def test_get_comments_statement_count(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that a page of comments is read with the same number of statements whatever its size."""
+    claims = TestJwtClaims.staff_admin_role
+    factory_staff_user_model(external_id=claims.get('sub'))
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+
+    for _ in range(5):
+        submission = factory_submission_model(survey.id, eng.id, participant.id)
+        factory_comment_model(survey.id, submission.id)
+    survey_id = survey.id
+
+    statement_counts = []
+    for page_size in (1, 5):
+        db.session.expunge_all()
+        with count_statements() as statements:
+            rv = client.get(f'/api/comments/survey/{survey_id}?page=1&size={page_size}', headers=headers,
+                            content_type=ContentType.JSON.value)
+        assert rv.status_code == 200
+        assert len(rv.json.get('items')) == page_size
+        statement_counts.append(len(statements))
+
+    assert statement_counts[0] == statement_counts[1]
+
+
 def test_review_comment(client, jwt, session):  # pylint:disable=unused-argument
     """Assert that a comment can be reviewed."""
     claims = TestJwtClaims.public_user_role
@@ -120,8 +154,9 @@ def test_review_comment_review_note(client, jwt, session):  # pylint:disable=unu
         mock_mail.assert_called()
 
 
-def test_get_comments_spreadsheet(mocker, client, jwt, session):  # pylint:disable=unused-argument
+def test_get_comments_spreadsheet(mocker, client, jwt, session, monkeypatch):  # pylint:disable=unused-argument
     """Assert that comments sheet can be fetched."""
+    monkeypatch.setitem(client.application.config, 'COMMENT_EXPORT_ENGINE', 'cdogs')
     claims = TestJwtClaims.public_user_role
 
     mock_post_generate_document_response = MagicMock()
@@ -157,3 +192,31 @@ def test_get_comments_spreadsheet(mocker, client, jwt, session):  # pylint:disab
     mock_post_generate_document.assert_called()
     mock_get_access_token.assert_called()
     mock_post_upload_template.assert_called()
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'xlsx'])
+def test_get_comments_spreadsheet_native(client, jwt, session, file_format):  # pylint:disable=unused-argument
+    """Assert that comments sheet is streamed by the api, without calling CDOGS."""
+    claims = TestJwtClaims.public_user_role
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    comment = factory_comment_model(survey.id, submission.id)
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    with patch.object(CdogsApiService, '_post_generate_document') as mock_post_generate_document:
+        rv = client.get(f'/api/comments/survey/{survey.id}/sheet?format={file_format}', headers=headers,
+                        content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+    assert f'comments_sheet.{file_format}' in rv.headers['content-disposition']
+    mock_post_generate_document.assert_not_called()
+    if file_format == 'csv':
+        rows = list(csv.reader(io.StringIO(rv.data.decode('utf-8'))))
+    else:
+        with zipfile.ZipFile(io.BytesIO(rv.data)) as workbook:
+            sheet = workbook.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        rows = [re.findall(r'<t xml:space="preserve">(.*?)</t>', row)
+                for row in re.findall(r'<row>(.*?)</row>', sheet)]
+    assert rows[0][0] == 'Comment No.'
+    assert len(rows) == 2
+    assert rows[1][0] == str(comment.id)
+    assert rows[1][4] == comment.text
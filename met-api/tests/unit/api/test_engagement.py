@@ -23,15 +23,18 @@ import pytest
 from faker import Faker
 from flask import current_app
 
-from met_api.constants.engagement_status import EngagementDisplayStatus, SubmissionStatus
+from met_api.constants.engagement_status import EngagementDisplayStatus, Status, SubmissionStatus
+from met_api.constants.widget import WidgetType
 from met_api.models.tenant import Tenant as TenantModel
 from met_api.utils.constants import TENANT_ID_HEADER
 from met_api.utils.enums import ContentType
 from tests.utilities.factory_scenarios import (
-    TestEngagementInfo, TestJwtClaims, TestSubmissionInfo, TestTenantInfo, TestUserInfo)
+    TestEngagementInfo, TestJwtClaims, TestSubmissionInfo, TestTenantInfo, TestUserInfo, TestWidgetDocumentInfo,
+    TestWidgetInfo)
 from tests.utilities.factory_utils import (
-    factory_auth_header, factory_engagement_model, factory_membership_model, factory_participant_model,
-    factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model, factory_tenant_model)
+    factory_auth_header, factory_document_model, factory_engagement_model, factory_membership_model,
+    factory_participant_model, factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model,
+    factory_tenant_model, factory_widget_model, set_global_tenant)
 
 fake = Faker()
 
@@ -130,6 +133,23 @@ def test_search_engagements_by_status(client, jwt,
     assert rv.json.get('total') == 1
 
 
+def test_get_engagements_page_projection(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that the engagement listing leaves out the rich content and the survey forms."""
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.staff_admin_role)
+    set_global_tenant()
+    survey, eng = factory_survey_and_eng_model()
+
+    rv = client.get('/api/engagements/?page=1&size=10&sort_key=engagement.created_date&sort_order=desc',
+                    headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+    listed_engagement = rv.json.get('items')[0]
+    assert listed_engagement.get('id') == eng.id
+    assert 'rich_content' not in listed_engagement
+    assert 'status_block' not in listed_engagement
+    assert listed_engagement.get('surveys')[0].get('name') == survey.name
+    assert 'form_json' not in listed_engagement.get('surveys')[0]
+
+
 def test_search_engagements_not_logged_in(client, session):  # pylint:disable=unused-argument
     """Assert that an engagement can be fetched without JWT Token."""
     factory_engagement_model()
@@ -306,3 +326,79 @@ def test_count_submissions(client, jwt, session, engagement_info):  # pylint:dis
     assert submission_meta_data.get('approved', 0) == 1
     assert submission_meta_data.get('pending', 0) == 1
     assert submission_meta_data.get('needs_further_review', 0) == 1
+
+
+def test_get_public_engagement_cached(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that the public reads of an engagement are cached until the engagement is edited."""
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.staff_admin_role)
+    engagement = factory_engagement_model(status=Status.Published.value)
+    engagement_id = str(engagement.id)
+    name = engagement.name
+
+    rv = client.get(f'/api/engagements/{engagement_id}', content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+    assert rv.json.get('name') == name
+
+    engagement.name = fake.name()
+    engagement.save()
+    rv = client.get(f'/api/engagements/{engagement_id}', content_type=ContentType.JSON.value)
+    assert rv.json.get('name') == name, 'Served from the cache.'
+
+    rv = client.get(f'/api/engagements/{engagement_id}', headers=headers, content_type=ContentType.JSON.value)
+    assert rv.json.get('name') == engagement.name, 'Staff users are not served from the cache.'
+
+    engagement_edits = {
+        'id': engagement_id,
+        'name': fake.name(),
+    }
+    rv = client.patch('/api/engagements/', data=json.dumps(engagement_edits),
+                      headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+
+    rv = client.get(f'/api/engagements/{engagement_id}', content_type=ContentType.JSON.value)
+    assert rv.json.get('name') == engagement_edits.get('name'), 'The edit drops the cached engagement.'
+
+
+def test_get_engagement_bundle(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that the engagement can be fetched along with its widgets and their content."""
+    engagement = factory_engagement_model(status=Status.Published.value)
+    widget = factory_widget_model({**TestWidgetInfo.widget2, 'engagement_id': engagement.id})
+    widget.widget_type_id = WidgetType.DOCUMENTS.value
+    widget.save()
+    document = factory_document_model({**TestWidgetDocumentInfo.document1, 'widget_id': widget.id})
+
+    rv = client.get(f'/api/engagements/{engagement.id}/bundle', content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+    assert rv.json.get('engagement').get('id') == engagement.id
+    widgets = rv.json.get('widgets')
+    assert len(widgets) == 1
+    assert widgets[0].get('id') == widget.id
+    folders = widgets[0].get('documents').get('children')
+    assert folders[0].get('id') == document.id
+
+    draft_engagement = factory_engagement_model(status=Status.Draft.value)
+    rv = client.get(f'/api/engagements/{draft_engagement.id}/bundle', content_type=ContentType.JSON.value)
+    assert rv.status_code == 500, 'Draft engagements are not public.'
+
+
+def test_get_public_engagement_conditional(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that the public reads of an engagement can be revalidated with their ETag."""
+    engagement = factory_engagement_model(status=Status.Published.value)
+
+    rv = client.get(f'/api/engagements/{engagement.id}', content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+    assert rv.headers.get('Cache-Control') == 'public, no-cache'
+    etag = rv.headers.get('ETag')
+    assert etag
+
+    rv = client.get(f'/api/engagements/{engagement.id}', headers={'If-None-Match': etag},
+                    content_type=ContentType.JSON.value)
+    assert rv.status_code == 304
+    assert not rv.data
+
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.staff_admin_role)
+    rv = client.get(f'/api/engagements/{engagement.id}', headers={**headers, 'If-None-Match': etag},
+                    content_type=ContentType.JSON.value)
+    assert rv.status_code == 200, 'The reads of the staff users are not conditional.'
+    assert 'no-store' in rv.headers.get('Cache-Control')
+    assert rv.headers.get('ETag') is None
@@ -0,0 +1,145 @@
+# Copyright © 2023 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the Job API end-point.
+
+Test-Suite to ensure that the /jobs endpoint is working as expected.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+from met_api.constants.job import JobStatus
+from met_api.models.job import Job as JobModel
+from met_api.services.job_service import JobService
+from met_api.services.object_storage_service import ObjectStorageService
+from met_api.utils.enums import ContentType
+from tests.utilities.factory_scenarios import TestJwtClaims
+from tests.utilities.factory_utils import (
+    factory_auth_header, factory_comment_model, factory_participant_model, factory_submission_model,
+    factory_survey_and_eng_model)
+
+
+def test_comment_sheet_job(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that a comment sheet export job can be submitted, polled and downloaded once run by the worker."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    comment = factory_comment_model(survey.id, submission.id)
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.public_user_role)
+
+    rv = client.post('/api/jobs', data=json.dumps({'job_type': 'comment_sheet', 'params': {'survey_id': survey.id}}),
+                     headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.ACCEPTED
+    job_id = rv.json.get('id')
+    assert rv.json.get('status') == 'PENDING'
+
+    rv = client.get(f'/api/jobs/{job_id}/download', headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.CONFLICT
+
+    assert JobService.run_pending() == 1
+
+    rv = client.get(f'/api/jobs/{job_id}', headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json.get('status') == 'COMPLETED'
+    assert rv.json.get('progress') == 100
+
+    rv = client.get(f'/api/jobs/{job_id}/download', headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.OK
+    assert 'comments_sheet.csv' in rv.headers['content-disposition']
+    rows = list(csv.reader(io.StringIO(rv.data.decode('utf-8'))))
+    assert rows[1][0] == str(comment.id)
+
+    other_user_headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.no_role)
+    rv = client.get(f'/api/jobs/{job_id}', headers=other_user_headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_submit_invalid_job(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that an unknown job type or missing parameters are rejected."""
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.public_user_role)
+    rv = client.post('/api/jobs', data=json.dumps({'job_type': 'unknown'}),
+                     headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+    rv = client.post('/api/jobs', data=json.dumps({'job_type': 'comment_sheet', 'params': {}}),
+                     headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_comment_sheet_job_in_chunks(app, session, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that a job reading more comments than a chunk reports its progress without committing its session."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    comments = [factory_comment_model(survey.id, submission.id) for _ in range(5)]
+    monkeypatch.setitem(app.config, 'COMMENT_EXPORT_CHUNK_SIZE', 2)
+    job = JobModel(job_type='comment_sheet', params={'survey_id': survey.id, 'format': 'csv'})
+    job.save()
+
+    events = []
+    commit = session.commit
+    update_progress = JobModel.update_progress
+    monkeypatch.setattr(session, 'commit', lambda: events.append('commit') or commit())
+    monkeypatch.setattr(JobModel, 'update_progress',
+                        lambda self, progress: events.append(progress) or update_progress(self, progress))
+    assert JobService.run_pending() == 1
+
+    # the claim and the completion of the job are the only commits, none happens while the comments are read
+    assert events == ['commit', 40, 80, 'commit']
+    assert job.status == JobStatus.COMPLETED
+    rows = list(csv.reader(io.StringIO(b''.join(JobService.stream_result(job)).decode('utf-8'))))
+    assert [row[0] for row in rows[1:]] == [str(comment.id) for comment in comments]
+
+
+def test_stale_job_claimed_again(session):  # pylint:disable=unused-argument
+    """Assert that a job left running by a worker which died is run again once stale."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    factory_comment_model(survey.id, submission.id)
+    job = JobModel(job_type='comment_sheet', params={'survey_id': survey.id, 'format': 'csv'},
+                   status=JobStatus.RUNNING, progress=50)
+    job.save()
+
+    assert JobService.run_pending() == 0, 'The job is still running.'
+
+    job.updated_date = datetime.utcnow() - timedelta(hours=1)
+    session.flush()
+    assert JobService.run_pending() == 1
+    assert job.status == JobStatus.COMPLETED
+
+
+def test_job_result_in_object_storage(session, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that the result of a job is uploaded as a file to the object storage and streamed back from it."""
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    submission = factory_submission_model(survey.id, eng.id, participant.id)
+    comment = factory_comment_model(survey.id, submission.id)
+    job = JobModel(job_type='comment_sheet', params={'survey_id': survey.id, 'format': 'csv'})
+    job.save()
+
+    stored_files = {}
+    monkeypatch.setattr(ObjectStorageService, 'is_configured', staticmethod(lambda: True))
+    monkeypatch.setattr(ObjectStorageService, 'upload_file',
+                        lambda self, filename, file: stored_files.update({filename: file.read()}))
+    monkeypatch.setattr(ObjectStorageService, 'stream_file',
+                        lambda self, filename, chunk_size: iter([stored_files[filename]]))
+    assert JobService.run_pending() == 1
+
+    assert job.status == JobStatus.COMPLETED
+    assert list(stored_files) == [job.result_key]
+    rows = list(csv.reader(io.StringIO(b''.join(JobService.stream_result(job)).decode('utf-8'))))
+    assert rows[1][0] == str(comment.id)
@@ -21,11 +21,13 @@ import json
 
 import pytest
 
+from met_api.models import db
 from met_api.utils.enums import ContentType
 from tests.utilities.factory_scenarios import TestJwtClaims, TestSubmissionInfo
 from tests.utilities.factory_utils import (
-    factory_auth_header, factory_email_verification, factory_membership_model, factory_participant_model,
-    factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model)
+    factory_auth_header, factory_comment_model, factory_email_verification, factory_membership_model,
+    factory_participant_model, factory_staff_user_model, factory_submission_model, factory_survey_and_eng_model)
+from tests.utilities.query_counter import count_statements
 
 
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
@@ -78,6 +80,31 @@ def test_get_submission_page(client, jwt, session, submission_info):  # pylint:d
     assert rv.json.get('items', [])[0].get('submission_json', None) is None
 
 
+def test_get_submission_page_statement_count(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that a page of submissions is read with the same number of statements whatever its size."""
+    claims = TestJwtClaims.staff_admin_role
+    factory_staff_user_model(external_id=claims.get('sub'))
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    participant = factory_participant_model()
+    survey, eng = factory_survey_and_eng_model()
+    for _ in range(5):
+        submission = factory_submission_model(survey.id, eng.id, participant.id)
+        factory_comment_model(survey.id, submission.id)
+    survey_id = survey.id
+
+    statement_counts = []
+    for page_size in (1, 5):
+        db.session.expunge_all()
+        with count_statements() as statements:
+            rv = client.get(f'/api/submissions/survey/{survey_id}?page=1&size={page_size}', headers=headers,
+                            content_type=ContentType.JSON.value)
+        assert rv.status_code == 200
+        assert len(rv.json.get('items')) == page_size
+        statement_counts.append(len(statements))
+
+    assert statement_counts[0] == statement_counts[1]
+
+
 def test_get_comment_filtering(client, jwt, session):  # pylint:disable=unused-argument
     """Assert comments filtering works for different users."""
     participant = factory_participant_model()
@@ -22,12 +22,15 @@ from http import HTTPStatus
 import pytest
 from flask import current_app
 
+from met_api.models.survey import Survey as SurveyModel
 from met_api.models.tenant import Tenant as TenantModel
+from met_api.schemas.survey import SurveySchema
 from met_api.utils.constants import TENANT_ID_HEADER
 from met_api.utils.enums import ContentType
-from tests.utilities.factory_scenarios import TestJwtClaims, TestSurveyInfo, TestTenantInfo
+from tests.utilities.factory_scenarios import TestJwtClaims, TestSubmissionInfo, TestSurveyInfo, TestTenantInfo
 from tests.utilities.factory_utils import (
-    factory_auth_header, factory_engagement_model, factory_survey_model, factory_tenant_model, set_global_tenant)
+    factory_auth_header, factory_engagement_model, factory_participant_model, factory_submission_model,
+    factory_survey_and_eng_model, factory_survey_model, factory_tenant_model, set_global_tenant)
 
 surveys_url = '/api/surveys/'
 
@@ -151,6 +154,47 @@ def test_get_hidden_survey_for_admins(client, jwt, session):  # pylint:disable=u
     assert rv.json.get('total') == 1
 
 
+def test_get_surveys_page_projection(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that the survey listing leaves out the form and the engagement content, and counts the comments."""
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.staff_admin_role)
+    set_global_tenant()
+    survey, eng = factory_survey_and_eng_model()
+    participant = factory_participant_model()
+    factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.approved_submission)
+    factory_submission_model(survey.id, eng.id, participant.id, TestSubmissionInfo.pending_submission)
+
+    rv = client.get(f'{surveys_url}?page=1&size=10&sort_key=survey.created_date&sort_order=desc&search_text=',
+                    headers=headers, content_type=ContentType.JSON.value)
+    assert rv.status_code == 200
+    listed_survey = next(item for item in rv.json.get('items') if item.get('id') == survey.id)
+    assert 'form_json' not in listed_survey
+    assert listed_survey.get('engagement').get('name') == eng.name
+    assert 'surveys' not in listed_survey.get('engagement')
+    assert 'rich_content' not in listed_survey.get('engagement')
+    assert listed_survey.get('comments_meta_data') == {
+        'total': 2, 'pending': 1, 'approved': 1, 'rejected': 0, 'needs_further_review': 0}
+
+
+def test_survey_comments_meta_data_second_survey(session):  # pylint:disable=unused-argument
+    """Assert that the counts of a survey are not replaced by the ones of the first survey of its engagement."""
+    first_survey, eng = factory_survey_and_eng_model()
+    second_survey = factory_survey_model()
+    second_survey.engagement_id = eng.id
+    second_survey.save()
+    participant = factory_participant_model()
+    factory_submission_model(first_survey.id, eng.id, participant.id, TestSubmissionInfo.approved_submission)
+    factory_submission_model(second_survey.id, eng.id, participant.id, TestSubmissionInfo.pending_submission)
+    factory_submission_model(second_survey.id, eng.id, participant.id, TestSubmissionInfo.pending_submission)
+    session.refresh(eng)
+    assert eng.surveys[0].id == first_survey.id
+
+    dumped_survey = SurveySchema().dump(SurveyModel.find_by_id(second_survey.id))
+    assert dumped_survey.get('comments_meta_data') == {
+        'total': 2, 'pending': 2, 'approved': 0, 'rejected': 0, 'needs_further_review': 0}
+    assert dumped_survey.get('engagement').get('submissions_meta_data') == {
+        'total': 1, 'pending': 0, 'approved': 1, 'rejected': 0, 'needs_further_review': 0}
+
+
 def test_get_hidden_survey_for_team_member(client, jwt, session):  # pylint:disable=unused-argument
     """Assert that a hidden survey cannot be fetched by team members."""
     headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.team_member_role)
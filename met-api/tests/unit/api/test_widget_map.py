@@ -0,0 +1,50 @@
+# Copyright © 2023 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the Widget Map API end-point.
+
+Test-Suite to ensure that the Widget Map API endpoint is working as expected.
+"""
+import json
+
+from met_api.models.widget_map import WidgetMap as WidgetMapModel
+from met_api.utils.geojson import compact_geojson
+from tests.utilities.factory_scenarios import TestWidgetInfo
+from tests.utilities.factory_utils import factory_engagement_model, factory_widget_model
+
+
+def test_get_map_geojson(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that the shape of a map widget is served with its ETag and long-lived cache headers."""
+    engagement = factory_engagement_model()
+    TestWidgetInfo.widget1['engagement_id'] = engagement.id
+    widget = factory_widget_model(TestWidgetInfo.widget1)
+    geojson, bbox, geojson_hash = compact_geojson(json.dumps({
+        'type': 'Feature',
+        'geometry': {'type': 'Point', 'coordinates': [-123.365644, 48.428421]},
+        'properties': {}
+    }), 6)
+    widget_map = WidgetMapModel(widget_id=widget.id, engagement_id=engagement.id, latitude=48.4, longitude=-123.3,
+                                geojson=geojson, bbox=bbox, geojson_hash=geojson_hash)
+    widget_map.save()
+
+    rv = client.get(f'/api/widgets/{widget.id}/maps/geojson')
+    assert rv.status_code == 200
+    assert rv.json == json.loads(geojson)
+    assert rv.headers['ETag'] == f'"{geojson_hash}"'
+    assert rv.headers['Cache-Control'] == 'public, no-cache'
+
+    rv = client.get(f'/api/widgets/{widget.id}/maps/geojson?v={geojson_hash}')
+    assert 'immutable' in rv.headers['Cache-Control']
+
+    rv = client.get(f'/api/widgets/{widget.id}/maps/geojson', headers={'If-None-Match': f'"{geojson_hash}"'})
+    assert rv.status_code == 304
@@ -0,0 +1,56 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the email queue model.
+
+Test suite to ensure that the EmailQueue model routines are working as expected.
+"""
+from met_api.constants.notification_status import NotificationStatus
+from met_api.models import EmailQueue as EmailQueueModel
+from met_api.utils import email_util
+from met_api.utils.enums import SourceAction, SourceType
+
+
+def test_claim_unprocessed_mails(session):  # pylint:disable=unused-argument
+    """Assert that claimed mails are marked as processing and are not claimed again."""
+    for entity_id in range(3):
+        email_util.publish_to_email_queue(SourceType.ENGAGEMENT.value, entity_id, SourceAction.PUBLISHED.value, True)
+
+    claimed = EmailQueueModel.claim_unprocessed_mails(2)
+    assert len(claimed) == 2
+    assert all(mail.notification_status == NotificationStatus.PROCESSING for mail in claimed)
+
+    claimed_again = EmailQueueModel.claim_unprocessed_mails(0)
+    assert len(claimed_again) == 1
+    assert claimed_again[0].id not in {mail.id for mail in claimed}
+
+
+def test_mark_failed(session):  # pylint:disable=unused-argument
+    """Assert that a failed mail is queued again until it runs out of attempts."""
+    mail = email_util.publish_to_email_queue(SourceType.ENGAGEMENT.value, 1, SourceAction.PUBLISHED.value, True)
+
+    mail.mark_failed('Service unavailable', max_attempts=2)
+    assert mail.notification_status is None
+    assert mail.attempts == 1
+    mail.mark_failed('Service unavailable', max_attempts=2)
+    assert mail.notification_status == NotificationStatus.FAILED
+    assert mail.last_error == 'Service unavailable'
+
+
+def test_mark_failed_without_retry(session):  # pylint:disable=unused-argument
+    """Assert that a mail which must not be retried fails on its first attempt."""
+    mail = email_util.publish_to_email_queue(SourceType.ENGAGEMENT.value, 1, SourceAction.PUBLISHED.value, True)
+
+    mail.mark_failed('Sent to 100 of 250 recipients', max_attempts=3, retry=False)
+    assert mail.notification_status == NotificationStatus.FAILED
+    assert mail.attempts == 1
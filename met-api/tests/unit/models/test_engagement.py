@@ -21,7 +21,10 @@ from faker import Faker
 from met_api.constants.engagement_status import SubmissionStatus
 from met_api.models import Engagement as EngagementModel
 from met_api.models.pagination_options import PaginationOptions
-from tests.utilities.factory_utils import factory_engagement_model
+from met_api.schemas.engagement import EngagementSchema
+from tests.utilities.factory_scenarios import TestSubmissionInfo
+from tests.utilities.factory_utils import (
+    factory_engagement_model, factory_participant_model, factory_submission_model, factory_survey_and_eng_model)
 
 fake = Faker()
 
@@ -129,3 +132,24 @@ def test_get_engagements_paginated_status_search(session):
                                                               'published_from_date': '',
                                                               'published_to_date': ''})
     assert count == 2
+
+
+def test_engagements_submissions_meta_data(session):
+    """Assert that the submission counts of a page of engagements are dumped by status."""
+    survey, eng = factory_survey_and_eng_model()
+    other_survey, other_eng = factory_survey_and_eng_model()
+    participant = factory_participant_model()
+    for submission_info in (TestSubmissionInfo.approved_submission, TestSubmissionInfo.approved_submission,
+                            TestSubmissionInfo.rejected_submission, TestSubmissionInfo.pending_submission):
+        factory_submission_model(survey.id, eng.id, participant.id, submission_info)
+    factory_submission_model(other_survey.id, other_eng.id, participant.id, TestSubmissionInfo.pending_submission)
+    empty_eng = factory_engagement_model()
+
+    result = EngagementSchema(many=True).dump([eng, other_eng, empty_eng])
+
+    assert result[0]['submissions_meta_data'] == {
+        'total': 4, 'pending': 1, 'approved': 2, 'rejected': 1, 'needs_further_review': 0}
+    assert result[1]['submissions_meta_data'] == {
+        'total': 1, 'pending': 1, 'approved': 0, 'rejected': 0, 'needs_further_review': 0}
+    assert result[2]['submissions_meta_data']['total'] == 0
+    assert EngagementSchema().dump(other_eng)['submissions_meta_data']['pending'] == 1
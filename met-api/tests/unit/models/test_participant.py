@@ -0,0 +1,67 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Participant model.
+
+Test suite to ensure that the email addresses of the participants are encoded and decoded as expected.
+"""
+import pytest
+from faker import Faker
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+
+from met_api.models.participant import Participant as ParticipantModel
+
+
+fake = Faker()
+
+
+def test_encode_decode_email(session):  # pylint:disable=unused-argument
+    """Assert that the encoded emails are the ones a plain serializer of the secret produces and reads."""
+    email_address = fake.email()
+    plain_serializer = URLSafeSerializer(current_app.config.get('EMAIL_SECRET_KEY'))
+
+    encoded_email = ParticipantModel.encode_email(email_address.upper())
+    assert encoded_email == plain_serializer.dumps(email_address.lower())
+    assert ParticipantModel.decode_email(encoded_email) == email_address.lower()
+    assert ParticipantModel.decode_email(plain_serializer.dumps(email_address)) == email_address
+
+
+def test_encode_decode_email_secrets(session, app):  # pylint:disable=unused-argument
+    """Assert that the emails are encoded with the secret of the config, and that the secrets are not mixed up."""
+    email_address = fake.email().lower()
+    first_encoded_email = ParticipantModel.encode_email(email_address)
+
+    first_secret = app.config.get('EMAIL_SECRET_KEY')
+    second_secret = 'another secret'
+    second_serializer = URLSafeSerializer(second_secret)
+    app.config['EMAIL_SECRET_KEY'] = second_secret
+    try:
+        second_encoded_email = ParticipantModel.encode_email(email_address)
+        assert second_encoded_email == second_serializer.dumps(email_address)
+        assert ParticipantModel.decode_email(second_encoded_email) == email_address
+        with pytest.raises(BadSignature):
+            ParticipantModel.decode_email(first_encoded_email)
+    finally:
+        app.config['EMAIL_SECRET_KEY'] = first_secret
+
+
+def test_decode_emails(session):  # pylint:disable=unused-argument
+    """Assert that a batch of emails is decoded in order, and that a tampered email is rejected."""
+    email_addresses = [fake.unique.email() for _ in range(5)]
+    encoded_emails = [ParticipantModel.encode_email(email_address) for email_address in email_addresses]
+    assert ParticipantModel.decode_emails(encoded_emails) == [email.lower() for email in email_addresses]
+
+    other_serializer = URLSafeSerializer('another secret')
+    with pytest.raises(BadSignature):
+        ParticipantModel.decode_emails([*encoded_emails, other_serializer.dumps(fake.email())])
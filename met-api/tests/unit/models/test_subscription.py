@@ -0,0 +1,53 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the subscription model.
+
+Test suite to ensure that the Subscription model routines are working as expected.
+"""
+from met_api.models import Participant as ParticipantModel
+from met_api.models import Subscription as SubscriptionModel
+from tests.utilities.factory_scenarios import TestParticipantInfo, TestTenantInfo
+from tests.utilities.factory_utils import (
+    factory_engagement_model, factory_participant_model, factory_tenant_model, set_global_tenant)
+
+
+def _factory_subscription(engagement_id, participant_id, is_subscribed=True):
+    subscription = SubscriptionModel(engagement_id=engagement_id, participant_id=participant_id,
+                                     is_subscribed=is_subscribed)
+    subscription.save()
+    return subscription
+
+
+def test_get_subscribed_email_addresses(session):  # pylint:disable=unused-argument
+    """Assert that the subscribed email addresses are deduplicated and scoped to the tenant."""
+    set_global_tenant()
+    eng1 = factory_engagement_model()
+    eng2 = factory_engagement_model()
+    participant1 = factory_participant_model(TestParticipantInfo.participant1)
+    participant2 = factory_participant_model(TestParticipantInfo.participant2)
+    _factory_subscription(eng1.id, participant1.id)
+    _factory_subscription(eng2.id, participant1.id)
+    _factory_subscription(eng1.id, participant2.id, is_subscribed=False)
+
+    other_tenant = factory_tenant_model(TestTenantInfo.tenant2)
+    set_global_tenant(other_tenant.id)
+    other_eng = factory_engagement_model()
+    _factory_subscription(other_eng.id, participant2.id)
+
+    email_addresses = [row.email_address for row in SubscriptionModel.get_subscribed_email_addresses(eng1.tenant_id)]
+    expected_email_address = TestParticipantInfo.participant1['email_address'].lower()
+    assert ParticipantModel.decode_emails(email_addresses) == [expected_email_address]
+
+    email_addresses = [row.email_address for row in SubscriptionModel.get_subscribed_email_addresses()]
+    assert len(email_addresses) == 2
@@ -17,10 +17,17 @@ Test suite to ensure that the Survey model routines are working as expected.
 """
 from faker import Faker
 
+from met_api.constants.comment_status import Status as CommentStatus
 from met_api.constants.engagement_status import Status
 from met_api.models import Survey as SurveyModel
 from met_api.models import db
-from tests.utilities.factory_utils import factory_engagement_model, factory_survey_model
+from met_api.models.pagination_options import PaginationOptions
+from met_api.models.survey_search_options import SurveySearchOptions
+from tests.utilities.factory_scenarios import TestSubmissionInfo
+from tests.utilities.factory_utils import (
+    factory_engagement_model, factory_participant_model, factory_submission_model, factory_survey_and_eng_model,
+    factory_survey_model, set_global_tenant)
+from tests.utilities.query_counter import count_statements
 
 
 fake = Faker()
@@ -46,3 +53,29 @@ def test_get_open_survey(session):
     db.session.commit()
     survey_new_1 = SurveyModel.get_open(survey.id)
     assert survey_new_1 is not None
+
+
+def test_get_surveys_paginated_comment_counts(session):
+    """Assert that the surveys of a page come with their submission counts, without reading the submissions."""
+    set_global_tenant()
+    survey, eng = factory_survey_and_eng_model()
+    participant = factory_participant_model()
+    for submission_info in (TestSubmissionInfo.approved_submission, TestSubmissionInfo.rejected_submission,
+                            TestSubmissionInfo.rejected_submission):
+        factory_submission_model(survey.id, eng.id, participant.id, submission_info)
+    survey_id = survey.id
+    db.session.expunge_all()
+
+    pagination_options = PaginationOptions(page=1, size=10, sort_key='survey.created_date', sort_order='desc')
+    with count_statements() as statements:
+        items, total = SurveyModel.get_surveys_paginated(
+            pagination_options, SurveySearchOptions(exclude_hidden=False, exclude_template=False))
+
+    listed_survey = next(item for item in items if item.id == survey_id)
+    assert total >= 1
+    assert listed_survey.comment_counts[CommentStatus.Approved.value] == 1
+    assert listed_survey.comment_counts[CommentStatus.Rejected.value] == 2
+    assert listed_survey.comment_counts[CommentStatus.Pending.value] == 0
+    # the total, then the page with its counts
+    assert len(statements) == 2
+    assert 'LATERAL' not in statements[0]
@@ -0,0 +1,44 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Document Generation service.
+
+Test suite to ensure that the comment sheets are generated with as few calls to CDOGS as possible.
+"""
+from unittest.mock import MagicMock, patch
+
+from met_api.services.cdogs_api_service import CdogsApiService
+from met_api.services.document_generation_service import COMMENT_SHEET_TEMPLATE, DocumentGenerationService
+
+
+def test_generate_comment_sheet_reuses_token_and_template(session, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that once the template is uploaded, an export only costs the render call."""
+    monkeypatch.setattr(CdogsApiService, '_access_token', None)
+    monkeypatch.setattr(CdogsApiService, '_verified_templates', {})
+    _, local_hash_code = DocumentGenerationService.get_template_file(COMMENT_SHEET_TEMPLATE)
+
+    upload_response = MagicMock(status_code=200, headers={'X-Template-Hash': local_hash_code})
+    render_response = MagicMock(status_code=200, content=b'mock data')
+    with patch.object(CdogsApiService, '_request_access_token',
+                      return_value={'access_token': 'token', 'expires_in': 300}) as mock_token, \
+            patch.object(CdogsApiService, '_post_upload_template', return_value=upload_response) as mock_upload, \
+            patch.object(CdogsApiService, '_post_generate_document', return_value=render_response) as mock_render, \
+            patch.object(CdogsApiService._session, 'get') as mock_check:  # pylint:disable=protected-access
+        DocumentGenerationService().generate_comment_sheet(data={})
+        DocumentGenerationService().generate_comment_sheet(data={})
+
+    mock_token.assert_called_once()
+    mock_upload.assert_called_once()
+    mock_check.assert_not_called()
+    assert mock_render.call_count == 2
+    assert local_hash_code in mock_render.call_args.args[2]
@@ -0,0 +1,89 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Email Outbox service.
+
+Test suite to ensure that the engagement closeout emails are queued and delivered as expected.
+"""
+from datetime import datetime
+from unittest.mock import patch
+
+from met_api.constants.notification_status import OutboxStatus
+from met_api.models.email_outbox import EmailOutbox as EmailOutboxModel
+from met_api.services.email_outbox_service import EmailOutboxService
+from met_api.services.engagement_service import EngagementService
+from met_api.services.rest_service import RestService
+from met_api.utils import notification
+from tests.utilities.factory_scenarios import TestParticipantInfo
+from tests.utilities.factory_utils import (
+    factory_participant_model, factory_submission_model, factory_survey_and_eng_model, set_global_tenant)
+
+
+def _factory_closed_engagement_outbox():
+    """Queue the closeout emails of an engagement with two participants, one of them with two submissions."""
+    set_global_tenant()
+    survey, eng = factory_survey_and_eng_model()
+    participant1 = factory_participant_model(TestParticipantInfo.participant1)
+    participant2 = factory_participant_model(TestParticipantInfo.participant2)
+    factory_submission_model(survey.id, eng.id, participant1.id)
+    factory_submission_model(survey.id, eng.id, participant1.id)
+    factory_submission_model(survey.id, eng.id, participant2.id)
+    EngagementService._send_closeout_emails(eng)  # pylint: disable=protected-access
+    return eng
+
+
+def test_closeout_emails_are_queued_once_per_participant(session):  # pylint:disable=unused-argument
+    """Assert that the closeout emails are queued once per participant, even when queued again."""
+    eng = _factory_closed_engagement_outbox()
+    EngagementService._send_closeout_emails(eng)  # pylint: disable=protected-access
+
+    mails = EmailOutboxModel.query.filter_by(entity_id=eng.id).all()
+    assert len(mails) == 2
+    assert all(mail.status == OutboxStatus.PENDING for mail in mails)
+    assert all(eng.name in mail.subject for mail in mails)
+
+
+def test_deliver_due_emails(session):  # pylint:disable=unused-argument
+    """Assert that the queued emails are sent in a single batch with a single service account token."""
+    eng = _factory_closed_engagement_outbox()
+
+    def send_email_batch(emails, service_account_token=None):  # pylint:disable=unused-argument
+        return [{'status': 'SENT'} for _ in emails]
+
+    with patch.object(RestService, 'get_service_account_token', return_value='token') as mock_token, \
+            patch.object(notification, 'send_email_batch', side_effect=send_email_batch) as mock_send_batch:
+        assert EmailOutboxService.deliver_due() == 2
+
+    mock_token.assert_called_once()
+    mock_send_batch.assert_called_once()
+    sent_to = {email['email'] for email in mock_send_batch.call_args.args[0]}
+    assert sent_to == {TestParticipantInfo.participant1['email_address'].lower(),
+                       TestParticipantInfo.participant2['email_address'].lower()}
+    mails = EmailOutboxModel.query.filter_by(entity_id=eng.id).all()
+    assert all(mail.status == OutboxStatus.SENT and mail.sent_date and mail.attempts == 1 for mail in mails)
+
+
+def test_deliver_due_emails_failure_is_retried(session):  # pylint:disable=unused-argument
+    """Assert that a failed email stays pending and is scheduled for a later attempt."""
+    eng = _factory_closed_engagement_outbox()
+
+    with patch.object(RestService, 'get_service_account_token', return_value='token'), \
+            patch.object(notification, 'send_email_batch', side_effect=Exception('Service unavailable')):
+        assert EmailOutboxService.deliver_due() == 0
+
+    mails = EmailOutboxModel.query.filter_by(entity_id=eng.id).all()
+    for mail in mails:
+        assert mail.status == OutboxStatus.PENDING
+        assert mail.attempts == 1
+        assert mail.last_error == 'Service unavailable'
+        assert mail.next_attempt_date > datetime.utcnow()
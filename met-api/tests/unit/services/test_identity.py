@@ -0,0 +1,47 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Identity service.
+
+Test suite to ensure that the identity of the user is resolved once per request.
+"""
+from flask import current_app, g
+
+from met_api.services.identity_service import IdentityService
+from tests.utilities.factory_utils import factory_engagement_model, factory_membership_model, factory_staff_user_model
+from tests.utilities.query_counter import count_statements
+
+
+def test_identity_resolved_once_per_request(session):  # pylint:disable=unused-argument
+    """Assert that the staff user and memberships are read once for all the checks of a request."""
+    user = factory_staff_user_model()
+    eng = factory_engagement_model()
+    other_eng = factory_engagement_model()
+    factory_membership_model(user_id=user.id, engagement_id=eng.id)
+    external_id = user.external_id
+    eng_id, other_eng_id = eng.id, other_eng.id
+
+    with current_app.test_request_context():
+        g.jwt_oidc_token_info = {'sub': external_id}
+        with count_statements() as statements:
+            assert IdentityService.get_staff_user(external_id).external_id == external_id
+            assert len(IdentityService.get_active_memberships(external_id, eng_id)) == 1
+            assert IdentityService.get_active_memberships(external_id, other_eng_id) == []
+            assert len(IdentityService.get_active_memberships(external_id, str(eng_id))) == 1
+        assert len(statements) == 2
+
+        # a new token is a new identity
+        g.jwt_oidc_token_info = {'sub': external_id}
+        with count_statements() as statements:
+            IdentityService.get_staff_user(external_id)
+        assert len(statements) == 1
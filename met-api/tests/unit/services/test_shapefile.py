@@ -0,0 +1,71 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Shapefile service.
+
+Test suite to ensure that the shapefiles are converted to geojson as expected.
+"""
+import io
+import json
+import os
+import tempfile
+import zipfile
+
+import geopandas as gpd
+from shapely.geometry import Polygon
+from werkzeug.datastructures import FileStorage
+
+from met_api.services.shapefile_service import ShapefileService
+
+
+def _factory_shapefile_upload():
+    """Return an uploaded zip holding a shapefile with a detailed polygon."""
+    # a square with many points along its edges, which simplification reduces to its corners
+    edge = [i / 100 for i in range(100)]
+    points = [(x, 0) for x in edge] + [(1, y) for y in edge] + [(1 - x, 1) for x in edge] + [(0, 1 - y) for y in edge]
+    points = [(x + 0.123456789, y + 0.123456789) for x, y in points]
+    gdf = gpd.GeoDataFrame({'name': ['square']}, geometry=[Polygon(points)], crs='EPSG:4326')
+
+    zip_buffer = io.BytesIO()
+    with tempfile.TemporaryDirectory() as shapefile_dir:
+        gdf.to_file(os.path.join(shapefile_dir, 'square.shp'))
+        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+            for file_name in os.listdir(shapefile_dir):
+                zip_file.write(os.path.join(shapefile_dir, file_name), file_name)
+    zip_buffer.seek(0)
+    return FileStorage(stream=zip_buffer, filename='square.zip')
+
+
+def test_convert_to_geojson(session):  # pylint:disable=unused-argument
+    """Assert that the shapefile is converted as is when no simplification or precision is asked for."""
+    geojson = json.loads(ShapefileService.convert_to_geojson(_factory_shapefile_upload()))
+    feature = geojson['features'][0]
+    assert feature['properties']['name'] == 'square'
+    assert len(feature['geometry']['coordinates'][0]) == 401
+
+
+def test_convert_to_geojson_simplified(session):  # pylint:disable=unused-argument
+    """Assert that the geometries are simplified and their coordinates rounded."""
+    geojson = json.loads(ShapefileService.convert_to_geojson(
+        _factory_shapefile_upload(), simplify_tolerance='0.001', coordinate_precision='3'))
+    coordinates = geojson['features'][0]['geometry']['coordinates'][0]
+    assert len(coordinates) == 5
+    assert all(round(value, 3) == value for point in coordinates for value in point)
+
+
+def test_convert_to_geojson_rounded(session):  # pylint:disable=unused-argument
+    """Assert that the coordinates are rounded without simplifying the geometries."""
+    geojson = json.loads(ShapefileService.convert_to_geojson(_factory_shapefile_upload(), coordinate_precision='2'))
+    coordinates = geojson['features'][0]['geometry']['coordinates'][0]
+    assert len(coordinates) == 401
+    assert coordinates[0] == [0.12, 0.12]
@@ -0,0 +1,61 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the database pool utilities.
+
+Test-Suite to ensure that the pool and statement timeout settings are applied to the engine.
+"""
+import pytest
+from sqlalchemy import create_engine, exc
+
+from met_api.models import db
+from met_api.utils.db_pool import MeteredQueuePool, get_engine_options, get_pool_metrics
+
+
+def test_engine_options(app):
+    """Assert that the engine uses the metered pool and the statement timeout of the config."""
+    options = get_engine_options(app.config)
+    assert options.get('poolclass') is MeteredQueuePool
+    assert options.get('pool_size') == int(app.config.get('DB_POOL_SIZE'))
+    assert options.get('connect_args') == {
+        'options': f'-c statement_timeout={int(app.config.get("DB_STATEMENT_TIMEOUT"))}'}
+
+    pgbouncer_options = get_engine_options({**app.config, 'DB_PGBOUNCER': 'true'})
+    assert 'connect_args' not in pgbouncer_options, 'PgBouncer does not accept startup options.'
+
+
+def test_statement_timeout(session):  # pylint:disable=unused-argument
+    """Assert that the statement timeout is set on the connections."""
+    assert isinstance(db.engine.pool, MeteredQueuePool)
+    assert session.execute('SHOW statement_timeout').scalar() == '1min'
+
+
+def test_pool_metrics():
+    """Assert that the checkouts which wait for a connection are recorded."""
+    engine = create_engine('sqlite://', poolclass=MeteredQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.1)
+    connection = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    metrics = get_pool_metrics(engine.pool)
+    assert metrics.get('checked_out') == 1
+    assert metrics.get('waits') == 1
+    assert metrics.get('timeouts') == 1
+    assert metrics.get('max_wait_seconds') >= 0.1
+
+    connection.close()
+    engine.connect().close()
+    metrics = get_pool_metrics(engine.pool)
+    assert metrics.get('checked_out') == 0
+    assert metrics.get('waits') == 1, 'A checkout served by an idle connection did not wait.'
+    assert metrics.get('timeouts') == 1
@@ -0,0 +1,39 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the GeoJSON utilities.
+
+Test-Suite to ensure that the GeoJSON methods are working as expected.
+"""
+import json
+
+from met_api.utils.geojson import compact_geojson
+
+
+def test_compact_geojson():
+    """Assert that the coordinates are quantized, the repeated points dropped and the bounding box computed."""
+    ring = [[0.1234561, 0.1234561], [0.1234564, 0.1234564], [1.5, 0.5], [1.5, 2.25], [0.1234561, 0.1234561]]
+    geojson = json.dumps({
+        'type': 'FeatureCollection',
+        'features': [{'type': 'Feature', 'properties': {'name': 'area'},
+                      'geometry': {'type': 'Polygon', 'coordinates': [ring]}}]
+    }, indent=2)
+
+    compact, bbox, geojson_hash = compact_geojson(geojson, 3)
+
+    assert ' ' not in compact
+    feature = json.loads(compact)['features'][0]
+    assert feature['properties'] == {'name': 'area'}
+    assert feature['geometry']['coordinates'] == [[[0.123, 0.123], [1.5, 0.5], [1.5, 2.25], [0.123, 0.123]]]
+    assert bbox == [0.123, 0.123, 1.5, 2.25]
+    assert compact_geojson(compact, 3)[2] == geojson_hash
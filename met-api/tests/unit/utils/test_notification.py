@@ -17,9 +17,14 @@
 Test-Suite to ensure that the Notification methods are working as expected.
 """
 
+from unittest.mock import patch
+
 import pytest
+from flask import current_app
 
+from met_api.models.tenant import Tenant
 from met_api.utils import notification
+from tests.utilities.factory_utils import factory_tenant_model
 
 
 @pytest.mark.parametrize('test_input_email,expected',
@@ -27,3 +32,44 @@ from met_api.utils import notification
 def test_is_valid_email(test_input_email, expected):
     """Assert that the valid email method works well.."""
     assert notification.is_valid_email(test_input_email) == expected
+
+
+def test_get_tenant_site_url_uses_cache(session):  # pylint:disable=unused-argument
+    """Assert that the tenant site url is built from the tenant cache after the first lookup."""
+    tenant = factory_tenant_model()
+    site_url = current_app.config.get('SITE_URL', '')
+    assert notification.get_tenant_site_url(tenant.id, '/path') == f'{site_url}/{tenant.short_name}/path'
+
+    with patch.object(Tenant, 'find_by_id') as mock_find_by_id:
+        assert notification.get_tenant_site_url(tenant.id) == f'{site_url}/{tenant.short_name}'
+        mock_find_by_id.assert_not_called()
+
+
+def test_send_email_batch(session):  # pylint:disable=unused-argument
+    """Assert that the emails are sent in a single call and the invalid ones are failed without being sent."""
+    emails = [
+        {'subject': 'subject', 'email': 'one@gov.bc.ca', 'html_body': 'body', 'args': {}, 'template_id': '1'},
+        {'subject': 'subject', 'email': 'invalid', 'html_body': 'body', 'args': {}, 'template_id': '1'},
+        {'subject': 'subject', 'email': 'two@gov.bc.ca', 'html_body': 'body', 'args': {}, 'template_id': '1'},
+    ]
+    with patch('met_api.utils.notification.requests.post') as mock_post:
+        mock_post.return_value.json.return_value = {'results': [{'status': 'SENT'}, {'status': 'SENT'}]}
+        results = notification.send_email_batch(emails, service_account_token='token')
+
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0].endswith('/batch')
+    assert [result['status'] for result in results] == ['SENT', 'FAILED', 'SENT']
+
+
+def test_send_email_batch_missing_results(session):  # pylint:disable=unused-argument
+    """Assert that the emails without a result in the response are failed."""
+    emails = [
+        {'subject': 'subject', 'email': 'one@gov.bc.ca', 'html_body': 'body', 'args': {}, 'template_id': '1'},
+        {'subject': 'subject', 'email': 'two@gov.bc.ca', 'html_body': 'body', 'args': {}, 'template_id': '1'},
+    ]
+    with patch('met_api.utils.notification.requests.post') as mock_post:
+        mock_post.return_value.json.return_value = {'results': [{'status': 'SENT'}]}
+        results = notification.send_email_batch(emails, service_account_token='token')
+
+    assert [result['status'] for result in results] == ['SENT', 'FAILED']
+    assert results[1]['error']
@@ -0,0 +1,96 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the routing of the reads to the replica.
+
+Test-Suite to ensure that the read only endpoints read from the replica and everything else from the primary.
+"""
+import pytest
+from sqlalchemy import update
+
+from met_api.models import db
+from met_api.models.engagement import Engagement as EngagementModel
+from met_api.utils import read_replica
+from met_api.utils.read_replica import RECENT_WRITE_COOKIE, REPLICA_BIND, read_only
+
+
+@pytest.fixture
+def replica_app(app):
+    """Configure the replica bind, on the test database."""
+    binds = app.config.get('SQLALCHEMY_BINDS')
+    app.config['SQLALCHEMY_BINDS'] = {REPLICA_BIND: app.config.get('SQLALCHEMY_DATABASE_URI')}
+    yield app
+    app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def _get_binds(*clauses):
+    session = db.create_scoped_session()
+    try:
+        return [session().get_bind(EngagementModel.__mapper__, clause) for clause in clauses]
+    finally:
+        session.remove()
+
+
+def test_read_only_routing(replica_app):
+    """Assert that the read only endpoints read from the replica until they write."""
+    primary = db.get_engine(replica_app)
+    replica = db.get_engine(replica_app, bind=REPLICA_BIND)
+
+    with replica_app.test_request_context():
+        assert _get_binds(EngagementModel.query.statement) == [primary], 'Not a read only endpoint.'
+
+        binds = read_only(_get_binds)(
+            EngagementModel.query.statement,
+            EngagementModel.query.with_for_update().statement,
+            update(EngagementModel).values(name='name'),
+            EngagementModel.query.statement,
+        )
+        assert binds == [replica, primary, primary, primary]
+
+
+def test_read_from_primary(replica_app):
+    """Assert that the reads within primary go to the primary in the read only endpoints."""
+    primary_engine = db.get_engine(replica_app)
+    replica = db.get_engine(replica_app, bind=REPLICA_BIND)
+
+    def get_binds():
+        with read_replica.primary():
+            binds = _get_binds(EngagementModel.query.statement)
+        return [*binds, *_get_binds(EngagementModel.query.statement)]
+
+    with replica_app.test_request_context():
+        assert read_only(get_binds)() == [primary_engine, replica]
+
+
+def test_read_your_writes(replica_app):
+    """Assert that a client which has written reads from the primary for the window of the cookie."""
+    primary_engine = db.get_engine(replica_app)
+    replica = db.get_engine(replica_app, bind=REPLICA_BIND)
+
+    with replica_app.test_request_context():
+        assert read_only(_get_binds)(EngagementModel.query.statement) == [replica]
+        response = read_replica.set_recent_write_cookie(replica_app.response_class())
+        assert RECENT_WRITE_COOKIE not in response.headers.get('Set-Cookie', '')
+
+    with replica_app.test_request_context():
+        session = db.create_scoped_session()
+        session().get_bind(EngagementModel.__mapper__, update(EngagementModel).values(name='name'))
+        session.commit()
+        session.remove()
+        response = read_replica.set_recent_write_cookie(replica_app.response_class())
+        cookie = response.headers.get('Set-Cookie')
+        window = replica_app.config.get('DB_REPLICA_READ_YOUR_WRITES')
+        assert cookie.startswith(f'{RECENT_WRITE_COOKIE}=') and f'Max-Age={window}' in cookie
+
+    with replica_app.test_request_context(headers={'Cookie': f'{RECENT_WRITE_COOKIE}=1'}):
+        assert read_only(_get_binds)(EngagementModel.query.statement) == [primary_engine]
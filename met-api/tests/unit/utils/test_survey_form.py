@@ -0,0 +1,62 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the survey form utilities.
+
+Test-Suite to ensure that the component index of survey forms is built and refreshed as expected.
+"""
+from datetime import datetime
+
+from met_api.utils.survey_form import get_component_index
+
+
+SINGLE_PAGE_FORM = {
+    'display': 'form',
+    'components': [
+        {'key': 'simpletextarea', 'label': 'What do you think?', 'inputType': 'text'},
+        {'key': 'simplepostalcode', 'label': 'Postal code', 'inputType': 'number'},
+    ]
+}
+WIZARD_FORM = {
+    'display': 'wizard',
+    'components': [
+        {'key': 'page1', 'components': []},
+        {'key': 'page2', 'components': [{'key': 'comment', 'label': 'Any comment?', 'inputType': 'text'}]},
+    ]
+}
+
+
+def test_component_index_single_page():
+    """Assert that the labels and text components of a single page form are indexed."""
+    index = get_component_index(-1, datetime(2023, 6, 1), SINGLE_PAGE_FORM)
+    assert index.get_label('simpletextarea') == 'What do you think?'
+    assert index.get_label('simplepostalcode') == 'Postal code'
+    assert index.get_label('missing') is None
+    assert index.text_component_keys == ['simpletextarea']
+
+
+def test_component_index_wizard():
+    """Assert that the components of every page of a wizard are indexed."""
+    index = get_component_index(-2, datetime(2023, 6, 1), WIZARD_FORM)
+    assert index.get_label('comment') == 'Any comment?'
+    assert index.text_component_keys == ['comment']
+
+
+def test_component_index_refreshed_on_update():
+    """Assert that the index is reused for a survey version and rebuilt once the survey is updated."""
+    index = get_component_index(-3, datetime(2023, 6, 1), SINGLE_PAGE_FORM)
+    assert get_component_index(-3, datetime(2023, 6, 1), WIZARD_FORM) is index
+
+    updated_index = get_component_index(-3, datetime(2023, 6, 2), WIZARD_FORM)
+    assert updated_index.get_label('comment') == 'Any comment?'
+    assert updated_index.get_label('simpletextarea') is None
@@ -0,0 +1,36 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the Template utilities.
+
+Test-Suite to ensure that the email templates are rendered as expected.
+"""
+from unittest.mock import patch
+
+from met_api.utils.template import ENV, Template
+
+
+def test_precompile():
+    """Assert that all the email templates are compiled up front and then served without being loaded again."""
+    template_names = ENV.list_templates(extensions=['html'])
+    assert template_names
+
+    Template.precompile()
+
+    cached_names = {key[1] for key in ENV.cache.keys()}
+    assert set(template_names) <= cached_names
+    with patch.object(ENV.loader, 'get_source') as mock_get_source:
+        for template_name in template_names:
+            assert Template.get_template(template_name).name == template_name
+        mock_get_source.assert_not_called()
@@ -100,6 +100,17 @@ class _Config():  # pylint: disable=too-few-public-methods
     SQLALCHEMY_ECHO = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool of each process, the connections beyond the size are opened on demand up to the overflow
+    DB_POOL_SIZE = os.getenv('DB_POOL_SIZE', '5')
+    DB_MAX_OVERFLOW = os.getenv('DB_MAX_OVERFLOW', '10')
+    # Seconds a job waits for a connection of the pool, and after which a connection is replaced
+    DB_POOL_TIMEOUT = os.getenv('DB_POOL_TIMEOUT', '30')
+    DB_POOL_RECYCLE = os.getenv('DB_POOL_RECYCLE', '1800')
+    # Milliseconds after which the database cancels a statement, 0 for no limit
+    DB_STATEMENT_TIMEOUT = os.getenv('DB_STATEMENT_TIMEOUT', '0')
+    # Set when connecting through PgBouncer in transaction mode, which does not keep session settings
+    DB_PGBOUNCER = os.getenv('DB_PGBOUNCER', 'false')
+
     # JWT_OIDC Settings
     JWT_OIDC_WELL_KNOWN_CONFIG = os.getenv('JWT_OIDC_WELL_KNOWN_CONFIG')
     JWT_OIDC_ALGORITHMS = os.getenv('JWT_OIDC_ALGORITHMS', 'RS256')
@@ -141,12 +152,31 @@ class _Config():  # pylint: disable=too-few-public-methods
         os.getenv('ENGAGEMENT_CLOSEOUT_EMAIL_SUBJECT', '{engagement_name} - What we heard')
     NOTIFICATIONS_EMAIL_ENDPOINT = os.getenv('NOTIFICATIONS_EMAIL_ENDPOINT')
 
+    # Email outbox delivery
+    EMAIL_OUTBOX_BATCH_SIZE = os.getenv('EMAIL_OUTBOX_BATCH_SIZE', '500')
+    EMAIL_OUTBOX_MAX_WORKERS = os.getenv('EMAIL_OUTBOX_MAX_WORKERS', '10')
+    # Emails sent per call to the notification api
+    EMAIL_OUTBOX_SEND_CHUNK_SIZE = os.getenv('EMAIL_OUTBOX_SEND_CHUNK_SIZE', '50')
+    # Maximum emails sent per second, 0 to send as fast as the workers allow
+    EMAIL_OUTBOX_RATE_LIMIT = os.getenv('EMAIL_OUTBOX_RATE_LIMIT', '20')
+    EMAIL_OUTBOX_MAX_ATTEMPTS = os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '5')
+    # Seconds before the first retry of a failed email, doubled on each further attempt
+    EMAIL_OUTBOX_RETRY_DELAY = os.getenv('EMAIL_OUTBOX_RETRY_DELAY', '60')
+
     # config for comment_redact_service
     N_DAYS = os.getenv('N_DAYS', 14)
     REDACTION_TEXT = os.getenv('REDACTION_TEXT', '[Comment Redacted]')
 
     # config for email queue
     MAIL_BATCH_SIZE = os.getenv('MAIL_BATCH_SIZE', 10)
+    # number of queued mails processed in parallel
+    MAIL_MAX_WORKERS = os.getenv('MAIL_MAX_WORKERS', '4')
+    # a mail is marked as failed after this many unsuccessful runs
+    MAIL_MAX_ATTEMPTS = os.getenv('MAIL_MAX_ATTEMPTS', '3')
+    # number of subscriber email addresses read and decoded at a time
+    MAIL_RECIPIENT_CHUNK_SIZE = os.getenv('MAIL_RECIPIENT_CHUNK_SIZE', '1000')
+    # number of subscriber emails sent per call to the notification api
+    MAIL_SEND_CHUNK_SIZE = os.getenv('MAIL_SEND_CHUNK_SIZE', '50')
 
 
 class MigrationConfig():  # pylint: disable=too-few-public-methods
@@ -169,6 +199,14 @@ class MigrationConfig():  # pylint: disable=too-few-public-methods
     SQLALCHEMY_ECHO = True
     SQLALCHEMY_TRACK_MODIFICATIONS = True
 
+    DB_POOL_SIZE = _Config.DB_POOL_SIZE
+    DB_MAX_OVERFLOW = _Config.DB_MAX_OVERFLOW
+    DB_POOL_TIMEOUT = _Config.DB_POOL_TIMEOUT
+    DB_POOL_RECYCLE = _Config.DB_POOL_RECYCLE
+    # migrations may rewrite large tables, they are not bound by a statement timeout
+    DB_STATEMENT_TIMEOUT = 0
+    DB_PGBOUNCER = _Config.DB_PGBOUNCER
+
     print(f'SQLAlchemy URL (_Config): {SQLALCHEMY_DATABASE_URI}')
 
 
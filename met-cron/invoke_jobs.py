@@ -28,6 +28,8 @@ setup_logging(os.path.join(os.path.abspath(os.path.dirname(__file__)), 'logging.
 
 def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
     """Return a configured Flask App using the Factory method."""
+    from met_api.utils.cache import cache
+    from met_api.utils.db_pool import get_engine_options, init_engines
     from met_cron.models import db, ma
 
     app = Flask(__name__)
@@ -37,8 +39,12 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
     app.config.from_object(config.CONFIGURATION[run_mode])
     # Configure Sentry
     app.logger.info(f'<<<< Starting Jobs >>>>')
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(app.config))
     db.init_app(app)
+    init_engines(app, db)
     ma.init_app(app)
+    # tenant lookups used while building email links are served from this cache
+    cache.init_app(app)
 
     register_shellcontext(app)
 
@@ -63,6 +69,7 @@ def run(job_name):
     from tasks.met_purge import MetPurge
     from tasks.met_comment_redact import MetCommentRedact
     from tasks.subscription_mailer import SubscriptionMailer
+    from tasks.email_outbox import EmailOutboxDelivery
     application = create_app()
 
     application.app_context().push()
@@ -83,6 +90,9 @@ def run(job_name):
     elif job_name == 'PUBLISH_EMAIL':
         SubscriptionMailer.do_email()
         application.logger.info('<<<< Completed MET PUBLISH_EMAIL >>>>')
+    elif job_name == 'EMAIL_OUTBOX':
+        EmailOutboxDelivery.do_deliver()
+        application.logger.info('<<<< Completed MET EMAIL_OUTBOX >>>>')
     else:
         application.logger.debug('No valid args passed.Exiting job without running any ***************')
 
@@ -1,19 +1,29 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http import HTTPStatus
-from typing import List
+from itertools import islice
+from typing import Iterator, List
 
 from flask import current_app
-from met_api.constants.notification_status import NotificationStatus
 from met_api.exceptions.business_exception import BusinessException
+from met_api.models.db import db
 from met_api.models.email_queue import EmailQueue as EmailQueueModel
 from met_api.models.engagement import Engagement as EngagementModel
 from met_api.models.participant import Participant as ParticipantModel
 from met_api.models.subscription import Subscription as SubscriptionModel
+from met_api.services.rest_service import RestService
 from met_api.utils import notification
 from met_api.utils.enums import SourceType, SourceAction
 from met_api.utils.template import Template
 
-from met_cron.models.db import db
+
+# Number of distinct errors kept on the queue row of a mail which failed for some of its recipients
+MAX_FAILURE_ERRORS = 5
+
+
+class PartialSendError(Exception):
+    """The mail was sent to some of its recipients before failing."""
 
 
 class EmailService:  # pylint: disable=too-few-public-methods
@@ -23,66 +33,122 @@ class EmailService:  # pylint: disable=too-few-public-methods
     def do_mail():
         """Send mail by listening to the email_queue.
 
-            1. Get N number of unprocessed recoreds from the email_queue table
-            2. Process each mail and send it to subscribed users
+            1. Claim N number of unprocessed recoreds from the email_queue table
+            2. Process the claimed mails in a pool of workers and send them to subscribed users
 
+        Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several cron pods can run this together.
         """
         email_batch_size: int = int(current_app.config.get('MAIL_BATCH_SIZE'))
-        mails = EmailQueueModel.get_unprocessed_mails(email_batch_size)
-        mail: EmailQueueModel
-        for mail in mails:
-            # Process each mails.First set status as PROCESSING
-            mail.notification_status = NotificationStatus.PROCESSING.value
-            mail.updated_date = datetime.utcnow()
-            mail.commit()
-            # Commenting it out for now since we are not sending email for engagement creation
-            #if mail.entity_type == SourceType.ENGAGEMENT.value and mail.action == SourceAction.CREATED.value:
-            #    EmailService._send_mail_for_new_engagement(mail)
-            #    mail.notification_status = NotificationStatus.SENT.value
-            #    mail.updated_date = datetime.utcnow()
-            #    mail.commit()
-            if mail.entity_type == SourceType.ENGAGEMENT.value and mail.action == SourceAction.PUBLISHED.value:
-                EmailService._send_mail_for_published_engagement(mail)
-                mail.notification_status = NotificationStatus.SENT.value
+        mail_ids = [mail.id for mail in EmailQueueModel.claim_unprocessed_mails(email_batch_size)]
+        if not mail_ids:
+            return
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        with ThreadPoolExecutor(max_workers=int(current_app.config.get('MAIL_MAX_WORKERS'))) as executor:
+            # list() waits for all the mails and surfaces any unexpected error
+            list(executor.map(lambda mail_id: EmailService._process_mail(app, mail_id), mail_ids))
+
+    @staticmethod
+    def _process_mail(app, mail_id):
+        """Process a claimed mail in its own app context and database session."""
+        with app.app_context():
+            try:
+                mail: EmailQueueModel = EmailQueueModel.find_by_id(mail_id)
+                # Commenting it out for now since we are not sending email for engagement creation
+                #if mail.entity_type == SourceType.ENGAGEMENT.value and mail.action == SourceAction.CREATED.value:
+                #    EmailService._send_mail_for_new_engagement(mail)
+                if mail.entity_type != SourceType.ENGAGEMENT.value or mail.action != SourceAction.PUBLISHED.value:
+                    return
+                try:
+                    failures = EmailService._send_mail_for_published_engagement(mail)
+                    if failures:
+                        # the other recipients got the mail, so the failed ones are recorded rather than retried
+                        current_app.logger.error(f'<Email queue {mail_id} failed for {len(failures)} recipients')
+                        mail.mark_failed(EmailService._describe_failures(failures),
+                                         int(current_app.config.get('MAIL_MAX_ATTEMPTS')), retry=False)
+                    else:
+                        mail.mark_sent()
+                except PartialSendError as exc:
+                    # a retry would send the mail again to the recipients of the chunks already sent
+                    current_app.logger.error(f'<Processing of email queue {mail_id} failed partway: {exc}')
+                    mail.mark_failed(str(exc), int(current_app.config.get('MAIL_MAX_ATTEMPTS')), retry=False)
+                except Exception as exc:  # noqa: B902
+                    current_app.logger.error(f'<Processing of email queue {mail_id} failed: {exc}')
+                    mail.mark_failed(str(exc), int(current_app.config.get('MAIL_MAX_ATTEMPTS')))
                 mail.updated_date = datetime.utcnow()
                 mail.commit()
+            finally:
+                db.session.remove()
 
     @staticmethod
-    def _send_mail_for_published_engagement(mail):
+    def _send_mail_for_published_engagement(mail) -> List[dict]:
+        """Send the mail to the subscribers of the tenant and return the results of the recipients which failed."""
         eng: EngagementModel = EngagementModel.find_by_id(mail.entity_id)
         template_id = current_app.config.get('PUBLISH_ENGAGEMENT_EMAIL_TEMPLATE_ID', None)
         subject, body, args = EmailService._render_email_template(eng)
-        # find emails from the subscription table
-        subscription_list: List[SubscriptionModel] = db.session.query(SubscriptionModel).distinct().filter(
-            SubscriptionModel.is_subscribed == True).all()
-        subscriber: SubscriptionModel
-        email_list = []
-        for subscriber in subscription_list:
+        send_chunk_size: int = int(current_app.config.get('MAIL_SEND_CHUNK_SIZE'))
+        service_account_token = RestService.get_service_account_token()
+        sent_count = 0
+        failures = []
+        try:
+            for email_list in EmailService._get_subscribed_email_chunks(eng.tenant_id):
+                for start in range(0, len(email_list), send_chunk_size):
+                    emails = [{
+                        'subject': subject,
+                        'email': email,
+                        'html_body': body,
+                        'args': args,
+                        'template_id': template_id,
+                    } for email in email_list[start:start + send_chunk_size]]
+                    failures.extend(EmailService._send_chunk(eng, emails, service_account_token))
+                    sent_count += len(emails)
+        except Exception as exc:  # noqa: B902
+            if sent_count:
+                error = getattr(exc, 'error', exc)
+                raise PartialSendError(
+                    f'Publish engagement notification sent to {sent_count} recipients before failing: {error}'
+                ) from exc
+            raise
+        return failures
+
+    @staticmethod
+    def _send_chunk(eng, emails, service_account_token) -> List[dict]:
+        try:
+            results = notification.send_email_batch(emails, service_account_token=service_account_token)
+        except Exception as exc:  # noqa: B902
+            current_app.logger.error('<Notification for publish engagement failed: %s', exc)
+            raise BusinessException(
+                error='Error sending publish engagement notification email.',
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR) from exc
+        failures = [result for result in results if result.get('status') != 'SENT']
+        if failures:
+            current_app.logger.error(
+                f'<{len(failures)} publish engagement notifications for engagement {eng.id} failed')
+        return failures
+
+    @staticmethod
+    def _describe_failures(failures: List[dict]) -> str:
+        """Summarize the failed recipients by error, leaving out their addresses."""
+        errors = Counter(failure.get('error') or 'Unknown error' for failure in failures)
+        summary = '; '.join(f'{count} x {error}' for error, count in errors.most_common(MAX_FAILURE_ERRORS))
+        return f'Publish engagement notification failed for {len(failures)} recipients: {summary}'
+
+    @staticmethod
+    def _get_subscribed_email_chunks(tenant_id) -> Iterator[List[str]]:
+        """Stream the decoded email addresses of the subscribers in chunks.
+
+        The addresses are deduplicated by the database and read through a server side cursor.
+        """
+        chunk_size: int = int(current_app.config.get('MAIL_RECIPIENT_CHUNK_SIZE'))
+        rows = iter(SubscriptionModel.get_subscribed_email_addresses(tenant_id).yield_per(chunk_size))
+        while chunk := list(islice(rows, chunk_size)):
             try:
-                Participant = ParticipantModel.find_by_id(subscriber.participant_id)
-                if Participant.email_address is not None:
-                    email_address = ParticipantModel.decode_email(Participant.email_address)
-                    if email_address not in email_list:
-                        email_list.append(email_address)
+                yield ParticipantModel.decode_emails([row.email_address for row in chunk])
             except Exception as exc:  # noqa: B902
                 current_app.logger.error('<Extracting email address for subscribers failed', exc)
                 raise BusinessException(
                     error='Error extracting email address for subscribers.',
                     status_code=HTTPStatus.INTERNAL_SERVER_ERROR) from exc
 
-        for email in email_list:
-            try:
-                notification.send_email(subject=subject,
-                                        email=email,
-                                        html_body=body,
-                                        args=args,
-                                        template_id=template_id)                
-            except Exception as exc:  # noqa: B902
-                current_app.logger.error('<Notification for publish engagement failed', exc)
-                raise BusinessException(
-                    error='Error sending publish engagement notification email.',
-                    status_code=HTTPStatus.INTERNAL_SERVER_ERROR) from exc
-
     @staticmethod
     def _render_email_template(eng):
         site_url = notification.get_tenant_site_url(eng.tenant_id)
@@ -0,0 +1,29 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""MET Email Outbox Delivery."""
+from datetime import datetime
+
+from met_api.services.email_outbox_service import EmailOutboxService
+
+
+class EmailOutboxDelivery:  # pylint:disable=too-few-public-methods
+    """Task to deliver the emails waiting in the email outbox."""
+
+    @classmethod
+    def do_deliver(cls):
+        """Deliver the pending emails which are due."""
+        print('Starting Email Outbox Delivery at------------------------', datetime.now())
+
+        delivered = EmailOutboxService.deliver_due()
+        print('Emails delivered: ', delivered)
@@ -14,6 +14,7 @@
 """MET Engagement Closure."""
 from datetime import datetime
 
+from met_api.services.email_outbox_service import EmailOutboxService
 from met_api.services.engagement_service import EngagementService
 
 
@@ -26,3 +27,5 @@ class MetEngagementCloseout:  # pylint:disable=too-few-public-methods
         print('Starting Met Engagement Closeout at------------------------', datetime.now())
 
         EngagementService.close_engagements_due()
+        # Deliver the closeout emails now; whatever fails is retried by the EMAIL_OUTBOX job
+        EmailOutboxService.deliver_due()
@@ -10,6 +10,7 @@ const GetRequest = <T>(url: string, params = {}, headers = {}) => {
             'tenant-id': `${sessionStorage.getItem('tenantId')}`,
             ...headers,
         },
+        withCredentials: true,
     });
 };
 
@@ -21,6 +22,7 @@ const PostRequest = <T>(url: string, data = {}, params = {}) => {
             Authorization: `Bearer ${UserService.getToken()}`,
             'tenant-id': `${sessionStorage.getItem('tenantId')}`,
         },
+        withCredentials: true,
     });
 };
 
@@ -32,6 +34,7 @@ const PutRequest = <T>(url: string, data = {}, params = {}) => {
             Authorization: `Bearer ${UserService.getToken()}`,
             'tenant-id': `${sessionStorage.getItem('tenantId')}`,
         },
+        withCredentials: true,
     });
 };
 
@@ -42,6 +45,7 @@ const PatchRequest = <T>(url: string, data = {}) => {
             Authorization: `Bearer ${UserService.getToken()}`,
             'tenant-id': `${sessionStorage.getItem('tenantId')}`,
         },
+        withCredentials: true,
     });
 };
 
@@ -53,6 +57,7 @@ const DeleteRequest = <T>(url: string, params = {}) => {
             Authorization: `Bearer ${UserService.getToken()}`,
             'tenant-id': `${sessionStorage.getItem('tenantId')}`,
         },
+        withCredentials: true,
     });
 };
 
@@ -19,6 +19,7 @@ from flask import Flask
 from notify_api.auth import jwt as jwt_manager
 from notify_api.config import get_named_config
 from notify_api.resources import API
+from notify_api.services.email import email_queue
 
 
 def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
@@ -28,6 +29,7 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
     app.config.from_object(get_named_config(run_mode))
     API.init_app(app)
     setup_jwt_manager(app)
+    email_queue.init_app(app)
 
     @app.after_request
     def add_version(response):  # pylint:  disable=unused-variable
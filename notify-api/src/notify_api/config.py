@@ -20,6 +20,7 @@ rather than reading environment variables directly or by accessing this configur
 
 import os
 import sys
+import tempfile
 
 from dotenv import find_dotenv, load_dotenv
 
@@ -59,6 +60,24 @@ class _Config():  # pylint: disable=too-few-public-methods
     GC_NOTIFY_API_KEY = os.getenv('GC_NOTIFY_API_KEY')
     GC_NOTIFY_API_BASE_URL = os.getenv('GC_NOTIFY_API_BASE_URL')
 
+    # Batch email sending
+    EMAIL_BATCH_MAX_SIZE = int(os.getenv('EMAIL_BATCH_MAX_SIZE', '500'))
+    EMAIL_BATCH_MAX_WORKERS = int(os.getenv('EMAIL_BATCH_MAX_WORKERS', '10'))
+
+    # Async email mode: emails are accepted into a local queue and delivered in the background
+    EMAIL_ASYNC_MODE = os.getenv('EMAIL_ASYNC_MODE', 'false').lower() == 'true'
+    # The queue database has to be on a persistent volume shared by the worker processes, so that accepted emails
+    # survive a restart; the async mode does not start without it
+    EMAIL_QUEUE_DB_PATH = os.getenv('EMAIL_QUEUE_DB_PATH')
+    EMAIL_QUEUE_MAX_WORKERS = int(os.getenv('EMAIL_QUEUE_MAX_WORKERS', '5'))
+    # An email is dead-lettered after this many failed attempts
+    EMAIL_QUEUE_MAX_ATTEMPTS = int(os.getenv('EMAIL_QUEUE_MAX_ATTEMPTS', '5'))
+    # Seconds before the first retry of a failed email, doubled on each further attempt
+    EMAIL_QUEUE_RETRY_DELAY = int(os.getenv('EMAIL_QUEUE_RETRY_DELAY', '30'))
+    EMAIL_QUEUE_POLL_INTERVAL = int(os.getenv('EMAIL_QUEUE_POLL_INTERVAL', '5'))
+    # Seconds after which an email left processing by a stopped process is picked up again
+    EMAIL_QUEUE_PROCESSING_TIMEOUT = int(os.getenv('EMAIL_QUEUE_PROCESSING_TIMEOUT', '300'))
+
     #   Set up OIDC variables.
     SECRET_KEY = os.getenv('SECRET_KEY')
 
@@ -77,6 +96,8 @@ class _Config():  # pylint: disable=too-few-public-methods
 class DevConfig(_Config):  # pylint: disable=too-few-public-methods
     """Development environment configuration."""
 
+    EMAIL_QUEUE_DB_PATH = os.getenv('EMAIL_QUEUE_DB_PATH', os.path.join(tempfile.gettempdir(), 'email_queue.db'))
+
     TESTING = False
     DEBUG = True
 
@@ -84,6 +105,8 @@ class DevConfig(_Config):  # pylint: disable=too-few-public-methods
 class TestConfig(_Config):  # pylint: disable=too-few-public-methods
     """In support of testing only used by the py.test suite."""
 
+    EMAIL_QUEUE_DB_PATH = os.getenv('EMAIL_QUEUE_DB_PATH', os.path.join(tempfile.gettempdir(), 'email_queue.db'))
+
     DEBUG = True
     TESTING = True
 
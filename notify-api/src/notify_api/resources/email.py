@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Endpoints to check manage notifications."""
-from flask import jsonify, request
+from http import HTTPStatus
+
+from flask import current_app, jsonify, request
 from flask_restx import Namespace, Resource
 
 from notify_api.auth import Auth
-from notify_api.services.email import get_email_service
+from notify_api.services.email import email_queue, get_email_service
 
 API = Namespace('notifications', description='API for Sending MET Notifications')
 
@@ -28,7 +30,53 @@ class EmailNotification(Resource):
     @staticmethod
     @Auth.require
     def post():
-        """Send email notification."""
+        """Send email notification.
+
+        In async mode the email is queued for delivery and its message id is returned with a 202 status.
+        """
         email_payload = request.get_json(force=True)
-        get_email_service().send(email_payload)
+        if current_app.config['EMAIL_ASYNC_MODE']:
+            message_id = email_queue.queue_email(email_payload)
+            return {'id': message_id}, HTTPStatus.ACCEPTED
+        get_email_service().dispatch(email_payload)
         return jsonify({})
+
+
+@API.route('/email/<string:message_id>')
+class EmailNotificationStatus(Resource):
+    """Queued notification status resource."""
+
+    @staticmethod
+    @Auth.require
+    def get(message_id):
+        """Return the delivery status of an email queued in async mode."""
+        if not current_app.config['EMAIL_ASYNC_MODE']:
+            return {'message': 'Emails are only queued in async mode.'}, HTTPStatus.NOT_FOUND
+        email_status = email_queue.get_email_status(message_id)
+        if email_status is None:
+            return {'message': 'Email not found.'}, HTTPStatus.NOT_FOUND
+        return jsonify(email_status)
+
+
+@API.route('/email/batch')
+class EmailBatchNotification(Resource):
+    """Batch notification resource."""
+
+    @staticmethod
+    @Auth.require
+    def post():
+        """Send many email notifications and return the delivery status of each of them, in order.
+
+        The request either lists full email payloads under 'emails', or holds one email payload with a list of
+        'recipients' which each get their own copy of the email; both can be combined.
+        """
+        batch_payload = request.get_json(force=True)
+        email_payloads = list(batch_payload.pop('emails', []))
+        recipients = batch_payload.pop('recipients', [])
+        email_payloads.extend({**batch_payload, 'to': [recipient]} for recipient in recipients)
+
+        if len(email_payloads) > current_app.config['EMAIL_BATCH_MAX_SIZE']:
+            return {'message': f"A batch can hold at most {current_app.config['EMAIL_BATCH_MAX_SIZE']} emails."}, \
+                HTTPStatus.BAD_REQUEST
+        results = get_email_service().send_batch(email_payloads, current_app.config['EMAIL_BATCH_MAX_WORKERS'])
+        return jsonify({'results': results})
@@ -15,6 +15,8 @@
 
 from flask_restx import Namespace, Resource, cors
 
+from notify_api.services.email import email_queue, get_email_service
+
 API = Namespace('', description='API for Sending MET Notifications')
 
 
@@ -42,3 +44,17 @@ class Ready(Resource):
         """Return a JSON object that identifies if the service is setupAnd ready to work."""
         # add a poll to the DB when called
         return {'message': 'api is ready'}, 200
+
+
+@API.route('/metrics')
+class Metrics(Resource):
+    """Email dispatch metrics of this process."""
+
+    @staticmethod
+    @cors.crossdomain(origin='*')
+    def get():
+        """Return the send rate and counters of the email provider, and the depth of the email queues."""
+        return {
+            'email': get_email_service().get_metrics(),
+            'email_queue': email_queue.get_queue_depth(),
+        }, 200
@@ -13,13 +13,16 @@
 # limitations under the License.
 """Initialize and inject the email service by type."""
 import os
+from functools import lru_cache
+
 from .email_base_service import EmailBaseService
 from .email_ches_notify import EmailChesNotify
 from .email_gc_notify import EmailGCNotify
 
 
-def get_email_service():
-    """Return SMS Service implementation."""
+@lru_cache(maxsize=None)
+def get_email_service() -> EmailBaseService:
+    """Return the Email Service implementation, created once per process."""
     _instance: EmailBaseService
     if os.getenv('EMAIL_PROVIDER') == 'GC_NOTIFY':
         _instance = EmailGCNotify()
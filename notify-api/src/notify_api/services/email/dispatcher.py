@@ -0,0 +1,95 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rate limiting and metrics for the emails dispatched to a provider."""
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+
+# Window over which the send rate is measured, in seconds
+SEND_RATE_WINDOW_SECONDS = 60
+
+
+class TokenBucket:
+    """Token bucket shared by all the threads of the process, refilled at a steady rate up to its capacity."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Create a bucket; a rate of zero or less disables the limit."""
+        self._rate = rate
+        self._capacity = max(capacity, 1)
+        self._tokens = float(self._capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.waiting = 0
+
+    def acquire(self, count: int = 1):
+        """Block until count tokens are available and take them."""
+        if self._rate <= 0:
+            return
+        with self._lock:
+            self.waiting += 1
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                    self._updated_at = now
+                    # A request larger than the bucket waits for a full bucket and takes all of it
+                    needed = min(count, self._capacity)
+                    if self._tokens >= needed:
+                        self._tokens -= needed
+                        return
+                    wait_for = (needed - self._tokens) / self._rate
+                time.sleep(wait_for)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+
+class DispatchMetrics:
+    """Counters of the emails dispatched to a provider by this process."""
+
+    def __init__(self):
+        """Start the counters at zero."""
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._recent_sends = deque()
+
+    def record(self, sent: bool, count: int = 1):
+        """Record the outcome of count emails."""
+        now = time.monotonic()
+        with self._lock:
+            if sent:
+                self._sent += count
+                self._recent_sends.append((now, count))
+            else:
+                self._failed += count
+            self._expire(now)
+
+    def _expire(self, now: float):
+        while self._recent_sends and self._recent_sends[0][0] < now - SEND_RATE_WINDOW_SECONDS:
+            self._recent_sends.popleft()
+
+    def as_dict(self) -> Dict:
+        """Return the counters and the send rate, in emails per second, over the last minute."""
+        with self._lock:
+            self._expire(time.monotonic())
+            recent_count = sum(count for _, count in self._recent_sends)
+            return {
+                'sent': self._sent,
+                'failed': self._failed,
+                'send_rate': round(recent_count / SEND_RATE_WINDOW_SECONDS, 2),
+            }
@@ -14,13 +14,54 @@
 """Abstract class for Email implementation."""
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .dispatcher import DispatchMetrics, TokenBucket
 
 
 class EmailBaseService(ABC):  # pylint: disable=too-few-public-methods
-    """Abstract base class for Email Service."""
+    """Abstract base class for Email Service.
+
+    Emails go through dispatch, which holds them back to the rate limit of the provider and counts them.
+    """
+
+    def __init__(self, rate_limit: float, burst: int):
+        """Set up the provider rate limit, in emails per second, and the dispatch metrics."""
+        self.rate_limiter = TokenBucket(rate_limit, burst)
+        self.metrics = DispatchMetrics()
 
     @abstractmethod
     def send(self, email_payload: Dict):
         """Send Email."""
         raise Exception('Not Implemented')
+
+    def dispatch(self, email_payload: Dict):
+        """Send the email once the provider rate limit allows it."""
+        self.rate_limiter.acquire()
+        try:
+            self.send(email_payload)
+        except Exception:  # noqa: B902
+            self.metrics.record(sent=False)
+            raise
+        self.metrics.record(sent=True)
+
+    def send_batch(self, email_payloads: List[Dict], max_workers: int) -> List[Dict]:
+        """Send the emails concurrently and return the delivery status of each of them, in order."""
+        def send(email_payload):
+            try:
+                self.dispatch(email_payload)
+                return {'status': 'SENT'}
+            except Exception as e:  # noqa: B902
+                return {'status': 'FAILED', 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(send, email_payloads))
+
+    def get_metrics(self) -> Dict:
+        """Return the dispatch metrics of the provider."""
+        return {
+            'provider': type(self).__name__,
+            'waiting_for_rate_limit': self.rate_limiter.waiting,
+            **self.metrics.as_dict(),
+        }
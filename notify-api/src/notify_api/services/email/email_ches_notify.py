@@ -17,41 +17,83 @@ This module is being invoked from a job and it sends SMS reminders to customers.
 """
 import os
 import json
+import threading
+import time
+from http import HTTPStatus
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from .email_base_service import EmailBaseService
 
+# Renew the token a little before it expires, so it does not expire in flight
+TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
 
 class EmailChesNotify(EmailBaseService):  # pylint: disable=too-few-public-methods
-    """Implementation from Ches Email Notify."""
+    """Implementation from Ches Email Notify.
+
+    A single instance is shared by the process, so the SSO token and the HTTP connections are reused across emails.
+    """
+
+    def __init__(self):
+        """Read the CHES settings and set up the pooled HTTP session."""
+        super().__init__(rate_limit=float(os.getenv('CHES_RATE_LIMIT', '10')),
+                         burst=int(os.getenv('CHES_RATE_LIMIT_BURST', '10')))
+        self._token_url = os.getenv('CHES_SSO_TOKEN_URL')
+        self._client_id = os.getenv('CHES_SSO_CLIENT_ID')
+        self._client_secret = os.getenv('CHES_SSO_CLIENT_SECRET')
+        self._email_endpoint = os.getenv('CHES_POST_EMAIL_ENDPOINT')
+        self._email_from = os.getenv('CHES_EMAIL_FROM_ID')
+        pool_size = int(os.getenv('EMAIL_PROVIDER_POOL_SIZE', '20'))
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=pool_size))
+        self._session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=pool_size))
+        self._token = None
+        self._token_expiry = 0
+        self._token_lock = threading.Lock()
+
+    def _get_token(self, renew=False):
+        """Return the cached SSO token, requesting a new one when it is missing or about to expire."""
+        with self._token_lock:
+            if self._token and not renew and time.monotonic() < self._token_expiry:
+                return self._token
+            token_request_data = \
+                f'client_id={self._client_id}&client_secret={self._client_secret}&grant_type=client_credentials'
+            token_request_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+            ches_token_response = self._session.post(self._token_url,
+                                                     data=token_request_data,
+                                                     headers=token_request_headers)
+            ches_token_response.raise_for_status()
+            token = ches_token_response.json()
+            self._token = token.get('access_token')
+            self._token_expiry = \
+                time.monotonic() + int(token.get('expires_in', 300)) - TOKEN_EXPIRY_MARGIN_SECONDS
+            return self._token
+
+    def _post_email(self, ches_payload, renew_token=False):
+        email_request_headers = \
+            {'Content-Type': 'application/json', 'Authorization': f'Bearer {self._get_token(renew_token)}'}
+        return self._session.post(self._email_endpoint,
+                                  headers=email_request_headers,
+                                  data=json.dumps(ches_payload))
 
     def send(self, email_payload):
         """Send email."""
-        ches_token_url = os.getenv('CHES_SSO_TOKEN_URL')
-        ches_client_id = os.getenv('CHES_SSO_CLIENT_ID')
-        ches_client_secret = os.getenv('CHES_SSO_CLIENT_SECRET')
-        ches_email_endpoint = os.getenv('CHES_POST_EMAIL_ENDPOINT')
         ches_payload = {
             'bodyType': email_payload.get('bodyType'),
             'body': email_payload.get('body'),
-            'from': os.getenv('CHES_EMAIL_FROM_ID'),
+            'from': self._email_from,
             'subject': email_payload.get('subject'),
             'to': email_payload.get('to')
         }
-        token_request_data = \
-            f'client_id={ches_client_id}&client_secret={ches_client_secret}&grant_type=client_credentials'
-        token_request_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         try:
-            ches_token_response = requests.post(ches_token_url,
-                                                data=token_request_data,
-                                                headers=token_request_headers)
-            ches_api_token = ches_token_response.json().get('access_token')
-            email_request_headers = \
-                {'Content-Type': 'application/json', 'Authorization': f'Bearer {ches_api_token}'}
-            email_response = requests.post(ches_email_endpoint,
-                                           headers=email_request_headers,
-                                           data=json.dumps(ches_payload))
+            email_response = self._post_email(ches_payload)
+            if email_response.status_code == HTTPStatus.UNAUTHORIZED:
+                # the cached token was revoked or expired early
+                email_response = self._post_email(ches_payload, renew_token=True)
             print(email_response)
+            email_response.raise_for_status()
         except Exception as e:  # noqa: B902
             print(e)  # log and continue
             raise e
@@ -0,0 +1,233 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent local queue for the emails accepted in async mode, and the worker delivering them.
+
+The queue is a SQLite database file at EMAIL_QUEUE_DB_PATH, which has to be on a persistent volume, so accepted
+emails survive a restart of the service. Every gunicorn worker process runs its own delivery worker; the rows are
+claimed inside an immediate (write locked) transaction, so no two processes send the same email.
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, List, Optional
+
+from flask import current_app
+
+from . import get_email_service
+
+
+class EmailQueueStatus:  # pylint: disable=too-few-public-methods
+    """Delivery states of a queued email."""
+
+    PENDING = 'PENDING'
+    PROCESSING = 'PROCESSING'
+    SENT = 'SENT'
+    DEAD_LETTER = 'DEAD_LETTER'
+
+
+class EmailQueue:
+    """SQLite backed queue of email payloads."""
+
+    def __init__(self, db_path: str):
+        """Open the queue database, creating the table when it does not exist yet."""
+        self._db_path = db_path
+        with self._connect() as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS email_message (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )""")
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS ix_email_message_due ON email_message (status, next_attempt_at)')
+
+    def _connect(self):
+        # Each call gets its own connection, so the queue can be used from any thread
+        connection = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return closing(connection)
+
+    def enqueue(self, email_payload: Dict) -> str:
+        """Store the email for delivery and return its message id."""
+        message_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                'INSERT INTO email_message (id, payload, status, next_attempt_at, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (message_id, json.dumps(email_payload), EmailQueueStatus.PENDING, now, now, now))
+        return message_id
+
+    def get_status(self, message_id: str) -> Optional[Dict]:
+        """Return the delivery state of a queued email, or None when the id is unknown."""
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT id, status, attempts, last_error, created_at, updated_at FROM email_message WHERE id = ?',
+                (message_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'id': row['id'],
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'last_error': row['last_error'],
+            'created_date': _isoformat(row['created_at']),
+            'updated_date': _isoformat(row['updated_at']),
+        }
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Return the number of queued emails in each state."""
+        with self._connect() as connection:
+            rows = connection.execute('SELECT status, COUNT(*) AS count FROM email_message GROUP BY status').fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+    def claim_due(self, max_size: int, processing_timeout: int) -> List[Dict]:
+        """Claim the pending emails which are due, marking them as processing.
+
+        Emails left processing for longer than the timeout, by a process which died, are claimed again.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                rows = connection.execute(
+                    'SELECT id, payload, attempts FROM email_message '
+                    'WHERE (status = ? AND next_attempt_at <= ?) OR (status = ? AND updated_at <= ?) '
+                    'ORDER BY created_at LIMIT ?',
+                    (EmailQueueStatus.PENDING, now, EmailQueueStatus.PROCESSING, now - processing_timeout,
+                     max_size)).fetchall()
+                connection.executemany(
+                    'UPDATE email_message SET status = ?, updated_at = ? WHERE id = ?',
+                    [(EmailQueueStatus.PROCESSING, now, row['id']) for row in rows])
+                connection.execute('COMMIT')
+            except Exception:  # noqa: B902
+                connection.execute('ROLLBACK')
+                raise
+        return [{'id': row['id'], 'payload': json.loads(row['payload']), 'attempts': row['attempts']}
+                for row in rows]
+
+    def mark_sent(self, message_id: str):
+        """Record the successful delivery of an email."""
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE email_message SET status = ?, attempts = attempts + 1, last_error = NULL, updated_at = ? '
+                'WHERE id = ?',
+                (EmailQueueStatus.SENT, time.time(), message_id))
+
+    def mark_failed(self, message: Dict, error: str, max_attempts: int, retry_delay: int):
+        """Record a failed attempt; retry later with an exponential backoff, or dead-letter the email."""
+        attempts = message['attempts'] + 1
+        status = EmailQueueStatus.DEAD_LETTER if attempts >= max_attempts else EmailQueueStatus.PENDING
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE email_message SET status = ?, attempts = ?, last_error = ?, next_attempt_at = ?, '
+                'updated_at = ? WHERE id = ?',
+                (status, attempts, error, now + retry_delay * 2 ** (attempts - 1), now, message['id']))
+
+
+class EmailQueueWorker:
+    """Background thread which delivers the queued emails with a pool of workers."""
+
+    def __init__(self, app, email_queue: EmailQueue):
+        """Read the delivery settings from the app configuration."""
+        self._app = app
+        self._queue = email_queue
+        self._max_workers = app.config['EMAIL_QUEUE_MAX_WORKERS']
+        self._max_attempts = app.config['EMAIL_QUEUE_MAX_ATTEMPTS']
+        self._retry_delay = app.config['EMAIL_QUEUE_RETRY_DELAY']
+        self._poll_interval = app.config['EMAIL_QUEUE_POLL_INTERVAL']
+        self._processing_timeout = app.config['EMAIL_QUEUE_PROCESSING_TIMEOUT']
+        self._wake_up = threading.Event()
+
+    def start(self):
+        """Start delivering in a daemon thread."""
+        threading.Thread(target=self._run, name='email-queue-worker', daemon=True).start()
+
+    def notify(self):
+        """Wake the worker up so that a newly queued email is sent without waiting for the next poll."""
+        self._wake_up.set()
+
+    def _run(self):
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while True:
+                try:
+                    delivered = self.deliver_due(executor)
+                except Exception as e:  # noqa: B902
+                    self._app.logger.error(f'<Email queue delivery failed: {e}')
+                    delivered = 0
+                if not delivered:
+                    self._wake_up.wait(self._poll_interval)
+                    self._wake_up.clear()
+
+    def deliver_due(self, executor: ThreadPoolExecutor) -> int:
+        """Send a batch of due emails and record the outcome of each of them; return the batch size."""
+        messages = self._queue.claim_due(self._max_workers * 2, self._processing_timeout)
+        futures = [(message, executor.submit(get_email_service().dispatch, message['payload']))
+                   for message in messages]
+        for message, future in futures:
+            if error := future.exception():
+                self._app.logger.error(f'<Delivery of email {message["id"]} failed: {error}')
+                self._queue.mark_failed(message, str(error), self._max_attempts, self._retry_delay)
+            else:
+                self._queue.mark_sent(message['id'])
+        return len(messages)
+
+
+def init_app(app):
+    """Open the email queue and start its delivery worker when the async mode is enabled."""
+    if not app.config['EMAIL_ASYNC_MODE']:
+        return
+    if not app.config['EMAIL_QUEUE_DB_PATH']:
+        # a queue in the temporary directory of the container would lose the accepted emails on a restart
+        raise ValueError('EMAIL_QUEUE_DB_PATH must point at a persistent volume when EMAIL_ASYNC_MODE is enabled.')
+    email_queue = EmailQueue(app.config['EMAIL_QUEUE_DB_PATH'])
+    worker = EmailQueueWorker(app, email_queue)
+    app.extensions['email_queue'] = email_queue
+    app.extensions['email_queue_worker'] = worker
+    if not app.config['TESTING']:
+        worker.start()
+
+
+def queue_email(email_payload: Dict) -> str:
+    """Queue the email for the background worker and return its message id."""
+    message_id = current_app.extensions['email_queue'].enqueue(email_payload)
+    current_app.extensions['email_queue_worker'].notify()
+    return message_id
+
+
+def get_email_status(message_id: str) -> Optional[Dict]:
+    """Return the delivery state of a queued email."""
+    return current_app.extensions['email_queue'].get_status(message_id)
+
+
+def get_queue_depth() -> Optional[Dict[str, int]]:
+    """Return the number of queued emails in each state, or None when the async mode is disabled."""
+    if 'email_queue' not in current_app.extensions:
+        return None
+    return current_app.extensions['email_queue'].count_by_status()
+
+
+def _isoformat(timestamp: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
@@ -0,0 +1,66 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the email dispatch rate limiting.
+
+Test-Suite to ensure that the token bucket holds the send rate to its limit.
+"""
+import time
+
+from notify_api.services.email.dispatcher import DispatchMetrics, TokenBucket
+
+
+def test_token_bucket_limits_rate():
+    """Assert that tokens beyond the capacity are handed out at the configured rate."""
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    started = time.monotonic()
+    for _ in range(7):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # two tokens are available at once, the other five are refilled at 50 per second
+    assert elapsed >= 5 / 50 * 0.9
+    assert bucket.waiting == 0
+
+
+def test_token_bucket_burst_within_capacity():
+    """Assert that a full bucket serves a burst up to its capacity without waiting."""
+    bucket = TokenBucket(rate=1, capacity=5)
+
+    started = time.monotonic()
+    bucket.acquire(5)
+    assert time.monotonic() - started < 0.5
+
+
+def test_token_bucket_disabled():
+    """Assert that a rate of zero does not limit the sends."""
+    bucket = TokenBucket(rate=0, capacity=1)
+
+    started = time.monotonic()
+    for _ in range(100):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.5
+
+
+def test_dispatch_metrics():
+    """Assert that the sent and failed emails are counted."""
+    metrics = DispatchMetrics()
+    metrics.record(sent=True, count=3)
+    metrics.record(sent=False)
+
+    counters = metrics.as_dict()
+    assert counters['sent'] == 3
+    assert counters['failed'] == 1
+    assert counters['send_rate'] == 0.05
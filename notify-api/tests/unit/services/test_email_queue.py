@@ -0,0 +1,145 @@
+# Copyright © 2019 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the SQLite backed email queue.
+
+Test-Suite to ensure that queued emails are claimed, retried and dead-lettered as expected.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask import Flask
+
+from notify_api.services.email import email_queue as email_queue_module
+from notify_api.services.email.email_queue import EmailQueue, EmailQueueStatus, EmailQueueWorker
+
+
+EMAIL_PAYLOAD = {'to': 'user@example.com', 'subject': 'Subject', 'body': 'Body'}
+
+
+@pytest.fixture
+def email_queue(tmp_path):
+    """Return a queue backed by a temporary SQLite database."""
+    return EmailQueue(str(tmp_path / 'email_queue.db'))
+
+
+def _app(**config):
+    app = Flask(__name__)
+    app.config.update({
+        'TESTING': True,
+        'EMAIL_ASYNC_MODE': True,
+        'EMAIL_QUEUE_DB_PATH': '',
+        'EMAIL_QUEUE_MAX_WORKERS': 2,
+        'EMAIL_QUEUE_MAX_ATTEMPTS': 2,
+        'EMAIL_QUEUE_RETRY_DELAY': 0,
+        'EMAIL_QUEUE_POLL_INTERVAL': 1,
+        'EMAIL_QUEUE_PROCESSING_TIMEOUT': 300,
+        **config,
+    })
+    return app
+
+
+def test_enqueue_claim_and_mark_sent(email_queue):
+    """Assert that a queued email is claimed once and recorded as sent."""
+    message_id = email_queue.enqueue(EMAIL_PAYLOAD)
+    assert email_queue.get_status(message_id)['status'] == EmailQueueStatus.PENDING
+
+    messages = email_queue.claim_due(max_size=10, processing_timeout=300)
+    assert [message['id'] for message in messages] == [message_id]
+    assert messages[0]['payload'] == EMAIL_PAYLOAD
+    assert email_queue.get_status(message_id)['status'] == EmailQueueStatus.PROCESSING
+    # a claimed email is not handed out again while it is being processed
+    assert email_queue.claim_due(max_size=10, processing_timeout=300) == []
+
+    email_queue.mark_sent(message_id)
+    status = email_queue.get_status(message_id)
+    assert status['status'] == EmailQueueStatus.SENT
+    assert status['attempts'] == 1
+    assert email_queue.count_by_status() == {EmailQueueStatus.SENT: 1}
+
+
+def test_claim_due_respects_max_size(email_queue):
+    """Assert that no more than the requested number of emails are claimed."""
+    for _ in range(3):
+        email_queue.enqueue(EMAIL_PAYLOAD)
+
+    assert len(email_queue.claim_due(max_size=2, processing_timeout=300)) == 2
+    assert len(email_queue.claim_due(max_size=2, processing_timeout=300)) == 1
+
+
+def test_claim_due_reclaims_stale_processing(email_queue):
+    """Assert that an email left processing past the timeout is claimed again."""
+    message_id = email_queue.enqueue(EMAIL_PAYLOAD)
+    email_queue.claim_due(max_size=10, processing_timeout=300)
+
+    messages = email_queue.claim_due(max_size=10, processing_timeout=-1)
+    assert [message['id'] for message in messages] == [message_id]
+
+
+def test_mark_failed_retries_then_dead_letters(email_queue):
+    """Assert that a failed email is retried with a backoff and dead-lettered after the last attempt."""
+    message_id = email_queue.enqueue(EMAIL_PAYLOAD)
+
+    message = email_queue.claim_due(max_size=10, processing_timeout=300)[0]
+    email_queue.mark_failed(message, 'timeout', max_attempts=2, retry_delay=3600)
+    status = email_queue.get_status(message_id)
+    assert status['status'] == EmailQueueStatus.PENDING
+    assert status['attempts'] == 1
+    assert status['last_error'] == 'timeout'
+    # the retry is not due before the backoff has elapsed
+    assert email_queue.claim_due(max_size=10, processing_timeout=300) == []
+
+    email_queue.mark_failed({**message, 'attempts': 1}, 'timeout again', max_attempts=2, retry_delay=0)
+    status = email_queue.get_status(message_id)
+    assert status['status'] == EmailQueueStatus.DEAD_LETTER
+    assert status['attempts'] == 2
+    assert status['last_error'] == 'timeout again'
+    assert email_queue.claim_due(max_size=10, processing_timeout=300) == []
+
+
+def test_worker_delivers_due_emails(email_queue, monkeypatch):
+    """Assert that the worker records the outcome of every email it dispatches."""
+    class _EmailService:  # pylint: disable=too-few-public-methods
+        @staticmethod
+        def dispatch(payload):
+            if payload['to'] == 'bounce@example.com':
+                raise ConnectionError('connection refused')
+
+    monkeypatch.setattr(email_queue_module, 'get_email_service', _EmailService)
+    sent_id = email_queue.enqueue(EMAIL_PAYLOAD)
+    failed_id = email_queue.enqueue({**EMAIL_PAYLOAD, 'to': 'bounce@example.com'})
+    worker = EmailQueueWorker(_app(), email_queue)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert worker.deliver_due(executor) == 2
+
+    assert email_queue.get_status(sent_id)['status'] == EmailQueueStatus.SENT
+    failed = email_queue.get_status(failed_id)
+    assert failed['status'] == EmailQueueStatus.PENDING
+    assert failed['last_error'] == 'connection refused'
+
+
+def test_init_app_requires_db_path():
+    """Assert that the async mode cannot be enabled without a queue database."""
+    with pytest.raises(ValueError):
+        email_queue_module.init_app(_app(EMAIL_QUEUE_DB_PATH=''))
+
+
+def test_init_app_opens_queue(tmp_path):
+    """Assert that the queue and its worker are registered on the app."""
+    app = _app(EMAIL_QUEUE_DB_PATH=str(tmp_path / 'email_queue.db'))
+    email_queue_module.init_app(app)
+
+    assert isinstance(app.extensions['email_queue'], EmailQueue)
+    assert isinstance(app.extensions['email_queue_worker'], EmailQueueWorker)